@@ -2,4 +2,13 @@
 APP_CONFIG = {
     "voice_recognition_timeout": 5,
     "default_browser": "google-chrome",  # Adjust based on OS
+    "stt_backend": "google",  # "google" (online) or "vosk" (offline, streams partial results)
+    "voice_session_ttl": 300,  # Seconds a verified speaker can give commands without re-verifying
+    "verification_min_seconds": 0.8,  # Speech needed before verification may decide early
+    "verification_max_seconds": 5,
+    "wake_word": "asvatha",
+    "wake_word_templates": "Core/VoiceRecognition/profiles/wake_word.npz",  # Recorded with wake_word.py
+    "wake_word_threshold": None,  # None uses the threshold calibrated from the recorded examples
+    "require_voice_verification": False,  # Check enrolled speakers before running commands
+    "vosk_model_path": "Assets/models/vosk-model-small-en-us-0.15",
 }
@@ -46,6 +46,13 @@ app_mappings = {
     "control panel": "control.exe",
 }
 
+def raise_on_error(result):
+    """Raise a SystemCommands error message instead of returning it, so callers see the failure."""
+    if isinstance(result, str) and result.startswith(("Error", "Command error")):
+        raise RuntimeError(result)
+    return result
+
+
 class CommandExecutor:
     def __init__(self):
         self.system_commands = SystemCommands()
@@ -62,7 +69,7 @@ class CommandExecutor:
         # self.parser.register_command("logoff", self.logoff_system)
         self.parser.register_command("move", self.move_file)
         self.parser.register_command("rename", self.rename_file)
-        self.parser.register_command("delete", self.delete_file)
+        self.parser.register_command("delete_command", self.delete_file)
         self.parser.register_command("change_volume", self.change_volume)
         self.parser.register_command("mute_volume", self.mute_volume)
         self.parser.register_command("change_brightness", self.change_brightness)
@@ -73,17 +80,24 @@ class CommandExecutor:
         self.parser.register_command("copy_to_clipboard", self.copy_to_clipboard)
         self.parser.register_command("get_clipboard_text", self.get_clipboard_text)
         self.parser.register_command("zip_files", self.zip_files)
-        self.parser.register_command("download_file", self.download_file)
+        self.parser.register_command("download", self.download_file)
         self.parser.register_command("system_command", self.execute_system_command)
+        # Known application names let the parser correct misheard targets ("crome" -> "chrome")
+        self.parser.register_targets(app_mappings)
 
     def execute(self, command):
-        """Main method to execute the command."""
-        self.parser.parse(command)  # This will automatically route to the appropriate handler
+        """Main method to execute the command; returns the handler's result."""
+        return self.parser.parse(command)  # This will automatically route to the appropriate handler
+
+    def dispatch(self, intent):
+        """Execute an already resolved Intent without parsing the command again."""
+        return self.parser.dispatch(intent)
 
     def execute_system_command(self, command):
         """ Executes system-level commands like shutdown or restart. """
-        result = SystemCommands.execute_system_command(command)
-        print(result) # This will automatically route to the appropriate handler
+        result = self.system_commands.execute_system_command(command)
+        print(result)
+        return raise_on_error(result)
 
     def open_application(self, target):
         """Opens an application based on the given parameters."""
@@ -96,12 +110,13 @@ class CommandExecutor:
             try:
                 subprocess.run([app_path], check=True)
                 print(f"Successfully opened {app_name}")
+                return f"Opened {app_name}"
             except Exception as e:
                 print(f"Failed to open {app_name}: {e}")
-                self.open_with_search(target)
+                return self.open_with_search(target)
         else:
             # If not found in predefined mappings, try searching via taskbar search
-            self.open_with_search(target)
+            return self.open_with_search(target)
 
     def open_with_search(self, query):
         """Simulate opening the taskbar search and typing the query."""
@@ -111,6 +126,7 @@ class CommandExecutor:
         time.sleep(0.5)
         pyautogui.press('enter')
         print(f"Opening {query} via taskbar search.")
+        return f"Opened {query} via taskbar search"
 
     def close_application(self, target):
         """Closes the specified application."""
@@ -129,121 +145,124 @@ class CommandExecutor:
                     proc.terminate()  # Attempt to terminate the process
                     proc.wait()  # Wait for process to terminate
                     print(f"Successfully closed application: {proc.info['name']}")
-                    return
+                    return f"Closed {proc.info['name']}"
 
-            print(f"Application '{app_name}' not found or could not be closed.")
+            result = f"Application '{app_name}' not found or could not be closed."
         
         except psutil.NoSuchProcess:
-            print(f"Error: Process not found.")
+            result = f"Error: Process not found."
         except psutil.AccessDenied:
-            print(f"Error: Access denied when trying to close '{app_name}'.")
+            result = f"Error: Access denied when trying to close '{app_name}'."
         except Exception as e:
-            print(f"Error: {str(e)}")
+            result = f"Error: {str(e)}"
+        print(result)
+        raise RuntimeError(result)
 
     def shutdown_system(self, target):
         """Shuts down the system."""
         print("Shutting down system...")
         os.system("shutdown /s /f /t 0")
+        return "System shutting down."
 
     def restart_system(self, target):
         """Restarts the system."""
         print("Restarting system...")
         os.system("shutdown /r /f /t 0")
+        return "System restarting."
 
-    def move_file(self, command):
-        """Moves a file from one location to another."""
-        parameters = command.split(" to ")
-        if len(parameters) == 2:
-            source_path, destination_path = parameters
-            print(f"Moving file from {source_path} to {destination_path}")
-            try:
-                os.rename(source_path, os.path.join(destination_path, os.path.basename(source_path)))
-                print(f"Successfully moved the file to {destination_path}")
-            except Exception as e:
-                print(f"Failed to move file: {e}")
-        else:
-            print("Invalid file move command format.")
-
-    def rename_file(self, command):
-        """Renames a file."""
-        parameters = command.split(" to ")
-        if len(parameters) == 2:
-            source_path, new_name = parameters
-            print(f"Renaming file: {source_path} to {new_name}")
-            try:
-                os.rename(source_path, os.path.join(os.path.dirname(source_path), new_name))
-                print(f"Successfully renamed file to {new_name}")
-            except Exception as e:
-                print(f"Failed to rename file: {e}")
-        else:
-            print("Invalid file rename command format.")
-
-    def delete_file(self, command):
-        """Deletes a file or folder."""
-        path = command.strip()  # Extract the path from the command
+    def move_file(self, paths):
+        """Moves a file from one location to another, given a (source, destination) slot."""
+        source_path, destination_path = paths
+        print(f"Moving file from {source_path} to {destination_path}")
+        try:
+            os.rename(source_path, os.path.join(destination_path, os.path.basename(source_path)))
+        except Exception as e:
+            print(f"Failed to move file: {e}")
+            raise
+        result = f"Successfully moved the file to {destination_path}"
+        print(result)
+        return result
+
+    def rename_file(self, paths):
+        """Renames a file, given a (source, new name) slot."""
+        source_path, new_name = paths
+        print(f"Renaming file: {source_path} to {new_name}")
+        try:
+            os.rename(source_path, os.path.join(os.path.dirname(source_path), new_name))
+        except Exception as e:
+            print(f"Failed to rename file: {e}")
+            raise
+        result = f"Successfully renamed file to {new_name}"
+        print(result)
+        return result
+
+    def delete_file(self, path):
+        """Deletes a file or folder; raises if it is still there afterwards."""
         print(f"Attempting to delete: {path}")
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Path {path} does not exist.")
         # Use the delete_command method from SystemCommands class
-        SystemCommands.delete_command(path)
+        result = SystemCommands.delete_command(path)
+        if os.path.exists(path):
+            raise RuntimeError(result)
+        return result
 
     # Adding methods that call the corresponding SystemCommands functions
 
-    def change_volume(self, target):
-        try:
-            # Extract the volume level as an integer
-            volume_level = int(target)
-            print(f"Changing volume to {volume_level}%")
-            # Call the appropriate system function to change the volume
-            SystemCommands.change_volume(volume_level)
-        except ValueError:
-            print(f"Invalid volume level: {target}. Please provide a valid number.")
+    def change_volume(self, volume_level):
+        """Change the system volume to an integer level (0-100)."""
+        print(f"Changing volume to {volume_level}%")
+        # Call the appropriate system function to change the volume
+        return raise_on_error(SystemCommands.change_volume(volume_level))
 
 
     def mute_volume(command):
         """Mute the system volume."""
         print("Muting the volume.")
-        SystemCommands.mute_volume()
+        return raise_on_error(SystemCommands.mute_volume())
 
-    def change_brightness(self, command):
-        """Change screen brightness."""
-        level = int(command.strip())
+    def change_brightness(self, level):
+        """Change screen brightness to an integer level (0-100)."""
         print(f"Changing brightness to {level}%")
-        SystemCommands.change_brightness(level)
+        return raise_on_error(SystemCommands.change_brightness(level))
 
-    def change_resolution(self, command):
-        """Change screen resolution."""
-        resolution = command.strip()
-        print(f"Changing resolution to {resolution}")
-        SystemCommands.change_resolution(resolution)
+    def change_resolution(self, resolution):
+        """Change screen resolution, given a (width, height) slot."""
+        width, height = resolution
+        print(f"Changing resolution to {width}x{height}")
+        return raise_on_error(self.system_commands.change_resolution(width, height))
     
     def take_screenshot(self):
         """Take a screenshot."""
         print("Taking screenshot.")
-        SystemCommands.take_screenshot(self)
+        return SystemCommands.take_screenshot(self)
 
     def list_installed_apps(self):
         """List installed applications."""
         print("Listing installed applications.")
         apps = self.system_commands.list_installed_apps()
         print(apps)
+        return raise_on_error(apps)
         # SystemCommands.list_installed_apps(command)
 
     def run_custom_command(self, command):
         """Run a custom system command."""
         print(f"Running custom command: {command}")
-        SystemCommands.run_custom_command(command)
+        return raise_on_error(self.system_commands.run_custom_command(command))
 
-    def copy_to_clipboard(self, command):
+    def copy_to_clipboard(self, text):
         """Copy text to clipboard."""
-        text = command.strip()
         print(f"Copying text to clipboard: {text}")
         apps = self.system_commands.copy_to_clipboard(text)
         print(apps)
+        return raise_on_error(apps)
 
     def get_clipboard_text(self):
         """Get text from clipboard."""
         print("Getting clipboard text.")
         apps = self.system_commands.get_clipboard_text()
         print(apps)
+        return raise_on_error(apps)
         # SystemCommands.get_clipboard_text(command)
 
     def zip_files(self, command):
@@ -251,12 +270,14 @@ class CommandExecutor:
         print(f"Zipping files: {command}")
         apps = self.system_commands.zip_files(command)
         print(apps)
+        return raise_on_error(apps)
 
-    def download_file(self, command):
-        """Download a file."""
-        url = command.strip()
+    def download_file(self, url):
+        """Download a file and return the saved path; raises if the download fails."""
         print(f"Downloading file from: {url}")
-        SystemCommands.download_file(url)
+        save_path = self.system_commands.fetch_file(url)
+        print(f"File downloaded successfully to {save_path}.")
+        return save_path
 
     def handle_screenshot_task():
         """
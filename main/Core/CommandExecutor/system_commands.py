@@ -101,11 +101,10 @@ class SystemCommands:
         except Exception as e:
             return f"Error adjusting brightness: {e}"
     
-    def change_resolution(self, resolution):
-        """ Change the screen resolution. """
+    def change_resolution(self, width, height):
+        """ Change the screen resolution to width x height pixels. """
         try:
             if platform.system() == "Windows":
-                width, height = map(int, resolution.split('x'))
                 subprocess.run(["QRes.exe", f"/x:{width}", f"/y:{height}"], check=True)
                 return f"Resolution set to {width}x{height}"
             else:
@@ -220,19 +219,27 @@ class SystemCommands:
                 # Attempt deletion with admin rights
                 admin_result = delete_with_admin(path)
                 print(admin_result)
+                return admin_result
             else:
                 print("File/folder not deleted.")
+                return "File/folder not deleted."
+        return result
+
+    def fetch_file(self, url):
+        """ Download a file from a URL into the downloads directory and return its path. Raises on failure. """
+        file_name = url.split("/")[-1]
+        save_path = os.path.join(self.download_dir, file_name)
+        response = requests.get(url, stream=True)
+        response.raise_for_status()  # Raise an exception for HTTP errors
+        with open(save_path, 'wb') as file:
+            for chunk in response.iter_content(chunk_size=8192):
+                file.write(chunk)
+        return save_path
 
     def download_file(self, url):
         """ Download a file from a URL and save it in the downloads directory. """
         try:
-            file_name = url.split("/")[-1]
-            save_path = os.path.join(self.download_dir, file_name)
-            response = requests.get(url, stream=True)
-            response.raise_for_status()  # Raise an exception for HTTP errors
-            with open(save_path, 'wb') as file:
-                for chunk in response.iter_content(chunk_size=8192):
-                    file.write(chunk)
+            save_path = self.fetch_file(url)
             return f"File downloaded successfully to {save_path}."
         except Exception as e:
             return f"Error downloading file: {e}"
@@ -0,0 +1,165 @@
+import asyncio
+import itertools
+import logging
+import time
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+
+from Core.TaskManagement.task_queue import task_priority
+
+
+class TaskResult:
+    """
+    Outcome of a task run by AsyncTaskQueue.
+
+    Attributes:
+    - task: The submitted task.
+    - result: What the task or handler returned, or None if it failed.
+    - error (Exception): The exception the task raised, or None.
+    - timings (dict): Seconds spent "queued", in "run" and in "total".
+    """
+
+    def __init__(self, task, result=None, error=None, timings=None):
+        self.task = task
+        self.result = result
+        self.error = error
+        self.timings = timings if timings is not None else {}
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        outcome = f"error={self.error!r}" if self.error else f"result={self.result!r}"
+        return f"TaskResult({self.task!r}, {outcome})"
+
+
+class AsyncTaskQueue:
+    """
+    asyncio front end to task execution: submit returns a future of the task's TaskResult.
+
+    Tasks run in priority order (see task_priority) on a fixed number of worker
+    coroutines. Coroutine functions are awaited on the event loop; blocking
+    callables, and task dicts or Intents passed to handler, run in a thread
+    pool so they never stall the loop. Callers can await many completions
+    concurrently instead of polling the queue or reading printed output.
+
+    Usage:
+        async with AsyncTaskQueue(handler=executor.dispatch) as queue:
+            outcome = await queue.submit(intent)
+    """
+
+    def __init__(self, handler=None, workers=4, executor=None):
+        self.handler = handler  # Runs tasks that are not callables (e.g. task dicts, Intents)
+        self.workers = workers
+        self.executor = executor
+        self.owns_executor = executor is None
+        self.counter = itertools.count()
+        self.loop = None
+        self.queue = None
+        self.worker_tasks = []
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def start(self):
+        """
+        Start the workers on the running event loop. Called by submit if needed.
+        """
+        if self.worker_tasks:
+            return
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.PriorityQueue()
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="async-task")
+        self.worker_tasks = [self.loop.create_task(self._work()) for _ in range(self.workers)]
+
+    def submit(self, task, priority=None):
+        """
+        Queue a task and return an asyncio future resolving to its TaskResult.
+
+        Must be called from the event loop. Failures are reported in the
+        TaskResult rather than raised. Cancelling the future before the task
+        starts skips it; a blocking task already running in a thread finishes
+        but its result is dropped.
+        """
+        self.start()
+        future = self.loop.create_future()
+        if isinstance(task, dict) and (not task.get("action") or not task.get("target")):
+            future.set_result(TaskResult(task, error=ValueError("Task must include both 'action' and 'target'.")))
+            return future
+        priority = task_priority(task) if priority is None else priority
+        self.queue.put_nowait((priority, next(self.counter), task, future, time.perf_counter()))
+        return future
+
+    def submit_threadsafe(self, task, priority=None):
+        """
+        Queue a task from another thread (e.g. the voice loop) once the queue has started.
+
+        Returns a concurrent.futures.Future of the TaskResult.
+        """
+        if self.loop is None:
+            raise RuntimeError("AsyncTaskQueue has not been started on an event loop.")
+
+        async def submit_and_wait():
+            return await self.submit(task, priority)
+
+        return asyncio.run_coroutine_threadsafe(submit_and_wait(), self.loop)
+
+    async def join(self):
+        """
+        Wait until every queued task has finished.
+        """
+        if self.queue is not None:
+            await self.queue.join()
+
+    async def close(self):
+        """
+        Finish the queued tasks, then stop the workers.
+        """
+        await self.join()
+        for worker in self.worker_tasks:
+            worker.cancel()
+        await asyncio.gather(*self.worker_tasks, return_exceptions=True)
+        self.worker_tasks = []
+        if self.owns_executor and self.executor is not None:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+
+    async def _run(self, task):
+        if asyncio.iscoroutinefunction(task):
+            return await task()
+        if callable(task):
+            return await self.loop.run_in_executor(self.executor, task)
+        if self.handler is None:
+            raise ValueError(f"No handler for task {task}")
+        return await self.loop.run_in_executor(self.executor, self.handler, task)
+
+    async def _work(self):
+        while True:
+            _, _, task, future, submitted = await self.queue.get()
+            try:
+                if future.cancelled():
+                    continue
+                started = time.perf_counter()
+                result, error = None, None
+                try:
+                    result = await self._run(task)
+                except Exception as e:
+                    logging.error(f"Task {task} failed: {e}")
+                    error = e
+                finished = time.perf_counter()
+                if not future.done():
+                    future.set_result(TaskResult(task, result, error, {
+                        "queued": started - submitted,
+                        "run": finished - started,
+                        "total": finished - submitted,
+                    }))
+            finally:
+                self.queue.task_done()
@@ -0,0 +1,158 @@
+import logging
+import threading
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+
+from Core.TaskManagement.task_queue import TaskQueue, task_priority
+
+# Worker threads per lane. Device and GUI actions are serialized; bulk I/O gets its own lanes
+LANES = {
+    "network": 4,
+    "filesystem": 2,
+    "device": 1,
+    "gui": 1,
+    "system": 1,
+}
+
+# Lane of each parser action; anything else runs in DEFAULT_LANE
+ACTION_LANES = {
+    "download": "network",
+    "move": "filesystem",
+    "rename": "filesystem",
+    "delete_command": "filesystem",
+    "zip_files": "filesystem",
+    "change_volume": "device",
+    "mute_volume": "device",
+    "change_brightness": "device",
+    "change_resolution": "device",
+    "open": "gui",
+    "close": "gui",
+    "take_screenshot": "gui",
+    "copy_to_clipboard": "gui",
+    "get_clipboard_text": "gui",
+    "shutdown": "system",
+    "restart": "system",
+    "run_custom_command": "system",
+    "system_command": "system",
+    "list_installed_apps": "system",
+}
+DEFAULT_LANE = "system"
+
+
+class _Stop:
+    """Queued once per worker to shut it down."""
+
+    def __repr__(self):
+        return "stop worker"
+
+
+_STOP = _Stop()
+
+
+class LaneExecutor:
+    """
+    Run tasks on per-resource lanes, each with its own TaskQueue and worker threads.
+
+    A multi-minute download occupies a network worker while a volume change
+    goes straight to the idle device lane, so fast commands never wait behind
+    bulk I/O. Lanes with one worker (device, GUI, system) run their tasks
+    strictly in order. Within a lane, urgent tasks still go first.
+    """
+
+    def __init__(self, lanes=None, action_lanes=None, handler=None, debounce=None):
+        self.lanes = dict(LANES if lanes is None else lanes)
+        self.action_lanes = ACTION_LANES if action_lanes is None else action_lanes
+        self.handler = handler  # Runs tasks that are not callables (e.g. task dicts)
+        # Tasks that will never run (cancelled, coalesced, deduplicated) count as finished
+        self.queues = {lane: TaskQueue(debounce=debounce, on_skip=lambda handle: self._finished())
+                       for lane in self.lanes}
+        self.pending = 0  # Submitted tasks that have not finished or been skipped yet
+        self.idle = threading.Condition()
+        self.workers = []
+        for lane, count in self.lanes.items():
+            for i in range(count):
+                worker = threading.Thread(target=self._work, args=(lane,), name=f"lane-{lane}-{i}", daemon=True)
+                worker.start()
+                self.workers.append(worker)
+
+    def lane_for(self, task):
+        """
+        Lane of a task dict or Intent, from its action.
+        """
+        action = task.get("action") if isinstance(task, dict) else getattr(task, "action", None)
+        lane = self.action_lanes.get(action, DEFAULT_LANE)
+        return lane if lane in self.queues else DEFAULT_LANE
+
+    def submit(self, task, lane=None, priority=None):
+        """
+        Queue a task on its lane and return the TaskHandle (usable with cancel).
+
+        lane defaults to the lane of the task's action; pass it explicitly for callables.
+        """
+        lane = lane or self.lane_for(task)
+        with self.idle:
+            self.pending += 1
+        handle = self.queues[lane].add_task(task, task_priority(task) if priority is None else priority)
+        if handle is None:
+            self._finished()  # Rejected by validation
+        return handle
+
+    def cancel(self, handle):
+        """
+        Cancel a task that has not started yet. Returns False if it already started.
+        """
+        return handle.queue.cancel_task(handle)
+
+    def skipped(self):
+        """
+        Work skipped across all lanes, by reason (see TaskQueue.skipped).
+        """
+        totals = {}
+        for queue in self.queues.values():
+            for reason, count in queue.skipped.items():
+                totals[reason] = totals.get(reason, 0) + count
+        return totals
+
+    def wait_idle(self, timeout=None):
+        """
+        Block until every submitted task has finished. Returns False on timeout.
+        """
+        with self.idle:
+            return self.idle.wait_for(lambda: self.pending == 0, timeout)
+
+    def shutdown(self, wait=True):
+        """
+        Stop the workers once the tasks already queued, including debounced ones, have run.
+        """
+        for lane, count in self.lanes.items():
+            # Debounced tasks would otherwise still be waiting when the workers take their stop sentinel
+            self.queues[lane].release_delayed()
+            for _ in range(count):
+                self.queues[lane].add_task(_STOP, priority=float("inf"))
+        if wait:
+            for worker in self.workers:
+                worker.join()
+
+    def _work(self, lane):
+        queue = self.queues[lane]
+        while True:
+            task = queue.pop(timeout=None)
+            if task is _STOP:
+                return
+            try:
+                if callable(task):
+                    task()
+                elif self.handler:
+                    self.handler(task)
+                else:
+                    logging.error(f"No handler for task {task} on lane '{lane}'")
+            except Exception as e:
+                logging.error(f"Task {task} failed on lane '{lane}': {e}")
+            finally:
+                self._finished()
+
+    def _finished(self):
+        with self.idle:
+            self.pending -= 1
+            self.idle.notify_all()
@@ -36,15 +36,16 @@ def execute_task(task):
         logging.error(f"Error executing task: {e}")
 
 
-# Test cases
-task_1 = {"action": "open", "target": "notepad"}
-execute_task(task_1)
+if __name__ == "__main__":
+    # Test cases; run only when executed directly, never on import
+    task_1 = {"action": "open", "target": "notepad"}
+    execute_task(task_1)
 
-# task_2 = {"action": "shutdown", "target": None}
-# execute_task(task_2)
+    # task_2 = {"action": "shutdown", "target": None}
+    # execute_task(task_2)
 
-task_3 = {"action": "invalid_action", "target": "unknown"}
-execute_task(task_3)
+    task_3 = {"action": "invalid_action", "target": "unknown"}
+    execute_task(task_3)
 
-# task_4 = {"action": "restart", "target": None}
-# execute_task(task_4)
+    # task_4 = {"action": "restart", "target": None}
+    # execute_task(task_4)
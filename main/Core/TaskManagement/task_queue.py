@@ -1,44 +1,299 @@
-import queue
+import heapq
+import itertools
+import threading
+import time
+
+# Priorities: lower values run first
+URGENT = 0
+NORMAL = 10
+BULK = 20
+
+# Commands that jump ahead of queued work, and slow bulk work that can wait
+ACTION_PRIORITIES = {
+    "stop": URGENT,
+    "cancel": URGENT,
+    "mute": URGENT,
+    "mute_volume": URGENT,
+    "exit": URGENT,
+    "download": BULK,
+    "zip_files": BULK,
+    "list_installed_apps": BULK,
+}
+
+# Coalescing policies for tasks that pile up while the queue is backed up:
+# LATEST keeps only the newest pending task of an action (idempotent setters),
+# DEDUP drops a task identical to one already pending
+LATEST = "latest"
+DEDUP = "dedup"
+
+COALESCE_POLICIES = {
+    "change_volume": LATEST,
+    "change_brightness": LATEST,
+    "change_resolution": LATEST,
+    "mute_volume": DEDUP,
+    "take_screenshot": DEDUP,
+    "list_installed_apps": DEDUP,
+    "get_clipboard_text": DEDUP,
+}
+
+# Seconds a task of these actions waits for a newer one before it can run (empty: no debounce)
+DEBOUNCE_WINDOWS = {}
+
+QUEUED, TAKEN, CANCELLED = "queued", "taken", "cancelled"
+
+
+def task_action(task):
+    """
+    Action of a task: dict tasks and Intents carry one; for plain command strings the first word is used.
+    """
+    if isinstance(task, dict):
+        return task.get("action")
+    if isinstance(task, str):
+        words = task.lower().split()
+        return words[0] if words else None
+    return getattr(task, "action", None)
+
+
+def task_priority(task):
+    """
+    Default priority of a task, looked up from its action.
+    """
+    return ACTION_PRIORITIES.get(task_action(task), NORMAL)
+
+
+def task_identity(task):
+    """
+    Hashable description of what a task does, so identical tasks compare equal.
+    """
+    if isinstance(task, dict):
+        return (task.get("action"), repr(task.get("target")))
+    if isinstance(task, str):
+        return " ".join(task.lower().split())
+    slots = getattr(task, "slots", None)
+    return (getattr(task, "action", None), repr(slots)) if slots is not None else task
+
+
+class TaskHandle:
+    """
+    Ticket for a queued task; pass it to cancel_task to cancel in O(1).
+    """
+
+    __slots__ = ("priority", "sequence", "task", "state", "queue", "key", "ready_at")
+
+    def __init__(self, priority, sequence, task, queue=None, key=None, ready_at=None):
+        self.priority = priority
+        self.sequence = sequence
+        self.task = task
+        self.state = QUEUED
+        self.queue = queue  # The TaskQueue holding the task
+        self.key = key  # Coalescing key, if the task's action has a policy
+        self.ready_at = ready_at  # time.monotonic() before which a debounced task may not run
+
+    def __lt__(self, other):
+        # Priority first, then arrival order, so equal priorities stay FIFO
+        return (self.priority, self.sequence) < (other.priority, other.sequence)
+
+    def __repr__(self):
+        return f"TaskHandle({self.task!r}, priority={self.priority}, {self.state})"
+
 
 class TaskQueue:
-    def __init__(self):
-        self.queue = queue.Queue()
+    """
+    Thread-safe priority queue of tasks.
+
+    Tasks are kept in a binary heap ordered by (priority, arrival), so adding
+    and taking the next task are O(log n). Cancelling through a handle only
+    marks it as a tombstone in O(1); tombstones are skipped when they reach
+    the top of the heap, and the heap is compacted once they make up most of it.
+
+    Superseded work is coalesced per action (see COALESCE_POLICIES): a newer
+    LATEST task replaces the pending one in its place in the queue, and a DEDUP
+    task identical to a pending one is dropped. Actions with a debounce window
+    are held back until no newer task has arrived for that long, so a burst
+    collapses into its final task. Skipped work is counted in self.skipped,
+    and on_skip is called with the handle of every task that will not run.
+    """
+
+    def __init__(self, policies=None, debounce=None, on_skip=None):
+        self.heap = []
+        self.delayed = []  # (ready_at, sequence, handle) of debounced tasks, earliest first
+        self.counter = itertools.count()
+        self.condition = threading.Condition()
+        self.live = 0  # Queued tasks that are not cancelled
+        self.tombstones = 0
+        self.policies = COALESCE_POLICIES if policies is None else policies
+        self.debounce = DEBOUNCE_WINDOWS if debounce is None else debounce
+        self.on_skip = on_skip
+        self.pending = {}  # Coalescing key -> handle of the queued task with that key
+        self.skipped = {"coalesced": 0, "deduplicated": 0, "cancelled": 0}
+
+    def __len__(self):
+        return self.live
 
-    def add_task(self, task):
+    def empty(self):
+        return self.live == 0
+
+    def add_task(self, task, priority=None):
         """
-        Add a task to the queue after validating it.
+        Add a task to the queue after validating it, and return its handle.
+
+        Tasks are dicts with 'action' and 'target', plain command strings, or callables;
+        only dicts have fields to validate. priority overrides the action's default.
+        A task dropped as a duplicate returns the handle of the pending original.
         """
-        if not task.get("action") or not task.get("target"):
+        if isinstance(task, dict) and (not task.get("action") or not task.get("target")):
             print("Error: Task must include both 'action' and 'target'.")
-            return
-        self.queue.put(task)
-        print(f"Task added: {task}")
+            return None
+        action = task_action(task)
+        policy = self.policies.get(action)
+        window = self.debounce.get(action)
+        priority = task_priority(task) if priority is None else priority
+        key = None
+        if policy == DEDUP:
+            key = (DEDUP, task_identity(task))
+        elif policy == LATEST or window:
+            key = (LATEST, action)
+
+        with self.condition:
+            previous = self.pending.get(key) if key is not None else None
+            if previous is not None and previous.state != QUEUED:
+                previous = None
+            if previous is not None and policy == DEDUP:
+                self.skipped["deduplicated"] += 1
+                skipped = TaskHandle(priority, next(self.counter), task, self, key)
+                skipped.state = CANCELLED
+                handle = previous
+            else:
+                if previous is None:
+                    handle = TaskHandle(priority, next(self.counter), task, self, key)
+                else:
+                    # Take over the superseded task's place in the queue
+                    self.skipped["coalesced"] += 1
+                    handle = TaskHandle(min(priority, previous.priority), previous.sequence, task, self, key)
+                    self._discard(previous)
+                    skipped = previous
+                if key is not None:
+                    self.pending[key] = handle
+                if window:
+                    handle.ready_at = time.monotonic() + window
+                    heapq.heappush(self.delayed, (handle.ready_at, handle.sequence, handle))
+                else:
+                    heapq.heappush(self.heap, handle)
+                self.live += 1
+                self.condition.notify()
+        if previous is not None:
+            print(f"Task skipped: {skipped.task}")
+            if self.on_skip:
+                self.on_skip(skipped)
+        else:
+            print(f"Task added: {task}")
+        return handle
+
+    def pop(self, timeout=0):
+        """
+        Remove and return the next task, waiting up to timeout seconds (None waits forever).
+
+        Returns None if no task arrived in time.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.condition:
+            while True:
+                self._release_due()
+                while self.heap:
+                    handle = heapq.heappop(self.heap)
+                    if handle.state == CANCELLED:
+                        self.tombstones -= 1
+                        continue
+                    handle.state = TAKEN
+                    self.live -= 1
+                    if self.pending.get(handle.key) is handle:
+                        del self.pending[handle.key]
+                    return handle.task
+                # Nothing ready: sleep until a task is added, the next debounced task is due, or the timeout
+                now = time.monotonic()
+                wait = None if deadline is None else deadline - now
+                if self.delayed:
+                    due = self.delayed[0][0] - now
+                    wait = due if wait is None else min(wait, due)
+                if wait is not None and wait <= 0:
+                    return None
+                self.condition.wait(wait)
 
     def process_task(self):
         """
         Process the next task in the queue.
         """
-        if not self.queue.empty():
-            task = self.queue.get()
-            if callable(task):
-                task()  # If task is callable, execute it
-            else:
-                print(f"Executing task: {task}")  # Otherwise, print the task
-            return task
-        else:
+        task = self.pop()
+        if task is None:
             print("No tasks in the queue.")
             return None
+        if callable(task):
+            task()  # If task is callable, execute it
+        else:
+            print(f"Executing task: {task}")  # Otherwise, print the task
+        return task
 
     def cancel_task(self, task):
         """
-        Remove a task from the queue if it exists.
+        Cancel a queued task, given its handle (O(1)) or the task itself (searched for).
+
+        Returns True if a queued task was cancelled.
         """
-        tasks = list(self.queue.queue)  # Convert to a list for easier manipulation
-        if task in tasks:
-            tasks.remove(task)
-            self.queue = queue.Queue()
-            for remaining_task in tasks:
-                self.queue.put(remaining_task)
-            print(f"Task cancelled: {task}")
-        else:
+        with self.condition:
+            if isinstance(task, TaskHandle):
+                handle = task if task.state == QUEUED and task.queue is self else None
+            else:
+                candidates = itertools.chain(self.heap, (entry[2] for entry in self.delayed))
+                handle = next((queued for queued in candidates if queued.state == QUEUED and queued.task == task), None)
+            if handle is not None:
+                self.skipped["cancelled"] += 1
+                self._discard(handle)
+        if handle is None:
             print(f"Task not found: {task}")
+            return False
+        print(f"Task cancelled: {handle.task}")
+        if self.on_skip:
+            self.on_skip(handle)
+        return True
+
+    def release_delayed(self):
+        """
+        End every debounce window now, so the delayed tasks are ready to run (e.g. at shutdown).
+        """
+        with self.condition:
+            for _, _, handle in self.delayed:
+                if handle.state == CANCELLED:
+                    self.tombstones -= 1
+                else:
+                    handle.ready_at = None
+                    heapq.heappush(self.heap, handle)
+            self.delayed = []
+            self.condition.notify_all()
+
+    def _discard(self, handle):
+        # Called with the lock held; turns a queued task into a tombstone
+        handle.state = CANCELLED
+        self.live -= 1
+        self.tombstones += 1
+        if self.pending.get(handle.key) is handle:
+            del self.pending[handle.key]
+        if self.tombstones > 64 and self.tombstones > self.live:
+            self._compact()
+
+    def _release_due(self):
+        # Called with the lock held; moves debounced tasks whose window has passed onto the heap
+        now = time.monotonic()
+        while self.delayed and self.delayed[0][0] <= now:
+            handle = heapq.heappop(self.delayed)[2]
+            if handle.state == CANCELLED:
+                self.tombstones -= 1
+            else:
+                heapq.heappush(self.heap, handle)
+
+    def _compact(self):
+        # Called with the lock held; drops every tombstone in one O(n) pass
+        self.heap = [handle for handle in self.heap if handle.state == QUEUED]
+        heapq.heapify(self.heap)
+        self.delayed = [entry for entry in self.delayed if entry[2].state == QUEUED]
+        heapq.heapify(self.delayed)
+        self.tombstones = 0
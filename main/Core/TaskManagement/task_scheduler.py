@@ -0,0 +1,186 @@
+import copy
+import logging
+import threading
+import time
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+
+from Core.TaskManagement.async_task_queue import TaskResult
+from Core.TaskManagement.lane_executor import LaneExecutor
+from Core.TaskManagement.task_queue import task_priority
+
+
+class StepCancelled(Exception):
+    """Error recorded for a step that never ran because a step it depends on failed."""
+
+
+class Artifact:
+    """
+    Placeholder in a task dict or Intent for the result of an earlier step.
+
+    graph.add("move", {"action": "move", "target": (Artifact("download"), docs)})
+    runs the move with the path returned by the "download" step.
+    """
+
+    def __init__(self, step):
+        self.step = step
+
+    def __repr__(self):
+        return f"Artifact({self.step!r})"
+
+
+def _artifacts(value):
+    # Names of the steps referenced by Artifact placeholders anywhere in value
+    if isinstance(value, Artifact):
+        return [value.step]
+    if isinstance(value, dict):
+        value = value.values()
+    elif not isinstance(value, (list, tuple)):
+        slots = getattr(value, "slots", None)
+        return _artifacts(slots) if isinstance(slots, dict) else []
+    return [step for item in value for step in _artifacts(item)]
+
+
+def _resolve(value, results):
+    # Copy of value with every Artifact replaced by its step's result
+    if isinstance(value, Artifact):
+        return results[value.step].result
+    if isinstance(value, dict):
+        return {key: _resolve(item, results) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(_resolve(item, results) for item in value)
+    if isinstance(getattr(value, "slots", None), dict):
+        value = copy.copy(value)
+        value.slots = _resolve(value.slots, results)
+    return value
+
+
+class TaskGraph:
+    """
+    Multi-step task whose steps depend on each other, e.g. download a file, unzip it, then move it.
+
+    Each step runs on its LaneExecutor lane as soon as every step it depends
+    on has finished, so independent branches run in parallel. A callable step
+    is called with the results of its dependencies, in the order they were
+    listed; task dicts and Intents go to the handler, with Artifact
+    placeholders replaced by the results they name. A step fails when it
+    raises: CommandParser.dispatch raises on an intent it refuses (e.g. a
+    missing slot), and CommandExecutor's handlers raise when the action fails.
+    Every step downstream of a failed step is cancelled while unrelated
+    branches carry on.
+
+    Usage:
+        graph = TaskGraph()
+        graph.add("download", Intent("download", {"target": url}))
+        graph.add("move", Intent("move", {"target": (Artifact("download"), docs)}))
+        results = graph.run(handler=executor.dispatch)
+    """
+
+    def __init__(self):
+        self.steps = {}  # Name -> (task, dependencies, lane)
+        self.dependents = {}  # Name -> names of the steps that depend on it
+
+    def __len__(self):
+        return len(self.steps)
+
+    def add(self, name, task, after=(), lane=None):
+        """
+        Add a step that runs after the named steps (and any steps its Artifacts refer to).
+
+        Dependencies must already be in the graph, which keeps it acyclic.
+        lane defaults to the lane of the task's action. Returns the step name.
+        """
+        if name in self.steps:
+            raise ValueError(f"Step '{name}' is already in the graph.")
+        after = list(after)
+        after += [step for step in _artifacts(task) if step not in after]
+        for step in after:
+            if step not in self.steps:
+                raise ValueError(f"Step '{name}' depends on unknown step '{step}'.")
+        self.steps[name] = (task, tuple(after), lane)
+        self.dependents[name] = []
+        for step in after:
+            self.dependents[step].append(name)
+        return name
+
+    def run(self, lanes=None, handler=None, timeout=None):
+        """
+        Run every step and return {name: TaskResult} once all have finished or been cancelled.
+
+        Without lanes, a LaneExecutor is created for the run and shut down afterwards.
+        handler runs task dicts and Intents (default: the lanes' handler).
+        Raises TimeoutError if the graph does not finish within timeout seconds.
+        """
+        own_lanes = lanes is None
+        if own_lanes:
+            lanes = LaneExecutor(handler=handler)
+        handler = handler or lanes.handler
+        waiting = {name: len(after) for name, (_, after, _) in self.steps.items()}
+        results = {}
+        finished = threading.Condition()
+
+        def submit(name):
+            task, after, lane = self.steps[name]
+            submitted = time.perf_counter()
+
+            def step():
+                started = time.perf_counter()
+                result, error = None, None
+                try:
+                    with finished:
+                        inputs = [results[dependency].result for dependency in after]
+                    if callable(task):
+                        result = task(*inputs)
+                    elif handler is None:
+                        raise ValueError(f"No handler for step '{name}'")
+                    else:
+                        result = handler(_resolve(task, results))
+                except Exception as e:
+                    logging.error(f"Step '{name}' failed: {e}")
+                    error = e
+                done = time.perf_counter()
+                complete(name, TaskResult(task, result, error, {
+                    "queued": started - submitted,
+                    "run": done - started,
+                    "total": done - submitted,
+                }))
+
+            lanes.submit(step, lane=lane or lanes.lane_for(task), priority=task_priority(task))
+
+        def complete(name, outcome):
+            ready = []
+            with finished:
+                results[name] = outcome
+                if outcome.ok:
+                    for dependent in self.dependents[name]:
+                        waiting[dependent] -= 1
+                        if waiting[dependent] == 0 and dependent not in results:
+                            ready.append(dependent)
+                else:
+                    self._cancel_downstream(name, results)
+                finished.notify_all()
+            for dependent in ready:
+                submit(dependent)
+
+        try:
+            for name, count in waiting.items():
+                if count == 0:
+                    submit(name)
+            with finished:
+                if not finished.wait_for(lambda: len(results) == len(self.steps), timeout):
+                    raise TimeoutError(f"Task graph did not finish within {timeout} seconds.")
+                return dict(results)
+        finally:
+            if own_lanes:
+                lanes.shutdown(wait=False)
+
+    def _cancel_downstream(self, failed, results):
+        # Called with the results lock held; none of these steps can have started yet
+        pending = list(self.dependents[failed])
+        while pending:
+            name = pending.pop()
+            if name in results:
+                continue
+            results[name] = TaskResult(self.steps[name][0], error=StepCancelled(f"Step '{failed}' failed."))
+            pending.extend(self.dependents[name])
@@ -0,0 +1,102 @@
+import logging
+import os
+import sys
+import threading
+import numpy as np
+import pyaudio
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+from Core.VoiceRecognition.ring_buffer import AudioRingBuffer
+
+RATE = 16000
+CHUNK = 1024
+CHANNELS = 1
+FORMAT = pyaudio.paInt16
+SAMPLE_WIDTH = 2  # Bytes per int16 sample
+
+
+class AudioInputService:
+    """
+    Long-lived owner of the microphone.
+
+    The input stream is opened once and a PyAudio callback copies every chunk
+    into a preallocated ring buffer. Verification, speech to text and enrollment
+    read from the buffer through their own readers instead of opening and
+    closing the device for every recording.
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, rate=RATE, chunk=CHUNK, buffer_seconds=30):
+        self.rate = rate
+        self.chunk = chunk
+        self.buffer = AudioRingBuffer(rate * buffer_seconds)
+        self.audio = None
+        self.stream = None
+
+    @classmethod
+    def shared(cls):
+        """
+        Return the process-wide service, starting it on first use.
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+                cls._shared.start()
+            return cls._shared
+
+    def start(self):
+        """
+        Open the input device and start filling the ring buffer.
+        """
+        if self.stream is not None:
+            return
+        self.audio = pyaudio.PyAudio()
+        self.stream = self.audio.open(format=FORMAT, channels=CHANNELS,
+                                      rate=self.rate, input=True,
+                                      frames_per_buffer=self.chunk,
+                                      stream_callback=self._on_audio)
+        self.stream.start_stream()
+        logging.info(f"Audio input started at {self.rate} Hz")
+
+    def stop(self):
+        """
+        Close the device. Audio already in the buffer stays readable.
+        """
+        if self.stream is not None:
+            self.stream.stop_stream()
+            self.stream.close()
+            self.stream = None
+        if self.audio is not None:
+            self.audio.terminate()
+            self.audio = None
+
+    def _on_audio(self, in_data, frame_count, time_info, status):
+        self.buffer.write(np.frombuffer(in_data, dtype=np.int16))
+        return None, pyaudio.paContinue
+
+    def reader(self):
+        """
+        Reader that starts at the newest sample, i.e. sees only audio from now on.
+        """
+        return self.buffer.reader()
+
+    def record(self, duration):
+        """
+        Return the next duration seconds of audio as an int16 array.
+        """
+        samples = self.reader().read(int(self.rate * duration))
+        return np.array(samples)  # Copy: recordings outlive the ring buffer
+
+
+class BufferStream:
+    """
+    File-like stream over a ring buffer reader, for code that expects stream.read(frames) -> bytes.
+    """
+
+    def __init__(self, reader):
+        self.reader = reader
+
+    def read(self, frames, exception_on_overflow=False):
+        return self.reader.read(frames).tobytes()
@@ -1,11 +1,38 @@
+import functools
+import itertools
 import logging
+import os
 import re
-from fuzzywuzzy import fuzz
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+
+from Core.VoiceRecognition.synonym_matcher import SynonymMatcher
+from Core.VoiceRecognition.fuzzy_index import FuzzyIndex, max_edit_distance
+from Core.VoiceRecognition.intent import Intent
+from Core.VoiceRecognition.slot_extractors import DEFAULT_SLOTS
+
+try:
+    # Optional: lets parse_many score a whole batch against the vocabulary as one matrix
+    import numpy as np
+    from rapidfuzz import process as rapidfuzz_process
+    from rapidfuzz.distance import Levenshtein
+except ImportError:
+    rapidfuzz_process = None
+
+# Politeness phrases stripped before matching
+FILLER_PATTERN = re.compile(r'\b(can you|please|kindly|would you|could you|could|can)\b')
+
+# Actions whose handlers take no target
+NO_TARGET_ACTIONS = ("take_screenshot", "shutdown", "list_installed_apps", "get_clipboard_text", "zip_files")
+
+# Destructive actions that need an exact synonym hit; a typo match never rewrites into them
+# ("remote control" is one letter from "remove control")
+EXACT_ONLY_ACTIONS = ("delete_command", "shutdown", "restart")
 
 class CommandParser:
-    def __init__(self, threshold=70):
+    def __init__(self, threshold=70, cache_size=256):
         self.command_handlers = {}
-        self.synonym_map = {
+        self._synonym_map = {
             "open": ["open", "launch", "start"],
             "shutdown": ["shutdown", "turn off", "power off"],
             "close": ["close", "exit", "quit"],
@@ -26,64 +53,340 @@ class CommandParser:
             "zip_files": ["zip files", "compress files", "archive files"],
             "delete_command": ["delete", "remove", "erase", "delete file"],
         }
-        self.threshold = threshold
+        self._threshold = threshold
+        self._matcher = None  # Compiled lazily on the first parse after a change
+        self._action_patterns = None  # Per-action regex that strips the action phrase, compiled with the matcher
+        self._slot_extractors = dict(DEFAULT_SLOTS)  # Typed slot grammar per action
+        self._synonym_index = FuzzyIndex()  # Typo-tolerant fallback, grown incrementally
+        self._max_synonym_words = 1
+        self._index_synonyms(self._synonym_map)
+        # Known targets (e.g. application names) used to correct misrecognized targets
+        self._target_index = FuzzyIndex()
+        self._target_actions = set()
+        # Bounded LRU of resolved (action, target, ratio) keyed on the normalized command
+        self._resolve_cached = functools.lru_cache(maxsize=cache_size)(self._resolve)
+
+    @property
+    def threshold(self):
+        return self._threshold
+
+    @threshold.setter
+    def threshold(self, threshold):
+        self._threshold = threshold
+        self._invalidate()
+
+    @property
+    def synonym_map(self):
+        return self._synonym_map
+
+    @synonym_map.setter
+    def synonym_map(self, synonym_map):
+        self._synonym_map = synonym_map
+        self._synonym_index = FuzzyIndex()
+        self._max_synonym_words = 1
+        self._index_synonyms(synonym_map)
+        self._invalidate()
+
+    def _index_synonyms(self, synonym_map):
+        for action, synonyms in synonym_map.items():
+            if action in EXACT_ONLY_ACTIONS:
+                continue
+            for synonym in synonyms:
+                self._synonym_index.add(synonym, action)
+                self._max_synonym_words = max(self._max_synonym_words, len(synonym.split()))
 
-    def register_command(self, command_name, handler_function):
+    def _invalidate(self):
         """
-        Register a new command handler for a specific command.
+        Drop compiled matching state and cached resolutions so they are rebuilt on the next parse.
         """
-        self.command_handlers[command_name.lower()] = handler_function
+        self._matcher = None
+        self._action_patterns = None
+        self._resolve_cached.cache_clear()
 
-    def parse(self, command):
+    def _compiled_matcher(self):
+        if self._matcher is None:
+            self._matcher = SynonymMatcher(self._synonym_map)
+        return self._matcher
+
+    def _compiled_patterns(self):
+        if self._action_patterns is None:
+            # Longest synonym first: the alternation takes the first branch that matches,
+            # so "delete" must not win over "delete file"
+            self._action_patterns = {}
+            for action, synonyms in self._synonym_map.items():
+                if synonyms:
+                    alternation = '|'.join(re.escape(synonym) for synonym in sorted(synonyms, key=len, reverse=True))
+                    self._action_patterns[action] = re.compile(rf"\b({alternation})\b")
+        return self._action_patterns
+
+    def register_command(self, command_name, handler_function, synonyms=None, slot=None):
         """
-        Parse and route the command to the appropriate handler.
+        Register a new command handler for a specific command, optionally with extra synonyms
+        and a slot extractor (see slot_extractors) that turns the target text into a typed value.
         """
-        # Normalize the command by removing unnecessary phrases
-        command = re.sub(r'\b(can you|please|kindly|would you|could you|could|can)\b', '', command.lower()).strip()
+        command_name = command_name.lower()
+        self.command_handlers[command_name] = handler_function
+        if slot:
+            self._slot_extractors[command_name] = slot
+        if synonyms:
+            self.add_synonyms(command_name, synonyms)
+        else:
+            self._invalidate()
+
+    def add_synonyms(self, action, synonyms):
+        """
+        Add synonyms for an action. Use this instead of mutating synonym_map in place
+        so the compiled matcher is refreshed.
+        """
+        known = self._synonym_map.setdefault(action, [])
+        added = []
+        for synonym in synonyms:
+            synonym = synonym.lower()
+            if synonym not in known:
+                known.append(synonym)
+                added.append(synonym)
+        self._index_synonyms({action: added})
+        self._invalidate()
 
-        # Find the best matching action
+    def register_targets(self, targets, actions=("open", "close")):
+        """
+        Register known targets (e.g. application names) so misheard targets for the
+        given actions can be corrected to the closest known one.
+        """
+        for target in targets:
+            self._target_index.add(target, target)
+        self._target_actions.update(actions)
+        self._invalidate()
+
+    def normalize(self, command):
+        """
+        Lowercase the command and strip politeness phrases.
+        """
+        return FILLER_PATTERN.sub('', command.lower()).strip()
+
+    def resolve(self, command):
+        """
+        Resolve a normalized command to (action, target, ratio) without invoking a handler.
+
+        action is None when nothing matches above the threshold. Results are memoized
+        per normalized command; see cache_info().
+        """
+        return self._resolve_cached(command)
+
+    def _resolve(self, command):
+        # Find the best matching action in a single pass over the command
         best_action = None
         highest_ratio = 0
 
-        for action, synonyms in self.synonym_map.items():
-            for synonym in synonyms:
-                if synonym in command:
-                    ratio = fuzz.partial_ratio(command, synonym)
-                    if ratio > highest_ratio:
-                        highest_ratio = ratio
-                        best_action = action
+        match = self._compiled_matcher().best_match(command)
+        if match:
+            best_action = match[1]
+            highest_ratio = 100  # An exact synonym hit is a perfect partial match
+        else:
+            fuzzy_match = self.fuzzy_match(command)
+            if fuzzy_match:
+                # Rewrite the misheard phrase to the synonym it resembles, e.g. "lunch crome" -> "launch crome"
+                best_action, highest_ratio, command = fuzzy_match
+
+        return self._with_target(command, best_action, highest_ratio)
 
+    def _with_target(self, command, best_action, highest_ratio):
         # Ensure the match meets the threshold
-        if best_action and highest_ratio >= self.threshold:
-            handler = self.command_handlers.get(best_action)
-            if handler:
-                # Extract the target (e.g., app name or URL) from the command, but handle special cases
-                if best_action in ["take_screenshot", "shutdown", "list_installed_apps", "get_clipboard_text", "zip_files"]:
-                    remaining_text = None  # No target needed
-                else:
-                    remaining_text = self.extract_target(command, best_action)
+        if not best_action or highest_ratio < self.threshold:
+            return None, None, highest_ratio
 
-                if remaining_text is not None:
-                    print(f"Detected intent: {best_action}")
-                    print(f"Detected target: {remaining_text}")
-                    handler(remaining_text)  # Invoke the handler with the target
-                else:
-                    print(f"Detected intent: {best_action}")
-                    handler()  # Invoke the handler without a target
-            else:
-                print(f"Handler for '{best_action}' not registered.")
+        # Extract the target (e.g., app name or URL) from the command, but handle special cases
+        if best_action in NO_TARGET_ACTIONS:
+            target = None  # No target needed
         else:
-            print(f"Unrecognized command: {command}")
+            target = self.extract_target(command, best_action)
+            if target and best_action in self._target_actions:
+                target = self.correct_target(target)
+            target = self.extract_slot(best_action, target)
+        return best_action, target, highest_ratio
+
+    def extract_slot(self, action, text):
+        """
+        Convert target text into the typed value of the action's slot grammar.
+
+        Returns None when there is no text or it does not fit the grammar.
+        """
+        extractor = self._slot_extractors.get(action)
+        if text is None or extractor is None:
+            return text
+        return extractor(text)
+
+    def cache_info(self):
+        """
+        Hit/miss counters of the resolution cache.
+        """
+        return self._resolve_cached.cache_info()
+
+    def parse(self, command):
+        """
+        Parse and route the command to the appropriate handler.
+
+        Commands that dispatch refuses are reported on the console and return None.
+        """
+        # Normalize the command by removing unnecessary phrases
+        command = self.normalize(command)
+        action, target, confidence = self.resolve(command)
+        try:
+            return self.dispatch(Intent(action, {"target": target}, confidence, utterance=command, tier="keyword"))
+        except ValueError as e:
+            print(e)
+            return None
+
+    def dispatch(self, intent):
+        """
+        Invoke the handler registered for an already resolved Intent and return its result.
+
+        Raises ValueError, without calling any handler, for an unrecognized
+        intent, an action with no registered handler or a missing or invalid slot.
+        """
+        if not intent.action:
+            raise ValueError(f"Unrecognized command: {intent.utterance}")
+
+        handler = self.command_handlers.get(intent.action)
+        if not handler:
+            raise ValueError(f"Handler for '{intent.action}' not registered.")
+
+        print(f"Detected intent: {intent.action}")
+        if intent.target is None and intent.action in self._slot_extractors:
+            raise ValueError(f"Missing or invalid value for '{intent.action}': {intent.utterance}")
+        if intent.target is not None:
+            print(f"Detected target: {intent.target}")
+            return handler(intent.target)  # Invoke the handler with the target
+        return handler()  # Invoke the handler without a target
+
+    def parse_many(self, commands, batch_size=1000):
+        """
+        Resolve an iterable of commands without invoking any handlers.
+
+        Yields one dict per command, in order, with keys "command", "action",
+        "target" and "confidence". Input is consumed batch_size lines at a time,
+        so arbitrarily long transcript logs are processed in bounded memory. When
+        rapidfuzz is installed, commands without an exact synonym hit are scored
+        against the whole vocabulary as a single distance matrix per batch.
+        """
+        commands = iter(commands)
+        while True:
+            batch = list(itertools.islice(commands, batch_size))
+            if not batch:
+                return
+            normalized = [self.normalize(command) for command in batch]
+            resolved = self._resolve_batch(normalized)
+            for command, (action, target, ratio) in zip(batch, resolved):
+                yield {"command": command, "action": action, "target": target, "confidence": ratio}
+
+    def _resolve_batch(self, commands):
+        matcher = self._compiled_matcher()
+        results = [None] * len(commands)
+        misses = []
+        for position, command in enumerate(commands):
+            if rapidfuzz_process is None or matcher.best_match(command):
+                results[position] = self.resolve(command)
+            else:
+                misses.append(position)
+
+        if misses:
+            fuzzy_matches = self._fuzzy_match_matrix([commands[position] for position in misses])
+            for position, fuzzy_match in zip(misses, fuzzy_matches):
+                if fuzzy_match:
+                    results[position] = self._with_target(fuzzy_match[2], fuzzy_match[0], fuzzy_match[1])
+                else:
+                    results[position] = (None, None, 0)
+        return results
+
+    def _fuzzy_match_matrix(self, commands):
+        """
+        Same selection rule as fuzzy_match, computed for many commands with one cdist call.
+        """
+        # Sorted so that argmax breaks ties on the alphabetically first synonym, like the BK-tree search
+        vocabulary = sorted(self._synonym_index.items())
+        synonyms = [term for term, _ in vocabulary]
+        synonym_lengths = np.array([len(term) for term in synonyms])
+
+        # Every word n-gram of every command, remembered in fuzzy_match's iteration order
+        phrases = {}
+        candidates = []
+        for command in commands:
+            words = command.split()
+            spans = [(phrases.setdefault(phrase, len(phrases)), start, size)
+                     for start, size, phrase in self._phrases(words)]
+            candidates.append((words, spans))
+        if not phrases:
+            return [None] * len(commands)
+
+        phrase_list = list(phrases)
+        phrase_lengths = np.array([len(phrase) for phrase in phrase_list])
+        bounds = np.array([max_edit_distance(phrase) for phrase in phrase_list])
+        distances = rapidfuzz_process.cdist(phrase_list, synonyms, scorer=Levenshtein.distance, workers=-1)
+        ratios = np.round(100 * (1 - distances / np.maximum(phrase_lengths[:, None], synonym_lengths[None, :])))
+        ratios = np.where(distances <= bounds[:, None], ratios, -1)
+        # Prefer the higher ratio, then the longer synonym
+        best_columns = np.argmax(ratios * 1000 + synonym_lengths[None, :], axis=1)
+        best_ratios = ratios[np.arange(len(phrase_list)), best_columns]
+
+        results = []
+        for words, spans in candidates:
+            best = None
+            best_key = None
+            for row, start, size in spans:
+                ratio = int(best_ratios[row])
+                if ratio < 0:
+                    continue
+                synonym, actions = vocabulary[best_columns[row]]
+                key = (-ratio, -len(synonym), start)
+                if best_key is None or key < best_key:
+                    rewritten = " ".join(words[:start] + [synonym] + words[start + size:])
+                    best, best_key = (actions[0], ratio, rewritten), key
+            results.append(best)
+        return results
+
+    def fuzzy_match(self, command):
+        """
+        Find the synonym closest to any word n-gram of the command.
+
+        Returns (action, ratio, rewritten_command) or None. The ratio is a 0-100
+        similarity derived from the edit distance.
+        """
+        words = command.split()
+        best = None
+        best_key = None
+        for start, size, phrase in self._phrases(words):
+            for distance, synonym, actions in self._synonym_index.search(phrase, max_edit_distance(phrase)):
+                ratio = round(100 * (1 - distance / max(len(phrase), len(synonym))))
+                key = (-ratio, -len(synonym), start)
+                if best_key is None or key < best_key:
+                    rewritten = " ".join(words[:start] + [synonym] + words[start + size:])
+                    best, best_key = (actions[0], ratio, rewritten), key
+        return best
+
+    def _phrases(self, words):
+        # Word n-grams that may be a misheard synonym, longest first. Numbers are
+        # arguments, never part of a synonym, so n-grams containing one are skipped
+        # ("volume 30" must not be rewritten to "volume up" and lose the 30)
+        for size in range(min(self._max_synonym_words, len(words)), 0, -1):
+            for start in range(len(words) - size + 1):
+                if any(any(char.isdigit() for char in word) for word in words[start:start + size]):
+                    continue
+                yield start, size, " ".join(words[start:start + size])
+
+    def correct_target(self, target):
+        """
+        Snap a target to the closest registered target within the edit-distance bound.
+        """
+        closest = self._target_index.closest(target)
+        return closest[1] if closest else target
 
     def extract_target(self, command, action):
         """
         Extract the target (e.g., app name, file path) from the command.
         """
-        print(f"Extracting target for action: {action}")
-        print(f"Original command: {command}")
-        synonyms = self.synonym_map[action]
-        action_regex = rf"\b({'|'.join(synonyms)})\b"
-        target = re.sub(action_regex, "", command).strip()  # Remove the action word
+        logging.debug(f"Extracting target for action: {action}")
+        logging.debug(f"Original command: {command}")
+        target = self._compiled_patterns()[action].sub("", command).strip()  # Remove the action word
         return target if target else None
 
 
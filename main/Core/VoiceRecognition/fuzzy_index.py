@@ -0,0 +1,126 @@
+try:
+    from rapidfuzz.distance import Levenshtein  # Optional C implementation, ~100x faster
+except ImportError:
+    Levenshtein = None
+
+
+def edit_distance(a, b):
+    """
+    Levenshtein distance between two strings.
+    """
+    if Levenshtein is not None:
+        return Levenshtein.distance(a, b)
+    if a == b:
+        return 0
+    if len(a) < len(b):
+        a, b = b, a
+    if not b:
+        return len(a)
+
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1,                        # deletion
+                               current[j - 1] + 1,                     # insertion
+                               previous[j - 1] + (char_a != char_b)))  # substitution
+        previous = current
+    return previous[-1]
+
+
+def max_edit_distance(term, ratio=0.25, exact_length=4):
+    """
+    Edit-distance budget for a term: roughly one typo per four characters, at least one.
+
+    Terms of exact_length characters or fewer must match exactly; one typo in a
+    short word already turns ordinary speech into a command ("love" -> "move").
+    """
+    if len(term) <= exact_length:
+        return 0
+    return max(1, int(len(term) * ratio))
+
+
+class FuzzyIndex:
+    """
+    BK-tree over short phrases (command synonyms, application names).
+
+    Terms can be added one at a time as commands are registered; lookups only
+    visit the subtrees that the triangle inequality allows to be within the
+    edit-distance bound, instead of scoring every known phrase.
+    """
+
+    def __init__(self, terms=None):
+        self.root = None  # [term, payloads, {distance: child_node}]
+        self.size = 0
+        for term, payload in (terms or []):
+            self.add(term, payload)
+
+    def add(self, term, payload=None):
+        """
+        Add a term (with an optional payload such as the owning action) to the index.
+        """
+        term = term.lower()
+        if self.root is None:
+            self.root = [term, [payload], {}]
+            self.size = 1
+            return
+
+        node = self.root
+        while True:
+            distance = edit_distance(term, node[0])
+            if distance == 0:
+                if payload not in node[1]:
+                    node[1].append(payload)
+                return
+            child = node[2].get(distance)
+            if child is None:
+                node[2][distance] = [term, [payload], {}]
+                self.size += 1
+                return
+            node = child
+
+    def search(self, query, max_distance=None, k=None):
+        """
+        Return up to k (distance, term, payloads) tuples within max_distance of the query,
+        closest first.
+        """
+        if self.root is None:
+            return []
+        query = query.lower()
+        if max_distance is None:
+            max_distance = max_edit_distance(query)
+
+        results = []
+        pending = [self.root]
+        while pending:
+            term, payloads, children = pending.pop()
+            distance = edit_distance(query, term)
+            if distance <= max_distance:
+                results.append((distance, term, payloads))
+            low, high = distance - max_distance, distance + max_distance
+            for child_distance, child in children.items():
+                if low <= child_distance <= high:
+                    pending.append(child)
+
+        results.sort(key=lambda result: (result[0], -len(result[1]), result[1]))
+        return results[:k] if k else results
+
+    def closest(self, query, max_distance=None):
+        """
+        Return the single closest (distance, term, payloads) tuple, or None.
+        """
+        results = self.search(query, max_distance, k=1)
+        return results[0] if results else None
+
+    def items(self):
+        """
+        Yield every (term, payloads) pair in the index.
+        """
+        pending = [self.root] if self.root is not None else []
+        while pending:
+            term, payloads, children = pending.pop()
+            yield term, payloads
+            pending.extend(children.values())
+
+    def __len__(self):
+        return self.size
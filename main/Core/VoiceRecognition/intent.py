@@ -0,0 +1,31 @@
+class Intent:
+    """
+    A command understood once and passed through to execution.
+
+    Attributes:
+    - action (str): Parser action name (e.g., "open", "change_volume"), or None if unrecognized.
+    - slots (dict): Arguments for the action; "target" holds the extracted target, if any.
+    - confidence (int): 0-100 score of the tier that produced the intent.
+    - timings (dict): Seconds spent in each resolution stage, keyed by stage name.
+    - utterance (str): The command text the intent was resolved from.
+    - tier (str): Which resolver tier produced the intent ("keyword" or "nlp").
+    """
+
+    def __init__(self, action, slots=None, confidence=0, timings=None, utterance=None, tier=None):
+        self.action = action
+        self.slots = slots if slots is not None else {}
+        self.confidence = confidence
+        self.timings = timings if timings is not None else {}
+        self.utterance = utterance
+        self.tier = tier
+
+    @property
+    def target(self):
+        return self.slots.get("target")
+
+    def __bool__(self):
+        return self.action is not None
+
+    def __repr__(self):
+        return (f"Intent(action={self.action!r}, slots={self.slots!r}, "
+                f"confidence={self.confidence!r}, tier={self.tier!r})")
@@ -0,0 +1,96 @@
+import logging
+import os
+import sys
+import time
+sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+
+from Core.VoiceRecognition.intent import Intent
+from Core.VoiceRecognition.nlp_processing import process_command
+
+# Utterances that end the session regardless of what the tiers would make of them
+EXIT_PHRASES = ("exit", "quit", "goodbye", "exit assistant")
+
+
+class IntentResolver:
+    """
+    Resolve utterances through a cascade of tiers, cheapest first.
+
+    The keyword tier (CommandParser) answers when its confidence reaches
+    confidence_threshold; only the remaining utterances are sent through the
+    spaCy tier. Per-tier counters show how much traffic avoids the NLP model.
+    """
+
+    def __init__(self, parser, confidence_threshold=90, nlp_tier=process_command):
+        self.parser = parser
+        self.confidence_threshold = confidence_threshold
+        self.nlp_tier = nlp_tier
+        self.counters = {
+            "keyword": {"calls": 0, "hits": 0},
+            "nlp": {"calls": 0, "hits": 0},
+        }
+
+    def resolve(self, command):
+        """
+        Resolve an utterance into an Intent.
+
+        Intent.tier is "keyword", "nlp" or None when no tier recognized the command
+        confidently (a keyword match below confidence_threshold that the NLP tier
+        does not confirm is unrecognized); Intent.timings holds the seconds spent
+        in each tier that ran.
+        """
+        timings = {}
+        start = time.perf_counter()
+        normalized = self.parser.normalize(command)
+        self.counters["keyword"]["calls"] += 1
+        if normalized in EXIT_PHRASES:
+            self.counters["keyword"]["hits"] += 1
+            return Intent("exit", confidence=100, utterance=normalized, tier="keyword")
+
+        action, target, confidence = self.parser.resolve(normalized)
+        timings["keyword"] = time.perf_counter() - start
+        if action and confidence >= self.confidence_threshold:
+            self.counters["keyword"]["hits"] += 1
+            return Intent(action, {"target": target}, confidence, timings, normalized, "keyword")
+
+        logging.debug(f"Keyword tier confidence {confidence} below {self.confidence_threshold}, falling back to NLP")
+        self.counters["nlp"]["calls"] += 1
+        start = time.perf_counter()
+        nlp_intent, nlp_target = self.nlp_tier(command)
+        timings["nlp"] = time.perf_counter() - start
+        if nlp_intent == "exit":
+            self.counters["nlp"]["hits"] += 1
+            return Intent("exit", timings=timings, utterance=normalized, tier="nlp")
+        if nlp_intent:
+            self.counters["nlp"]["hits"] += 1
+            # Map the spaCy verb ("launch") onto the parser's action name ("open") when possible;
+            # the intent comes from spaCy alone, scored by how well its verb maps onto an action
+            mapped_action, _, nlp_confidence = self.parser.resolve(self.parser.normalize(nlp_intent))
+            mapped_action = mapped_action or nlp_intent
+            nlp_target = self.parser.extract_slot(mapped_action, nlp_target) if nlp_target else None
+            return Intent(mapped_action, {"target": nlp_target}, nlp_confidence, timings, normalized, "nlp")
+
+        # Neither tier is confident; a keyword guess below the threshold must not be executed
+        if action:
+            logging.debug(f"Discarding unconfirmed keyword match '{action}' ({confidence}) for: {normalized}")
+        return Intent(None, confidence=confidence, timings=timings, utterance=normalized)
+
+    def prefetch(self, partial):
+        """
+        Resolve a partial transcript ahead of end-of-speech.
+
+        The keyword tier memoizes resolutions, so once the final transcript
+        matches the last partial, resolve() is a cache hit. Counters are not touched.
+        """
+        normalized = self.parser.normalize(partial)
+        if normalized and normalized not in EXIT_PHRASES:
+            self.parser.resolve(normalized)
+
+    def hit_rates(self):
+        """
+        Fraction of calls each tier answered, and the share of all traffic that skipped NLP.
+        """
+        keyword, nlp = self.counters["keyword"], self.counters["nlp"]
+        rates = {tier: (counts["hits"] / counts["calls"] if counts["calls"] else 0.0)
+                 for tier, counts in self.counters.items()}
+        rates["nlp_avoided"] = 1 - nlp["calls"] / keyword["calls"] if keyword["calls"] else 0.0
+        return rates
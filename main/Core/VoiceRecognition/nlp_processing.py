@@ -1,7 +1,76 @@
-import spacy
+import logging
+import threading
+import time
+
+MODEL_NAME = "en_core_web_sm"
+# process_command only reads lemma_/pos_ (tagger, attribute_ruler, lemmatizer) and doc.ents (ner),
+# so the dependency parser and sentence segmenter are never loaded
+EXCLUDED_COMPONENTS = ["parser", "senter"]
+
+_nlp = None
+_nlp_lock = threading.Lock()
+load_seconds = None  # Wall time spent importing spaCy and loading the model, once loaded
+
+
+def get_nlp():
+    """
+    Return the spaCy pipeline, importing spaCy and loading the model on first use.
+    """
+    global _nlp, load_seconds
+    if _nlp is None:
+        with _nlp_lock:
+            if _nlp is None:
+                start = time.perf_counter()
+                import spacy  # Deferred: importing spaCy alone takes about a second
+                nlp = spacy.load(MODEL_NAME, exclude=EXCLUDED_COMPONENTS)
+                load_seconds = time.perf_counter() - start
+                logging.info(f"Loaded {MODEL_NAME} ({', '.join(nlp.pipe_names)}) in {load_seconds:.2f}s")
+                _nlp = nlp
+    return _nlp
+
+
+def warm_up(background=True):
+    """
+    Load the spaCy model ahead of the first command.
+
+    With background=True the model loads in a daemon thread and the thread is
+    returned; process_command waits for it if called before it finishes.
+    """
+    if not background:
+        get_nlp()
+        return None
+    thread = threading.Thread(target=get_nlp, name="nlp-warm-up", daemon=True)
+    thread.start()
+    return thread
+
+
+# Define a list of possible actions (intents)
+POSSIBLE_ACTIONS = {
+    "open", "launch", "start",
+    "close", "exit", "quit",
+    "restart", "reboot",
+    "shutdown", "turn off",
+    "search", "find",
+    "change", "adjust", "set",
+    "pause", "resume", "stop",
+    "maximize", "minimize", "restore",
+    "mute", "unmute", "volume up", "volume down",
+    "lock", "unlock", "sign out",
+    "copy", "paste", "cut", "delete",
+    "screenshot", "take"
+}
+
+# Expand actions with possible synonyms for flexibility
+ACTION_SYNONYMS = {
+    "close": ["close", "exit", "quit", "shut down"],
+    "open": ["open", "launch", "start", "run"],
+    "restart": ["restart", "reboot", "relaunch"],
+    "shutdown": ["shutdown", "turn off", "power off"],
+    "maximize": ["maximize", "expand"],
+    "minimize": ["minimize", "shrink"],
+    "volume": ["volume up", "volume down", "mute", "unmute"]
+}
 
-# Load the spaCy model for NLP processing
-nlp = spacy.load("en_core_web_sm")
 
 def process_command(command):
     """
@@ -14,39 +83,30 @@ def process_command(command):
     - intent (str): The action the user wants to perform (e.g., "open", "restart").
     - target (str): The object the action is applied to (e.g., "Notepad", "Chrome").
     """
-    # Process the command using spaCy
-    doc = nlp(command.lower())  # Process the command in lowercase to ensure consistency
-    
-    # Debugging the processed command
-    print(f"Processed command: {command}")
-    
-    # Define a list of possible actions (intents)
-    possible_actions = [
-        "open", "launch", "start", 
-        "close", "exit", "quit", 
-        "restart", "reboot", 
-        "shutdown", "turn off", 
-        "search", "find", 
-        "change", "adjust", "set", 
-        "pause", "resume", "stop", 
-        "maximize", "minimize", "restore", 
-        "mute", "unmute", "volume up", "volume down", 
-        "lock", "unlock", "sign out", 
-        "copy", "paste", "cut", "delete", 
-        "screenshot", "take"
-    ]
-    
-    # Expand actions with possible synonyms for flexibility
-    action_synonyms = {
-        "close": ["close", "exit", "quit", "shut down"],
-        "open": ["open", "launch", "start", "run"],
-        "restart": ["restart", "reboot", "relaunch"],
-        "shutdown": ["shutdown", "turn off", "power off"],
-        "maximize": ["maximize", "expand"],
-        "minimize": ["minimize", "shrink"],
-        "volume": ["volume up", "volume down", "mute", "unmute"]
-    }
-    
+    # Process the command in lowercase to ensure consistency
+    return interpret(get_nlp()(command.lower()), command)
+
+
+def process_commands(commands, batch_size=256, n_process=1):
+    """
+    Process many commands with nlp.pipe, yielding (intent, target) for each, in input order.
+
+    Args:
+    - commands (iterable of str): Commands to process; consumed lazily.
+    - batch_size (int): Number of commands spaCy processes per batch.
+    - n_process (int): Worker processes for spaCy (-1 uses every CPU).
+    """
+    pairs = ((command.lower(), command) for command in commands)
+    for doc, command in get_nlp().pipe(pairs, as_tuples=True, batch_size=batch_size, n_process=n_process):
+        yield interpret(doc, command)
+
+
+def interpret(doc, command):
+    """
+    Extract (intent, target) from a processed spaCy doc of the command.
+    """
+    logging.debug(f"Processed command: {command}")
+
     # Extract intent and target
     intent = None
     target = None
@@ -54,16 +114,15 @@ def process_command(command):
     # Search for an action (intent) from the command
     for token in doc:
         # Lemmatization allows for matching actions even if the user uses different word forms
-        if token.lemma_ in possible_actions:
+        if token.lemma_ in POSSIBLE_ACTIONS:
             intent = token.lemma_
             break  # Stop after finding the first action
     
-    # Debugging the extracted intent
-    print(f"Detected intent: {intent}")
+    logging.debug(f"Detected intent: {intent}")
     
     # If no explicit action is found, try to check for action synonyms
     if not intent:
-        for action, synonyms in action_synonyms.items():
+        for action, synonyms in ACTION_SYNONYMS.items():
             if any(synonym in command for synonym in synonyms):
                 intent = action
                 break
@@ -94,8 +153,23 @@ def process_command(command):
                     target = token.text
                     break
     
-        # Debugging the extracted target
-        print(f"Detected target: {target}")
+        logging.debug(f"Detected target: {target}")
     
     return intent, target
 
+
+if __name__ == "__main__":
+    # Report model load time and per-call latency
+    warm_up(background=False)
+    print(f"Model load time: {load_seconds:.3f}s")
+    commands = ["open chrome", "change volume to 30", "take a screenshot", "close notepad"] * 250
+    start = time.perf_counter()
+    for command in commands:
+        process_command(command)
+    per_call = (time.perf_counter() - start) / len(commands)
+    print(f"Per-call latency: {per_call * 1000:.2f}ms")
+    start = time.perf_counter()
+    for _ in process_commands(commands):
+        pass
+    throughput = len(commands) / (time.perf_counter() - start)
+    print(f"Batched throughput: {throughput:.0f} commands/s")
@@ -0,0 +1,129 @@
+import json
+import os
+import sys
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+from Core.VoiceRecognition.speaker_embedding import EMBEDDING_SIZE, MATCH_THRESHOLD
+
+MATRIX_FILENAME = "embeddings.npy"
+INDEX_FILENAME = "index.json"
+
+
+class VoiceProfileStore:
+    """
+    Speaker embeddings of every enrolled user in one memory-mapped matrix.
+
+    Row i of embeddings.npy holds one user's embedding; index.json maps user
+    ids to rows. Enrolling writes a single row and the small index, and
+    removing a user zeroes the row and adds it to a free list for reuse, so
+    neither rewrites the matrix. The file only grows, doubling its capacity,
+    when every row is taken.
+    """
+
+    def __init__(self, directory, dim=EMBEDDING_SIZE, initial_capacity=32):
+        self.directory = directory
+        self.dim = dim
+        self.matrix_path = os.path.join(directory, MATRIX_FILENAME)
+        self.index_path = os.path.join(directory, INDEX_FILENAME)
+        os.makedirs(directory, exist_ok=True)
+
+        if os.path.exists(self.index_path) and os.path.exists(self.matrix_path):
+            with open(self.index_path, encoding="utf-8") as index:
+                data = json.load(index)
+            self.rows = data["users"]  # User id -> row
+            self.free = data["free"]  # Rows of removed users, reused first
+            self.used = data["used"]  # Rows ever handed out; rows beyond this are unused capacity
+            self.matrix = np.load(self.matrix_path, mmap_mode="r+")
+        else:
+            self.rows, self.free, self.used = {}, [], 0
+            self.matrix = np.lib.format.open_memmap(self.matrix_path, mode="w+", dtype=np.float32,
+                                                    shape=(initial_capacity, dim))
+            self._save_index()
+        self.users_by_row = {row: user_id for user_id, row in self.rows.items()}
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __contains__(self, user_id):
+        return user_id in self.rows
+
+    def users(self):
+        return list(self.rows)
+
+    def get(self, user_id):
+        """
+        Copy of a user's embedding, or None if the user is not enrolled.
+        """
+        row = self.rows.get(user_id)
+        return None if row is None else np.array(self.matrix[row])
+
+    def enroll(self, user_id, embedding):
+        """
+        Add a user, or replace the embedding of an enrolled one.
+        """
+        row = self.rows.get(user_id)
+        if row is None:
+            if self.free:
+                row = self.free.pop()
+            else:
+                if self.used == len(self.matrix):
+                    self._grow()
+                row = self.used
+                self.used += 1
+        self.matrix[row] = embedding
+        self.matrix.flush()
+        self.rows[user_id] = row
+        self.users_by_row[row] = user_id
+        self._save_index()
+
+    def remove(self, user_id):
+        """
+        Remove a user. Returns False if the user was not enrolled.
+        """
+        row = self.rows.pop(user_id, None)
+        if row is None:
+            return False
+        del self.users_by_row[row]
+        self.matrix[row] = 0  # A zero row scores 0 against every embedding, so it never matches
+        self.matrix.flush()
+        self.free.append(row)
+        self._save_index()
+        return True
+
+    def scores(self, embedding):
+        """
+        Similarity of the embedding to every row in use, as one matrix-vector product.
+        """
+        return self.matrix[:self.used] @ np.asarray(embedding, dtype=np.float32)
+
+    def identify(self, embedding, threshold=MATCH_THRESHOLD):
+        """
+        Return (user_id, similarity) of the closest enrolled user, with user_id None below threshold.
+        """
+        if not self.rows:
+            return None, 0.0
+        scores = self.scores(embedding)
+        row = int(np.argmax(scores))
+        score = float(scores[row])
+        if score < threshold or row not in self.users_by_row:
+            return None, score
+        return self.users_by_row[row], score
+
+    def _grow(self):
+        # Copy into a file of twice the capacity, then swap it in
+        grown_path = self.matrix_path + ".tmp"
+        grown = np.lib.format.open_memmap(grown_path, mode="w+", dtype=np.float32,
+                                          shape=(max(1, 2 * len(self.matrix)), self.dim))
+        grown[:len(self.matrix)] = self.matrix
+        grown.flush()
+        del grown
+        del self.matrix  # Release the old mapping before the file is replaced
+        os.replace(grown_path, self.matrix_path)
+        self.matrix = np.load(self.matrix_path, mmap_mode="r+")
+
+    def _save_index(self):
+        temporary_path = self.index_path + ".tmp"
+        with open(temporary_path, "w", encoding="utf-8") as index:
+            json.dump({"users": self.rows, "free": self.free, "used": self.used}, index)
+        os.replace(temporary_path, self.index_path)
@@ -0,0 +1,99 @@
+import logging
+import threading
+import numpy as np
+
+
+class AudioRingBuffer:
+    """
+    Preallocated ring buffer of audio samples shared by one writer and many readers.
+
+    Positions are absolute sample counts since the buffer was created, so each
+    reader keeps its own cursor and several consumers (verification, speech to
+    text, enrollment) can read the same audio independently.
+    """
+
+    def __init__(self, capacity, dtype=np.int16):
+        self.buffer = np.zeros(capacity, dtype=dtype)
+        self.capacity = capacity
+        self.written = 0  # Total samples ever written
+        self.condition = threading.Condition()
+
+    def write(self, samples):
+        """
+        Append samples, overwriting the oldest audio once the buffer is full.
+        """
+        samples = samples[-self.capacity:]
+        count = len(samples)
+        with self.condition:
+            offset = self.written % self.capacity
+            first = min(count, self.capacity - offset)
+            self.buffer[offset:offset + first] = samples[:first]
+            self.buffer[:count - first] = samples[first:]
+            self.written += count
+            self.condition.notify_all()
+
+    def oldest(self):
+        """
+        Absolute position of the oldest sample still held in the buffer.
+        """
+        return max(0, self.written - self.capacity)
+
+    def views(self, start, count):
+        """
+        Return the samples [start, start + count) as one or two zero-copy views.
+
+        Two views are returned when the range wraps around the end of the buffer.
+        """
+        if start < self.oldest() or start + count > self.written:
+            raise IndexError(f"Samples {start}-{start + count} are not in the buffer")
+        offset = start % self.capacity
+        if offset + count <= self.capacity:
+            return (self.buffer[offset:offset + count],)
+        first = self.capacity - offset
+        return self.buffer[offset:], self.buffer[:count - first]
+
+    def wait_for(self, position, timeout=None):
+        """
+        Block until the buffer has been written up to position. Returns False on timeout.
+        """
+        with self.condition:
+            return self.condition.wait_for(lambda: self.written >= position, timeout)
+
+    def reader(self, start=None):
+        """
+        Create a reader positioned at start (default: the newest sample).
+        """
+        return AudioReader(self, self.written if start is None else start)
+
+
+class AudioReader:
+    """
+    A consumer's cursor into an AudioRingBuffer.
+    """
+
+    def __init__(self, ring, position):
+        self.ring = ring
+        self.position = position
+
+    def available(self):
+        return self.ring.written - self.position
+
+    def read(self, count, timeout=None):
+        """
+        Wait for count samples and return them, advancing the cursor.
+
+        The result is a view into the ring buffer when the samples are contiguous;
+        only a read that wraps around the end of the buffer is copied. Views stay
+        valid until the writer wraps around, so consumers that keep audio longer
+        than the buffer length must copy it. Returns None on timeout.
+        """
+        if not self.ring.wait_for(self.position + count, timeout):
+            return None
+        if self.position < self.ring.oldest():
+            # The reader fell behind the writer; skip to the oldest audio still held
+            logging.warning(f"Audio reader overrun, dropped {self.ring.oldest() - self.position} samples")
+            self.position = self.ring.oldest()
+            count = min(count, self.available())
+        views = self.ring.views(self.position, count)
+        self.position += count
+        return views[0] if len(views) == 1 else np.concatenate(views)
@@ -0,0 +1,109 @@
+import re
+
+# Slot grammars: each extractor takes the text left after the action phrase is removed
+# and returns a typed value, or None when the text does not fit the grammar.
+# Patterns are compiled once at import time.
+
+UNITS = {
+    "zero": 0, "one": 1, "two": 2, "three": 3, "four": 4, "five": 5, "six": 6, "seven": 7,
+    "eight": 8, "nine": 9, "ten": 10, "eleven": 11, "twelve": 12, "thirteen": 13,
+    "fourteen": 14, "fifteen": 15, "sixteen": 16, "seventeen": 17, "eighteen": 18, "nineteen": 19,
+}
+TENS = {
+    "twenty": 20, "thirty": 30, "forty": 40, "fifty": 50,
+    "sixty": 60, "seventy": 70, "eighty": 80, "ninety": 90,
+}
+
+DIGITS_PATTERN = re.compile(r"\b(\d+)")
+WORD_PATTERN = re.compile(r"[a-z]+")
+RESOLUTION_PATTERN = re.compile(r"\b(\d{3,5})\s*(?:x|by|\*)\s*(\d{3,5})\b")
+URL_PATTERN = re.compile(r"(?:https?://|www\.)\S+")
+PAIR_PATTERN = re.compile(r"^(.+?)\s+to\s+(.+)$")
+
+
+def spoken_number(text):
+    """
+    Value of the first run of spoken number words ("thirty five", "one hundred"), or None.
+    """
+    value = None
+    for word in WORD_PATTERN.findall(text.lower()):
+        if word in UNITS or word in TENS:
+            value = (value or 0) + UNITS.get(word, TENS.get(word))
+        elif word == "hundred":
+            value = (value or 1) * 100
+        elif value is not None and word != "and":
+            break  # The number has ended
+    return value
+
+
+def number(text):
+    """
+    First number in the text, written as digits or spoken words.
+    """
+    match = DIGITS_PATTERN.search(text)
+    if match:
+        return int(match.group(1))
+    return spoken_number(text)
+
+
+def percent(text):
+    """
+    Integer level between 0 and 100 ("30", "30%", "thirty percent").
+    """
+    value = number(text)
+    return value if value is not None and 0 <= value <= 100 else None
+
+
+def resolution(text):
+    """
+    Screen resolution as a (width, height) tuple ("1920x1080", "1280 by 720").
+    """
+    match = RESOLUTION_PATTERN.search(text)
+    return (int(match.group(1)), int(match.group(2))) if match else None
+
+
+def url(text):
+    """
+    First URL in the text.
+    """
+    match = URL_PATTERN.search(text)
+    return match.group(0) if match else None
+
+
+def path(text):
+    """
+    File system path, with surrounding quotes removed.
+    """
+    value = text.strip().strip("\"'")
+    return value or None
+
+
+def pair(text):
+    """
+    "X to Y" pair as a (source, destination) tuple.
+    """
+    match = PAIR_PATTERN.match(text.strip())
+    return (path(match.group(1)), path(match.group(2))) if match else None
+
+
+def free_text(text):
+    """
+    The remaining text as is.
+    """
+    return text.strip() or None
+
+
+# Default slot grammar per parser action
+DEFAULT_SLOTS = {
+    "open": free_text,
+    "close": free_text,
+    "change_volume": percent,
+    "change_brightness": percent,
+    "change_resolution": resolution,
+    "download": url,
+    "move": pair,
+    "rename": pair,
+    "delete_command": path,
+    "copy_to_clipboard": free_text,
+    "run_custom_command": free_text,
+}
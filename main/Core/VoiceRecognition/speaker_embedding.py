@@ -0,0 +1,216 @@
+import functools
+import numpy as np
+
+# Spectral speaker embeddings: framed FFT -> mel filterbank -> log -> DCT (MFCC),
+# summarized as per-coefficient mean and standard deviation. All steps are
+# vectorized over frames; the filterbank and DCT matrices are built once per
+# configuration.
+
+RATE = 16000
+FRAME_MS = 25
+HOP_MS = 10
+N_FFT = 512
+N_MELS = 26
+N_MFCC = 13
+PRE_EMPHASIS = 0.97
+EMBEDDING_SIZE = 2 * (N_MFCC - 1)  # Mean and std of every coefficient except c0 (loudness)
+MATCH_THRESHOLD = 0.85  # Minimum similarity for two embeddings to be the same speaker; adjust based on testing
+
+
+def hz_to_mel(hz):
+    return 2595 * np.log10(1 + np.asarray(hz) / 700)
+
+
+def mel_to_hz(mel):
+    return 700 * (10 ** (np.asarray(mel) / 2595) - 1)
+
+
+@functools.lru_cache(maxsize=8)
+def mel_filterbank(rate=RATE, n_fft=N_FFT, n_mels=N_MELS):
+    """
+    (n_mels x n_fft // 2 + 1) matrix of triangular filters evenly spaced on the mel scale.
+    """
+    edges = mel_to_hz(np.linspace(hz_to_mel(0), hz_to_mel(rate / 2), n_mels + 2))
+    bins = np.fft.rfftfreq(n_fft, 1 / rate)
+    lower, center, upper = edges[:-2, None], edges[1:-1, None], edges[2:, None]
+    rising = (bins - lower) / (center - lower)
+    falling = (upper - bins) / (upper - center)
+    return np.maximum(0, np.minimum(rising, falling)).astype(np.float32)
+
+
+@functools.lru_cache(maxsize=8)
+def dct_matrix(n_mels=N_MELS, n_mfcc=N_MFCC):
+    """
+    Orthonormal DCT-II matrix (n_mels x n_mfcc) that maps log mel energies to cepstral coefficients.
+    """
+    n = np.arange(n_mels)[:, None]
+    k = np.arange(n_mfcc)[None, :]
+    matrix = np.cos(np.pi / n_mels * (n + 0.5) * k) * np.sqrt(2 / n_mels)
+    matrix[:, 0] /= np.sqrt(2)
+    return matrix.astype(np.float32)
+
+
+@functools.lru_cache(maxsize=8)
+def hamming(frame_length):
+    return np.hamming(frame_length).astype(np.float32)
+
+
+def frame_mfcc(frames, rate=RATE, n_mfcc=N_MFCC):
+    """
+    MFCCs of a (frames x frame_length) array of pre-emphasized samples.
+    """
+    power = np.abs(np.fft.rfft(frames * hamming(frames.shape[1]), N_FFT)) ** 2 / N_FFT
+    mel_energy = power @ mel_filterbank(rate, N_FFT, N_MELS).T
+    return np.log(mel_energy + 1e-10) @ dct_matrix(N_MELS, n_mfcc)
+
+
+def mfcc(samples, rate=RATE, n_mfcc=N_MFCC):
+    """
+    MFCCs of overlapping 25 ms frames as a (frames x n_mfcc) array; empty when the audio is shorter than a frame.
+    """
+    frame_length = int(rate * FRAME_MS / 1000)
+    hop = int(rate * HOP_MS / 1000)
+    signal = np.asarray(samples, dtype=np.float32) / 32768
+    if len(signal) < frame_length:
+        return np.zeros((0, n_mfcc), dtype=np.float32)
+    signal = np.append(signal[0], signal[1:] - PRE_EMPHASIS * signal[:-1])
+    return frame_mfcc(np.lib.stride_tricks.sliding_window_view(signal, frame_length)[::hop], rate, n_mfcc)
+
+
+def embedding_from_mfcc(coefficients, min_frames=10):
+    """
+    L2-normalized embedding from per-frame MFCCs, or None when there are too few frames.
+
+    Frames far below the loudest one (pauses inside the segment) are left out
+    so silence does not dilute the speaker's statistics.
+    """
+    if len(coefficients) < min_frames:
+        return None
+    voiced = coefficients[coefficients[:, 0] > coefficients[:, 0].max() - 6]
+    if len(voiced) < min_frames:
+        voiced = coefficients
+    vector = np.concatenate((voiced[:, 1:].mean(axis=0), voiced[:, 1:].std(axis=0)))
+    norm = np.linalg.norm(vector)
+    return (vector / norm).astype(np.float32) if norm else None
+
+
+def speaker_embedding(samples, rate=RATE):
+    """
+    Fixed-length speaker embedding of int16 speech samples, or None if the audio is too short.
+    """
+    return embedding_from_mfcc(mfcc(samples, rate))
+
+
+def similarity(first, second):
+    """
+    Cosine similarity of two embeddings (both are unit length, so a dot product).
+    """
+    return float(np.dot(first, second))
+
+
+class IncrementalEmbedding:
+    """
+    Speaker embedding built up chunk by chunk as audio arrives.
+
+    Only the frames completed by each new chunk are transformed; the MFCCs
+    computed so far are kept, so embedding() can be asked for at any point and
+    matches speaker_embedding() of all the audio added.
+    """
+
+    def __init__(self, rate=RATE):
+        self.rate = rate
+        self.frame_length = int(rate * FRAME_MS / 1000)
+        self.hop = int(rate * HOP_MS / 1000)
+        self.pending = np.zeros(0, dtype=np.float32)  # Pre-emphasized samples not yet in a complete frame
+        self.previous = None  # Last raw sample, for pre-emphasis across chunk boundaries
+        self.coefficients = np.zeros((0, N_MFCC), dtype=np.float32)
+        self.samples = 0
+
+    @property
+    def seconds(self):
+        return self.samples / self.rate
+
+    def add(self, samples):
+        signal = np.asarray(samples, dtype=np.float32) / 32768
+        if not len(signal):
+            return
+        self.samples += len(signal)
+        emphasized = signal.copy()
+        emphasized[1:] -= PRE_EMPHASIS * signal[:-1]
+        if self.previous is not None:
+            emphasized[0] -= PRE_EMPHASIS * self.previous
+        self.previous = signal[-1]
+
+        buffer = np.concatenate((self.pending, emphasized))
+        if len(buffer) < self.frame_length:
+            self.pending = buffer
+            return
+        count = (len(buffer) - self.frame_length) // self.hop + 1
+        frames = np.lib.stride_tricks.sliding_window_view(buffer, self.frame_length)[::self.hop][:count]
+        self.coefficients = np.concatenate((self.coefficients, frame_mfcc(frames, self.rate)))
+        self.pending = buffer[count * self.hop:]
+
+    def embedding(self):
+        return embedding_from_mfcc(self.coefficients)
+
+
+class StreamingVerifier:
+    """
+    Accept or reject a speaker as soon as the evidence is clear, instead of after a fixed recording.
+
+    identify is a function from an embedding to (user_id, similarity), such as
+    VoiceProfileStore.identify. Once min_seconds of speech have arrived, each
+    feed() rescores the incremental embedding: a similarity margin above the
+    threshold accepts, margin below rejects, and at max_seconds the plain
+    threshold decides.
+    """
+
+    def __init__(self, identify, threshold=MATCH_THRESHOLD, margin=0.05, min_seconds=0.8, max_seconds=5.0,
+                 rate=RATE):
+        self.identify = identify
+        self.threshold = threshold
+        self.margin = margin
+        self.min_seconds = min_seconds
+        self.max_seconds = max_seconds
+        self.features = IncrementalEmbedding(rate)
+        self.decision = None  # True or False once decided
+        self.user_id = None
+        self.score = 0.0
+
+    @property
+    def seconds(self):
+        return self.features.seconds
+
+    def feed(self, samples):
+        """
+        Add speech samples and return the decision so far (None while undecided).
+        """
+        if self.decision is not None:
+            return self.decision
+        self.features.add(samples)
+        if self.seconds < self.min_seconds:
+            return None
+        self._score()
+        if self.score >= self.threshold + self.margin and self.user_id is not None:
+            self.decision = True
+        elif self.score <= self.threshold - self.margin:
+            self.decision = False
+        elif self.seconds >= self.max_seconds:
+            self.decision = self.user_id is not None and self.score >= self.threshold
+        return self.decision
+
+    def finish(self):
+        """
+        Decide on whatever audio has arrived; used when the speaker stops before a decision.
+        """
+        if self.decision is None:
+            self._score()
+            self.decision = self.user_id is not None and self.score >= self.threshold
+        return self.decision
+
+    def _score(self):
+        embedding = self.features.embedding()
+        if embedding is None:
+            self.user_id, self.score = None, 0.0
+        else:
+            self.user_id, self.score = self.identify(embedding)
@@ -3,26 +3,68 @@ import os
 import sys
 sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))  
 
-from Core.VoiceRecognition.voice_auth_integration import authenticate_and_process
+from Core.VoiceRecognition.voice_session import VoiceSession
+from Core.VoiceRecognition.audio_input import AudioInputService, BufferStream, SAMPLE_WIDTH
+from Core.VoiceRecognition.vad import NoiseFloorTracker, VoiceActivityDetector
+from Core.VoiceRecognition.stt_backends import BackendError, get_backend, recognize_utterance
+
+
+class BufferedMicrophone(sr.AudioSource):
+    """
+    speech_recognition audio source backed by the shared AudioInputService.
+
+    Entering the context only creates a reader on the already open device, so
+    there is no device open/close per command.
+    """
+
+    def __init__(self, service=None):
+        self.service = service or AudioInputService.shared()
+        self.SAMPLE_RATE = self.service.rate
+        self.SAMPLE_WIDTH = SAMPLE_WIDTH
+        self.CHUNK = self.service.chunk
+        self.stream = None
+
+    def __enter__(self):
+        self.stream = BufferStream(self.service.reader())
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stream = None
 
 
 class ConvertSpeechToText:
-    def __init__(self, command_executor):
+    def __init__(self, command_executor, backend=None, on_partial=None, session=None):
         self.command_executor = command_executor
-        self.recognizer = sr.Recognizer()
-        self.microphone = sr.Microphone()
+        self.microphone = BufferedMicrophone()
+        # Calibrates from the first quiet frames it hears, then follows the noise level
+        self.vad = VoiceActivityDetector(self.microphone.SAMPLE_RATE, noise_tracker=NoiseFloorTracker())
+        # Selected by APP_CONFIG["stt_backend"] unless one is passed in
+        self.backend = backend or get_backend(rate=self.microphone.SAMPLE_RATE)
+        self.on_partial = on_partial  # Called with partial transcripts while the user is speaking
+        # The speaker is verified on the command audio itself, then trusted for the session TTL
+        self.session = session or VoiceSession()
 
     def listen_and_recognize(self):
+        verification = []
         try:
             with self.microphone as source:
                 print("Listening...")
-                authenticate_and_process()
-                audio = self.recognizer.listen(source, timeout=20)
-            return self.recognizer.recognize_google(audio)
+                # Verification of the finished segment runs while the backend produces the transcript
+                command = recognize_utterance(source.stream.reader, self.vad, self.backend,
+                                              source.CHUNK, timeout=20, on_partial=self.on_partial,
+                                              on_segment=lambda segment: verification.append(
+                                                  self.session.verify(segment)))
+            if command is None:
+                raise sr.WaitTimeoutError("No speech detected")
+            verified = verification[0].result() if verification else self.session.active
+            if not verified:
+                print("Voice not recognized; ignoring the command.")
+                return None
+            return command or None
         except sr.WaitTimeoutError:
             print("Timeout occurred while listening.")
             return None
-        except sr.RequestError as e:
+        except BackendError as e:
             print(f"Could not request results; {e}")
             return None
         # except KeyboardInterrupt:
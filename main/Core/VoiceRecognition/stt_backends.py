@@ -0,0 +1,187 @@
+import json
+import os
+import sys
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+from Config.config import APP_CONFIG
+from Core.VoiceRecognition.vad import read_wav
+
+SAMPLE_WIDTH = 2  # Bytes per int16 sample
+
+
+class BackendError(Exception):
+    """Raised when a speech-to-text engine cannot be reached or fails."""
+
+
+class RecognizerBackend:
+    """
+    Speech-to-text engine interface.
+
+    Audio is pushed with accept() while the user is still speaking; streaming
+    engines return a partial hypothesis from each call, others return None.
+    finish() returns the final transcript ("" when nothing was understood).
+    """
+
+    streaming = False
+
+    def __init__(self, rate=16000):
+        self.rate = rate
+
+    def start(self):
+        """Begin a new utterance."""
+
+    def accept(self, samples):
+        """Add int16 samples; return the current partial transcript or None."""
+        return None
+
+    def finish(self):
+        """End the utterance and return the final transcript."""
+        raise NotImplementedError
+
+    def transcribe(self, samples):
+        """Recognize a complete utterance in one call."""
+        self.start()
+        self.accept(samples)
+        return self.finish()
+
+
+class GoogleBackend(RecognizerBackend):
+    """
+    Google Web Speech API through speech_recognition: one network request per utterance, no partials.
+    """
+
+    def __init__(self, rate=16000):
+        super().__init__(rate)
+        import speech_recognition as sr
+        self.sr = sr
+        self.recognizer = sr.Recognizer()
+        self.chunks = []
+
+    def start(self):
+        self.chunks = []
+
+    def accept(self, samples):
+        self.chunks.append(np.asarray(samples, dtype=np.int16).tobytes())
+        return None
+
+    def finish(self):
+        audio = self.sr.AudioData(b''.join(self.chunks), self.rate, SAMPLE_WIDTH)
+        self.chunks = []
+        try:
+            return self.recognizer.recognize_google(audio)
+        except self.sr.UnknownValueError:
+            return ""
+        except self.sr.RequestError as e:
+            raise BackendError(f"Speech service unavailable: {e}")
+
+
+class VoskBackend(RecognizerBackend):
+    """
+    Offline CPU recognition with Vosk (Kaldi), streaming partial hypotheses as audio arrives.
+    """
+
+    streaming = True
+
+    def __init__(self, rate=16000, model_path=None):
+        super().__init__(rate)
+        import vosk
+        model_path = model_path or APP_CONFIG["vosk_model_path"]
+        if not os.path.isdir(model_path):
+            raise BackendError(f"Vosk model not found at {model_path}")
+        self.vosk = vosk
+        self.model = vosk.Model(model_path)
+        self.recognizer = None
+        self.committed = []  # Text of segments Vosk has already finalized within the utterance
+
+    def start(self):
+        self.recognizer = self.vosk.KaldiRecognizer(self.model, self.rate)
+        self.committed = []
+
+    def accept(self, samples):
+        if self.recognizer.AcceptWaveform(np.asarray(samples, dtype=np.int16).tobytes()):
+            text = json.loads(self.recognizer.Result()).get("text", "")
+            if text:
+                self.committed.append(text)
+            return " ".join(self.committed)
+        partial = json.loads(self.recognizer.PartialResult()).get("partial", "")
+        return " ".join(self.committed + ([partial] if partial else []))
+
+    def finish(self):
+        text = json.loads(self.recognizer.FinalResult()).get("text", "")
+        return " ".join(self.committed + ([text] if text else []))
+
+
+BACKENDS = {
+    "google": GoogleBackend,
+    "vosk": VoskBackend,
+}
+
+
+def get_backend(name=None, rate=16000, **options):
+    """
+    Create the speech-to-text backend named in the config (APP_CONFIG["stt_backend"]) or by name.
+    """
+    name = name or APP_CONFIG.get("stt_backend", "google")
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown speech-to-text backend '{name}'. Choose from: {', '.join(BACKENDS)}")
+    return BACKENDS[name](rate=rate, **options)
+
+
+def recognize_utterance(reader, vad, backend, chunk=1024, timeout=None, on_partial=None, on_segment=None):
+    """
+    Stream one utterance from an audio reader into the backend and return the final transcript.
+
+    Audio is handed to the backend from speech onset (including the VAD's
+    pre-roll padding) until the VAD detects trailing silence, so streaming
+    engines decode while the user is still talking; on_partial is called with
+    every new partial hypothesis. on_segment is called with the complete
+    utterance audio just before the final transcript is requested, so work
+    such as speaker verification overlaps with recognition. Returns None if no
+    speech starts within timeout seconds.
+    """
+    vad.reset()
+    backend.start()
+    streaming = False
+    read = 0
+    last_partial = None
+    while True:
+        samples = reader.read(chunk, timeout=5)
+        if samples is None:
+            return backend.finish() if streaming else None
+        read += len(samples)
+        segments = vad.feed(samples)
+
+        partial = None
+        if streaming:
+            partial = backend.accept(samples)
+        elif vad.in_speech or segments:
+            streaming = True
+            # Onset: hand over what the VAD has gathered so far, padding included
+            head = segments[0] if segments else np.concatenate(vad.utterance + [vad.pending])
+            partial = backend.accept(head)
+
+        if partial and partial != last_partial and on_partial:
+            on_partial(partial)
+        last_partial = partial or last_partial
+
+        if segments:
+            if on_segment:
+                on_segment(segments[0])
+            return backend.finish()
+        if timeout is not None and not streaming and read >= timeout * vad.rate:
+            return None
+
+
+def transcribe_wav(path, backend=None, chunk=4000, on_partial=None):
+    """
+    Feed a WAV file to a backend chunk by chunk, as if it were live audio, and return the transcript.
+    """
+    samples, rate = read_wav(path)
+    backend = backend or get_backend(rate=rate)
+    backend.start()
+    for start in range(0, len(samples), chunk):
+        partial = backend.accept(samples[start:start + chunk])
+        if partial and on_partial:
+            on_partial(partial)
+    return backend.finish()
@@ -0,0 +1,99 @@
+from collections import deque
+
+
+class SynonymMatcher:
+    """
+    Aho-Corasick automaton over every synonym in a synonym map.
+
+    The automaton is compiled once from the map and then finds all synonym
+    occurrences in a single left-to-right pass over the utterance, so the
+    per-utterance cost does not grow with the size of the vocabulary.
+    """
+
+    def __init__(self, synonym_map):
+        # Trie stored as parallel lists indexed by state number
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [[]]
+        # Registration order of each action, used to break ties between equal-length hits
+        self.action_order = {}
+
+        for action, synonyms in synonym_map.items():
+            self.action_order.setdefault(action, len(self.action_order))
+            for synonym in synonyms:
+                self._add(synonym.lower(), action)
+        self._build_failure_links()
+
+    def _add(self, synonym, action):
+        """
+        Insert a synonym into the trie.
+        """
+        if not synonym:
+            return
+        state = 0
+        for char in synonym:
+            next_state = self.goto[state].get(char)
+            if next_state is None:
+                next_state = len(self.goto)
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append([])
+                self.goto[state][char] = next_state
+            state = next_state
+        self.output[state].append((synonym, action))
+
+    def _build_failure_links(self):
+        """
+        Breadth-first pass that links every state to its longest proper suffix state.
+        """
+        pending = deque()
+        for state in self.goto[0].values():
+            self.fail[state] = 0
+            pending.append(state)
+
+        while pending:
+            state = pending.popleft()
+            for char, next_state in self.goto[state].items():
+                pending.append(next_state)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[next_state] = self.goto[fallback].get(char, 0)
+                # Inherit the matches of the suffix state so each hit is reported once per position
+                self.output[next_state] = self.output[next_state] + self.output[self.fail[next_state]]
+
+    def find_all(self, text):
+        """
+        Return every (synonym, action, start, end) occurrence in the text.
+        """
+        hits = []
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(char, 0)
+            for synonym, action in self.output[state]:
+                end = index + 1
+                hits.append((synonym, action, end - len(synonym), end))
+        return hits
+
+    def best_match(self, text):
+        """
+        Return the best (synonym, action, start, end) hit, or None.
+
+        Only hits on word boundaries count, so "start" does not match inside
+        "restart". The earliest hit wins, since the command verb leads the
+        utterance ("open screenshot folder" is open, not take_screenshot);
+        among the hits overlapping it the longest wins ("delete file" over
+        "delete"), then the action registered first.
+        """
+        hits = [hit for hit in self.find_all(text) if self._on_word_boundaries(text, hit[2], hit[3])]
+        if not hits:
+            return None
+        first_end = min(hits, key=lambda hit: (hit[2], -len(hit[0])))[3]
+        overlapping = [hit for hit in hits if hit[2] < first_end]
+        return min(overlapping, key=lambda hit: (-len(hit[0]), self.action_order[hit[1]], hit[2]))
+
+    @staticmethod
+    def _on_word_boundaries(text, start, end):
+        return (start == 0 or not text[start - 1].isalnum()) and (end == len(text) or not text[end].isalnum())
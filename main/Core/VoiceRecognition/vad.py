@@ -0,0 +1,278 @@
+import collections
+import logging
+import wave
+import numpy as np
+
+RATE = 16000
+
+
+def read_wav(path):
+    """
+    Read a mono 16-bit WAV file into (int16 samples, sample rate).
+    """
+    with wave.open(path, 'rb') as wf:
+        if wf.getsampwidth() != 2:
+            raise ValueError(f"{path}: expected 16-bit samples, got {wf.getsampwidth() * 8}-bit")
+        samples = np.frombuffer(wf.readframes(wf.getnframes()), dtype=np.int16)
+        if wf.getnchannels() > 1:
+            samples = samples.reshape(-1, wf.getnchannels())[:, 0]
+        return samples, wf.getframerate()
+
+
+def frame_features(samples, frame_length):
+    """
+    Per-frame RMS energy and zero-crossing rate of non-overlapping frames, vectorized.
+
+    Trailing samples that do not fill a whole frame are ignored.
+    """
+    frame_count = len(samples) // frame_length
+    return frames_features(np.asarray(samples[:frame_count * frame_length]).reshape(frame_count, frame_length))
+
+
+def frames_features(frames):
+    """
+    RMS energy and zero-crossing rate of each row of a (frames x samples) array.
+    """
+    frames = frames.astype(np.float32)
+    energy = np.sqrt(np.mean(frames * frames, axis=1))
+    signs = np.signbit(frames)
+    zero_crossing_rate = np.mean(signs[:, 1:] != signs[:, :-1], axis=1)
+    return energy, zero_crossing_rate
+
+
+class NoiseFloorTracker:
+    """
+    Running estimate of the background noise level that sets the VAD's energy threshold.
+
+    calibrate() measures the floor once from ambient audio. After that, update()
+    folds the energy of every non-speech frame into an exponential moving
+    average, so the estimate follows the room without dedicated listening time.
+    The threshold handed to the VAD is only re-derived when the tracked floor
+    drifts by more than drift_ratio from the floor it was last derived from.
+    """
+
+    def __init__(self, margin=3.0, min_threshold=150, smoothing=0.02, drift_ratio=1.5, stale_frames=330):
+        self.margin = margin
+        self.min_threshold = min_threshold
+        self.smoothing = smoothing
+        self.drift_ratio = drift_ratio
+        self.floor = None  # Tracked noise RMS
+        self.reference = None  # Floor the current threshold was derived from
+        self.recalibrations = 0
+        # Recent frame energies, used if the noise rises above the threshold and no frame looks silent
+        self.recent = collections.deque(maxlen=stale_frames)
+        self.frames_since_silence = 0
+
+    @property
+    def calibrated(self):
+        return self.floor is not None
+
+    @property
+    def threshold(self):
+        return max(self.min_threshold, self.reference * self.margin)
+
+    def calibrate(self, samples, frame_length):
+        """
+        Set the noise floor from a stretch of ambient (non-speech) audio and return the threshold.
+        """
+        return self._calibrate_from(frame_features(samples, frame_length)[0])
+
+    def _calibrate_from(self, energy):
+        self.floor = self.reference = max(1.0, float(np.median(energy)))
+        self.frames_since_silence = 0
+        return self.threshold
+
+    def update(self, energy, speech):
+        """
+        Fold per-frame energies and speech decisions into the estimate and return the threshold.
+        """
+        if not self.calibrated:
+            quiet = energy[~speech]
+            return self._calibrate_from(quiet) if len(quiet) else None
+
+        self.recent.extend(energy)
+        quiet = energy[~speech]
+        if len(quiet):
+            # Vectorized exponential moving average over the quiet frames, oldest first
+            decay = (1 - self.smoothing) ** np.arange(len(quiet) - 1, -1, -1)
+            self.floor = float(self.floor * (1 - self.smoothing) ** len(quiet)
+                               + self.smoothing * np.dot(decay, quiet))
+            self.frames_since_silence = 0
+        else:
+            self.frames_since_silence += len(energy)
+            if self.frames_since_silence >= self.recent.maxlen:
+                # Nothing has looked silent for a while: the noise itself is above the threshold
+                self.floor = float(np.percentile(self.recent, 10))
+                self.frames_since_silence = 0
+
+        self.floor = max(1.0, self.floor)
+        if max(self.floor / self.reference, self.reference / self.floor) > self.drift_ratio:
+            logging.info(f"Noise floor drifted from {self.reference:.0f} to {self.floor:.0f} RMS, recalibrating")
+            self.reference = self.floor
+            self.recalibrations += 1
+        return self.threshold
+
+
+class VoiceActivityDetector:
+    """
+    Frame-level voice activity detection over a stream of int16 samples.
+
+    A frame is speech when its RMS energy exceeds energy_threshold, or when it is
+    at least half that loud with a high zero-crossing rate (unvoiced consonants
+    such as "s" and "f"). feed() returns every utterance completed by the new
+    samples as soon as trailing_silence_ms of silence follows it, with leading
+    and trailing silence trimmed to padding_ms.
+
+    With a NoiseFloorTracker, energy_threshold follows the background noise level.
+    """
+
+    def __init__(self, rate=RATE, frame_ms=30, energy_threshold=300, zcr_threshold=0.25,
+                 min_speech_ms=120, trailing_silence_ms=400, padding_ms=150, max_utterance_s=15,
+                 noise_tracker=None):
+        self.rate = rate
+        self.frame_length = int(rate * frame_ms / 1000)
+        self.noise_tracker = noise_tracker
+        self.energy_threshold = noise_tracker.threshold if noise_tracker and noise_tracker.calibrated \
+            else energy_threshold
+        self.zcr_threshold = zcr_threshold
+        self.min_speech_frames = max(1, min_speech_ms // frame_ms)
+        self.trailing_silence_frames = max(1, trailing_silence_ms // frame_ms)
+        self.padding_frames = padding_ms // frame_ms
+        self.max_utterance_frames = int(max_utterance_s * 1000 // frame_ms)
+        self.reset()
+
+    def reset(self):
+        self.pending = np.zeros(0, dtype=np.int16)  # Samples not yet filling a whole frame
+        self.pre_roll = collections.deque(maxlen=self.padding_frames or 1)
+        self.utterance = []  # Frames of the utterance in progress
+        self.speech_frames = 0
+        self.silence_run = 0
+
+    @property
+    def in_speech(self):
+        return bool(self.utterance)
+
+    def is_speech(self, energy, zero_crossing_rate):
+        """
+        Vectorized speech/non-speech decision for arrays of frame features.
+        """
+        return (energy > self.energy_threshold) | \
+            ((energy > self.energy_threshold / 2) & (zero_crossing_rate > self.zcr_threshold))
+
+    def feed(self, samples):
+        """
+        Add samples and return the list of utterances (int16 arrays) they completed.
+        """
+        samples = np.concatenate((self.pending, samples)) if len(self.pending) else np.asarray(samples)
+        frame_count = len(samples) // self.frame_length
+        self.pending = samples[frame_count * self.frame_length:].copy()
+        if not frame_count:
+            return []
+
+        # Copied because the utterance outlives the caller's buffer (e.g. a ring buffer view)
+        frames = samples[:frame_count * self.frame_length].reshape(frame_count, self.frame_length).copy()
+        energy, zero_crossing_rate = frames_features(frames)
+        decisions = self.is_speech(energy, zero_crossing_rate)
+        if self.noise_tracker:
+            self.energy_threshold = self.noise_tracker.update(energy, decisions) or self.energy_threshold
+
+        segments = []
+        for frame, speech in zip(frames, decisions):
+            segment = self._step(frame, speech)
+            if segment is not None:
+                segments.append(segment)
+        return segments
+
+    def _step(self, frame, speech):
+        if not self.utterance:
+            if speech:
+                # Speech onset: start the utterance with the padding that preceded it
+                self.utterance = list(self.pre_roll) + [frame]
+                self.speech_frames = 1
+                self.silence_run = 0
+            elif self.padding_frames:
+                self.pre_roll.append(frame)
+            return None
+
+        self.utterance.append(frame)
+        if speech:
+            self.speech_frames += 1
+            self.silence_run = 0
+        else:
+            self.silence_run += 1
+
+        if self.silence_run >= self.trailing_silence_frames or len(self.utterance) >= self.max_utterance_frames:
+            return self._finish()
+        return None
+
+    def _finish(self):
+        # Keep padding_frames of the trailing silence, drop the rest
+        keep = len(self.utterance) - max(0, self.silence_run - self.padding_frames)
+        frames, speech_frames = self.utterance[:keep], self.speech_frames
+        self.utterance = []
+        self.speech_frames = 0
+        self.silence_run = 0
+        self.pre_roll.clear()
+        if speech_frames < self.min_speech_frames:
+            return None  # Too short to be speech (a click or a bump)
+        return np.concatenate(frames)
+
+    def flush(self):
+        """
+        End the stream and return the utterance in progress, if any.
+        """
+        segment = self._finish() if self.utterance else None
+        self.pending = np.zeros(0, dtype=np.int16)
+        return segment
+
+
+def trim_silence(samples, rate=RATE, **vad_options):
+    """
+    Return samples with leading and trailing silence removed (keeping the VAD's padding).
+    """
+    vad = VoiceActivityDetector(rate, **vad_options)
+    energy, zero_crossing_rate = frame_features(samples, vad.frame_length)
+    speech = np.flatnonzero(vad.is_speech(energy, zero_crossing_rate))
+    if not len(speech):
+        return samples[:0]
+    start = max(0, speech[0] - vad.padding_frames) * vad.frame_length
+    end = min(len(energy), speech[-1] + 1 + vad.padding_frames) * vad.frame_length
+    return samples[start:end]
+
+
+def capture_utterance(reader, vad, chunk=1024, timeout=None, max_seconds=None):
+    """
+    Read from an audio reader until the VAD completes one utterance and return it.
+
+    Returns None if no speech starts within timeout seconds. With max_seconds the
+    utterance in progress is returned once that much audio has been read.
+    """
+    vad.reset()
+    read = 0
+    while True:
+        samples = reader.read(chunk, timeout=5)
+        if samples is None:
+            return vad.flush()  # The audio source stopped delivering
+        read += len(samples)
+        segments = vad.feed(samples)
+        if segments:
+            return segments[0]
+        if timeout is not None and not vad.in_speech and read >= timeout * vad.rate:
+            return None
+        if max_seconds is not None and read >= max_seconds * vad.rate:
+            return vad.flush()
+
+
+def segments_from_wav(path, vad=None, chunk=1024):
+    """
+    Stream a WAV file through the VAD chunk by chunk and return every utterance found.
+    """
+    samples, rate = read_wav(path)
+    vad = vad or VoiceActivityDetector(rate)
+    segments = []
+    for start in range(0, len(samples), chunk):
+        segments.extend(vad.feed(samples[start:start + chunk]))
+    final = vad.flush()
+    if final is not None:
+        segments.append(final)
+    return segments
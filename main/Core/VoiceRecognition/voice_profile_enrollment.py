@@ -1,52 +1,58 @@
 import os
+import sys
 import wave
-import pyaudio
 import numpy as np
 
-VOICE_PROFILE_DIR = "Core/VoiceRecognition/profiles"
-PROFILE_FILENAME = "user_voice_profile.npy"
-
-def record_voice(duration=5, filename=PROFILE_FILENAME):
-    """Record the user's voice for a given duration and save it as a profile."""
-    if not os.path.exists(VOICE_PROFILE_DIR):
-        os.makedirs(VOICE_PROFILE_DIR)
-
-    filepath = os.path.join(VOICE_PROFILE_DIR, filename)
-    CHUNK = 1024
-    FORMAT = pyaudio.paInt16
-    CHANNELS = 1
-    RATE = 16000
-
-    audio = pyaudio.PyAudio()
-
-    print(f"Recording for {duration} seconds. Please speak clearly...")
-    stream = audio.open(format=FORMAT, channels=CHANNELS,
-                        rate=RATE, input=True,
-                        frames_per_buffer=CHUNK)
-
-    frames = []
-
-    for _ in range(0, int(RATE / CHUNK * duration)):
-        data = stream.read(CHUNK)
-        frames.append(data)
+sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+from Core.VoiceRecognition.audio_input import AudioInputService, CHANNELS, SAMPLE_WIDTH
+from Core.VoiceRecognition.speaker_embedding import IncrementalEmbedding
+from Core.VoiceRecognition.vad import VoiceActivityDetector
+from Core.VoiceRecognition.voice_verification import DEFAULT_USER, VOICE_PROFILE_DIR, load_profile_store
+
+def record_voice(duration=5, user_id=DEFAULT_USER, speech_seconds=3):
+    """
+    Record the user's voice and enroll it in the profile store.
+
+    The embedding is built while recording, and recording stops once speech_seconds
+    of speech have been heard or after duration seconds.
+    """
+    store = load_profile_store()
+    filepath = os.path.join(VOICE_PROFILE_DIR, f"{user_id}.wav")
+    service = AudioInputService.shared()
+    reader = service.reader()
+    vad = VoiceActivityDetector(service.rate)
+    features = IncrementalEmbedding(service.rate)
+
+    print(f"Recording for up to {duration} seconds. Please speak clearly...")
+    chunks = []
+    read = 0
+    while read < duration * service.rate and features.seconds < speech_seconds:
+        samples = reader.read(service.chunk, timeout=5)
+        if samples is None:
+            break
+        chunks.append(samples.copy())  # Kept for the WAV; the reader's view is reused by the ring buffer
+        read += len(samples)
+        vad.feed(samples)
+        if vad.in_speech:
+            features.add(samples)
+    audio_data = np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.int16)
 
     print("Recording complete. Saving voice profile...")
 
-    stream.stop_stream()
-    stream.close()
-    audio.terminate()
-
     # Save raw audio
-    with wave.open(filepath.replace(".npy", ".wav"), 'wb') as wf:
+    with wave.open(filepath, 'wb') as wf:
         wf.setnchannels(CHANNELS)
-        wf.setsampwidth(audio.get_sample_size(FORMAT))
-        wf.setframerate(RATE)
-        wf.writeframes(b''.join(frames))
-
-    # Convert to numpy array for verification use
-    audio_data = np.frombuffer(b''.join(frames), dtype=np.int16)
-    np.save(filepath, audio_data)
-    print(f"Voice profile saved at {filepath}.")
+        wf.setsampwidth(SAMPLE_WIDTH)
+        wf.setframerate(service.rate)
+        wf.writeframes(audio_data.tobytes())
+
+    # Store the compact speaker embedding for verification use
+    profile = features.embedding()
+    if profile is None:
+        print("Recording too short to create a voice profile. Please try again.")
+        return
+    store.enroll(user_id, profile)
+    print(f"Voice profile for '{user_id}' saved ({len(store)} users enrolled).")
 
 if __name__ == "__main__":
-    record_voice()
+    record_voice(user_id=sys.argv[1] if len(sys.argv) > 1 else DEFAULT_USER)
@@ -0,0 +1,67 @@
+import logging
+import os
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+from Config.config import APP_CONFIG
+
+
+class VoiceSession:
+    """
+    Speaker verification that lasts for a session instead of a single command.
+
+    verify() checks the audio segment a command was spoken in on a worker
+    thread, so it runs while the speech-to-text backend is still transcribing.
+    Once the speaker is verified, the session stays valid for ttl seconds and
+    later commands skip verification entirely.
+    """
+
+    def __init__(self, ttl=None, verifier=None, clock=time.monotonic):
+        if verifier is None:
+            # Imported here so the session can be used without an audio device (e.g. in tests)
+            from Core.VoiceRecognition.voice_verification import verify_samples
+            verifier = verify_samples
+        self.ttl = APP_CONFIG.get("voice_session_ttl", 300) if ttl is None else ttl
+        self.verifier = verifier
+        self.clock = clock
+        self.verified_until = 0.0
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="voice-verification")
+
+    @property
+    def active(self):
+        return self.clock() < self.verified_until
+
+    def verify(self, samples):
+        """
+        Start verifying a speech segment and return a Future that resolves to True or False.
+
+        While the session is active the Future is already resolved to True.
+        """
+        if self.active:
+            future = Future()
+            future.set_result(True)
+            return future
+        return self.executor.submit(self._verify, samples)
+
+    def _verify(self, samples):
+        try:
+            verified, similarity = self.verifier(samples)
+        except Exception as e:
+            logging.error(f"Voice verification failed with an error: {e}")
+            return False
+        logging.info(f"Voice verification similarity {similarity:.2f}")
+        if verified:
+            with self.lock:
+                self.verified_until = self.clock() + self.ttl
+        return verified
+
+    def end(self):
+        """
+        Close the session so the next command is verified again.
+        """
+        with self.lock:
+            self.verified_until = 0.0
@@ -1,59 +1,113 @@
 import os
+import sys
 import numpy as np
-from scipy.spatial.distance import cosine
-import wave
-import pyaudio
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+from Config.config import APP_CONFIG
+from Core.VoiceRecognition.audio_input import AudioInputService
+from Core.VoiceRecognition.vad import VoiceActivityDetector
+from Core.VoiceRecognition.speaker_embedding import (EMBEDDING_SIZE, MATCH_THRESHOLD, StreamingVerifier, similarity,
+                                                     speaker_embedding)
+from Core.VoiceRecognition.profile_store import VoiceProfileStore
 
 VOICE_PROFILE_DIR = "Core/VoiceRecognition/profiles"
-PROFILE_FILENAME = "user_voice_profile.npy"
-THRESHOLD = 0.3  # Adjust threshold based on testing
+PROFILE_FILENAME = "user_voice_profile.npy"  # Single-user profile from before the profile store
+DEFAULT_USER = "default"
+THRESHOLD = MATCH_THRESHOLD
+
+_store = None
 
 def load_voice_profile(filename=PROFILE_FILENAME):
-    """Load the saved voice profile."""
+    """Load the saved voice profile (a speaker embedding)."""
     filepath = os.path.join(VOICE_PROFILE_DIR, filename)
     if not os.path.exists(filepath):
         raise FileNotFoundError("Voice profile not found. Please create one first.")
-    return np.load(filepath)
+    profile = np.load(filepath)
+    if profile.shape != (EMBEDDING_SIZE,):
+        # Profiles enrolled before embeddings hold the raw waveform; convert and save the compact form
+        profile = speaker_embedding(profile)
+        if profile is None:
+            raise ValueError("Voice profile is too short. Please create a new one.")
+        np.save(filepath, profile)
+        print(f"Converted voice profile at {filepath} to a speaker embedding.")
+    return profile
+
+def load_profile_store():
+    """
+    Open the store of enrolled users, importing a legacy single-user profile on first use.
+    """
+    global _store
+    if _store is None:
+        _store = VoiceProfileStore(VOICE_PROFILE_DIR)
+        if not len(_store) and os.path.exists(os.path.join(VOICE_PROFILE_DIR, PROFILE_FILENAME)):
+            _store.enroll(DEFAULT_USER, load_voice_profile())
+            print(f"Imported the existing voice profile as user '{DEFAULT_USER}'.")
+    return _store
 
-def record_for_verification(duration=5):
-    """Record a new voice sample for verification."""
-    CHUNK = 1024
-    FORMAT = pyaudio.paInt16
-    CHANNELS = 1
-    RATE = 16000
+def identify_speaker(samples, store=None):
+    """
+    Return (user_id, similarity) of the enrolled user speaking in the samples; user_id is None if nobody matches.
+    """
+    store = store or load_profile_store()
+    sample_embedding = speaker_embedding(samples)
+    if sample_embedding is None:
+        return None, 0.0  # Too little speech to compare
+    return store.identify(sample_embedding, THRESHOLD)
 
-    audio = pyaudio.PyAudio()
+def record_for_verification(duration=None, min_duration=None):
+    """
+    Stream speech into a StreamingVerifier until it accepts or rejects the speaker, and return the verifier.
 
-    print(f"Recording for verification ({duration} seconds). Please speak clearly...")
-    stream = audio.open(format=FORMAT, channels=CHANNELS,
-                        rate=RATE, input=True,
-                        frames_per_buffer=CHUNK)
+    Most speakers are decided after about a second of speech; duration caps the wait.
+    """
+    duration = duration or APP_CONFIG.get("verification_max_seconds", 5)
+    min_duration = min_duration or APP_CONFIG.get("verification_min_seconds", 0.8)
+    service = AudioInputService.shared()
+    reader = service.reader()
+    vad = VoiceActivityDetector(service.rate)
+    verifier = StreamingVerifier(load_profile_store().identify, THRESHOLD, min_seconds=min_duration,
+                                 max_seconds=duration, rate=service.rate)
+    print(f"Recording for verification (up to {duration} seconds). Please speak clearly...")
+    read = 0
+    while verifier.decision is None and read < duration * service.rate:
+        samples = reader.read(service.chunk, timeout=5)
+        if samples is None:
+            break
+        read += len(samples)
+        vad.feed(samples)
+        if vad.in_speech:
+            verifier.feed(samples)  # Only speech counts towards the decision
+    verifier.finish()
+    print(f"Recording complete after {read / service.rate:.1f} seconds.")
+    return verifier
 
-    frames = []
-    for _ in range(0, int(RATE / CHUNK * duration)):
-        data = stream.read(CHUNK)
-        frames.append(data)
+def verify_samples(samples, profile=None):
+    """
+    Check int16 speech samples against the enrolled users (or one given profile) and return (verified, similarity).
 
-    print("Recording complete.")
-    stream.stop_stream()
-    stream.close()
-    audio.terminate()
+    Used directly on the audio a command was spoken in, so no separate sample has to be recorded.
+    """
+    if profile is None:
+        user_id, score = identify_speaker(samples)
+        return user_id is not None, score
 
-    audio_data = np.frombuffer(b''.join(frames), dtype=np.int16)
-    return audio_data
+    sample_embedding = speaker_embedding(samples)
+    if sample_embedding is None:
+        return False, 0.0  # Too little speech to compare
+
+    score = similarity(profile, sample_embedding)
+    return score >= THRESHOLD, score
 
 def verify_voice():
     """Verify the new voice sample against the saved profile."""
     try:
-        saved_profile = load_voice_profile()
-        new_sample = record_for_verification()
-
-        # Calculate cosine similarity
-        similarity = 1 - cosine(saved_profile, new_sample)
-        print(f"Similarity score: {similarity:.2f}")
+        if not len(load_profile_store()):
+            raise FileNotFoundError("Voice profile not found. Please create one first.")
+        verifier = record_for_verification()
+        print(f"Similarity score: {verifier.score:.2f}")
 
-        if similarity >= THRESHOLD:
-            print("Voice verified successfully!")
+        if verifier.decision:
+            print(f"Voice verified successfully! Welcome, {verifier.user_id}.")
             return True
         else:
             print("Voice verification failed.")
@@ -0,0 +1,163 @@
+import os
+import sys
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+from Config.config import APP_CONFIG
+from Core.VoiceRecognition.speaker_embedding import FRAME_MS, HOP_MS, RATE, mfcc
+from Core.VoiceRecognition.vad import read_wav, trim_silence
+
+
+def wake_word_features(samples, rate=RATE):
+    """
+    Per-frame features for keyword matching: MFCCs without c0, so loudness does not matter.
+    """
+    return mfcc(samples, rate)[:, 1:]
+
+
+def subsequence_dtw(template, sequence, end_tolerance=0.1):
+    """
+    Best alignment of the whole template against any stretch of the sequence.
+
+    Returns (distance per template frame, index of the sequence frame where the
+    match ends). A steady final sound aligns almost equally well at several
+    end frames, so the end is moved to the last of the consecutive frames
+    within end_tolerance of the best cost. Each row of the dynamic program is computed with NumPy:
+    moving along the sequence within a row is a running minimum over
+    cumulative costs, so there is no Python loop over frames of the sequence.
+    """
+    cost = np.sqrt(((template[:, None, :] - sequence[None, :, :]) ** 2).sum(axis=2))
+    previous = cost[0].copy()  # The match may start at any frame of the sequence
+    for row in cost[1:]:
+        diagonal = np.concatenate(([np.inf], previous[:-1]))
+        step = row + np.minimum(previous, diagonal)
+        cumulative = np.cumsum(row)
+        previous = cumulative + np.minimum.accumulate(step - cumulative)
+    best = int(np.argmin(previous))
+    outside = np.flatnonzero(previous[best:] > previous[best] * (1 + end_tolerance))
+    end = best + (outside[0] - 1 if len(outside) else len(previous) - 1 - best)
+    return float(previous[best] / len(template)), int(end)
+
+
+class WakeWordSpotter:
+    """
+    Template-matching keyword spotter for the wake word.
+
+    A few recordings of the user saying the wake word are kept as MFCC
+    templates; a speech segment contains the wake word when one template
+    aligns with its beginning (subsequence DTW) below threshold. Only the
+    first stretch of a segment, as long as the longest template allows, is
+    searched, so the cost per segment is bounded however long the speaker goes on.
+    """
+
+    def __init__(self, templates=(), threshold=None, rate=RATE, search_factor=1.5):
+        self.rate = rate
+        self.templates = [np.asarray(template, dtype=np.float32) for template in templates]
+        self.threshold = threshold
+        self.search_factor = search_factor
+        if self.threshold is None and len(self.templates) > 1:
+            self.threshold = self.calibrated_threshold()
+
+    def __bool__(self):
+        return bool(self.templates)
+
+    def add_example(self, samples):
+        """
+        Add a recording of the wake word as a template (silence is trimmed first).
+        """
+        self.templates.append(wake_word_features(trim_silence(samples, self.rate), self.rate))
+
+    def calibrated_threshold(self, factor=1.3):
+        """
+        Threshold just above the distance between the user's own examples.
+        """
+        if len(self.templates) < 2:
+            raise ValueError("Calibrating the wake word threshold needs at least two examples; record at least two")
+        distances = [subsequence_dtw(a, b)[0] for i, a in enumerate(self.templates)
+                     for j, b in enumerate(self.templates) if i != j]
+        return factor * max(distances)
+
+    def score(self, samples):
+        """
+        Return (distance of the best template, sample offset where the wake word ends).
+        """
+        features = wake_word_features(samples, self.rate)
+        longest = max(len(template) for template in self.templates)
+        features = features[:int(longest * self.search_factor)]
+        if len(features) < min(len(template) for template in self.templates) // 2:
+            return np.inf, 0  # Far too short to contain the wake word
+        distance, end = min(subsequence_dtw(template, features) for template in self.templates)
+        hop, frame_length = int(self.rate * HOP_MS / 1000), int(self.rate * FRAME_MS / 1000)
+        return distance, min(len(samples), end * hop + frame_length)
+
+    def detect(self, samples):
+        """
+        Sample offset just after the wake word if the segment starts with it, otherwise None.
+        """
+        if self.threshold is None:
+            raise ValueError("Wake word threshold not set; record at least two examples")
+        distance, end = self.score(samples)
+        return end if distance <= self.threshold else None
+
+    def save(self, path):
+        """
+        Save the templates and threshold for load(). A spotter without a threshold cannot be saved.
+        """
+        if self.threshold is None:
+            raise ValueError("Wake word threshold not set; record at least two examples or pass a threshold")
+        np.savez(path, *self.templates, threshold=float(self.threshold))
+
+    @classmethod
+    def load(cls, path=None, rate=RATE):
+        """
+        Load templates saved with save(), or an empty (disabled) spotter if there are none.
+        """
+        path = path or APP_CONFIG.get("wake_word_templates")
+        if not path or not os.path.exists(path):
+            return cls(rate=rate)
+        with np.load(path) as data:
+            templates = [data[f"arr_{i}"] for i in range(len(data.files) - 1)]
+            threshold = APP_CONFIG.get("wake_word_threshold") or float(data["threshold"])
+        return cls(templates, threshold, rate)
+
+    @classmethod
+    def from_wavs(cls, paths, threshold=None):
+        """
+        Build a spotter from WAV recordings of the wake word.
+        """
+        spotter = cls()
+        for path in paths:
+            samples, rate = read_wav(path)
+            spotter.rate = rate
+            spotter.add_example(samples)
+        if threshold is None and len(spotter.templates) > 1:
+            threshold = spotter.calibrated_threshold()
+        spotter.threshold = threshold
+        return spotter
+
+
+def record_wake_word(count=3, path=None):
+    """
+    Record the user saying the wake word a few times and save the templates.
+    """
+    from Core.VoiceRecognition.audio_input import AudioInputService
+    from Core.VoiceRecognition.vad import VoiceActivityDetector, capture_utterance
+
+    service = AudioInputService.shared()
+    spotter = WakeWordSpotter(rate=service.rate)
+    wake_word = APP_CONFIG.get("wake_word", "asvatha").capitalize()
+    while len(spotter.templates) < count:
+        print(f"Say '{wake_word}' ({len(spotter.templates) + 1}/{count})...")
+        segment = capture_utterance(service.reader(), VoiceActivityDetector(service.rate), service.chunk,
+                                    timeout=5, max_seconds=3)
+        if segment is not None:
+            spotter.add_example(segment)
+    spotter.threshold = spotter.calibrated_threshold()
+    path = path or APP_CONFIG["wake_word_templates"]
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    spotter.save(path)
+    print(f"Wake word templates saved at {path}.")
+
+
+if __name__ == "__main__":
+    record_wake_word()
@@ -0,0 +1,29 @@
+import sys
+import os
+import tempfile
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../PerformanceTests/LoadTests")))
+
+import benchmark_pipeline
+
+
+class TestFullFlowReplay(unittest.TestCase):
+    def test_replay_synthetic_commands(self):
+        utterances = ["open chrome", "take a screenshot", "set volume to 30", "please close notepad"]
+        with tempfile.TemporaryDirectory() as directory:
+            corpus = benchmark_pipeline.synthesize_corpus(directory, utterances)
+            report = benchmark_pipeline.replay(corpus, repeat=2)
+        self.assertEqual(report["utterances"], 4)
+        self.assertEqual(report["segments_found"], 8)
+        self.assertEqual(report["recognized"], 8)
+        for stage in ("endpoint", "verification", "stt", "keyword", "queue", "handler", "total"):
+            stats = report["stages"][stage]
+            self.assertEqual(stats["calls"], 8)
+            self.assertLessEqual(stats["p50_ms"], stats["p99_ms"])
+        self.assertGreater(report["endpoint_delay_ms"], 0)
+        self.assertAlmostEqual(sum(report["share_of_total"].values()), 1.0, places=6)
+
+
+if __name__ == "__main__":
+    unittest.main()
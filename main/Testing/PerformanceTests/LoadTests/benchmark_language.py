@@ -0,0 +1,164 @@
+"""
+Microbenchmarks for the language-understanding layer.
+
+Reports p50/p95/p99 latency and throughput for CommandParser.parse (stub
+handlers), CommandParser.extract_target and nlp_processing.process_command,
+cold (fresh instance, empty caches) and warm, and repeats the parser
+benchmarks with the synonym vocabulary scaled up to show the scaling curve.
+Runs headless; no audio devices are touched.
+
+Usage: python benchmark_language.py [--scales 1 10 100] [--repeat 20] [--output report.json]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
+
+from Core.VoiceRecognition.command_parser import CommandParser
+from Core.VoiceRecognition import nlp_processing
+
+CORPUS_PATH = os.path.join(os.path.dirname(__file__), "utterances.txt")
+
+
+def load_corpus(path=CORPUS_PATH):
+    """
+    Read the utterance corpus, one command per line.
+    """
+    with open(path, encoding="utf-8") as corpus:
+        return [line.strip() for line in corpus if line.strip()]
+
+
+def percentile(sorted_samples, fraction):
+    index = min(len(sorted_samples) - 1, int(round(fraction * (len(sorted_samples) - 1))))
+    return sorted_samples[index]
+
+
+def summarize(samples):
+    """
+    Latency percentiles (milliseconds) and throughput (calls per second) for per-call timings in seconds.
+    """
+    ordered = sorted(samples)
+    total = sum(ordered)
+    return {
+        "calls": len(ordered),
+        "p50_ms": percentile(ordered, 0.50) * 1000,
+        "p95_ms": percentile(ordered, 0.95) * 1000,
+        "p99_ms": percentile(ordered, 0.99) * 1000,
+        "throughput_per_s": len(ordered) / total if total else float("inf"),
+    }
+
+
+def time_calls(function, inputs):
+    """
+    Call function once per input and return the per-call durations in seconds.
+    """
+    samples = []
+    for arguments in inputs:
+        start = time.perf_counter()
+        function(*arguments)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def scaled_synonym_map(scale):
+    """
+    Default synonym map with (scale - 1) synthetic variants per synonym that never occur in the corpus.
+    """
+    synonym_map = CommandParser().synonym_map
+    return {action: synonyms + [f"{synonym}-{i}" for synonym in synonyms for i in range(1, scale)]
+            for action, synonyms in synonym_map.items()}
+
+
+def make_parser(scale=1):
+    """
+    CommandParser with a no-op handler registered for every action.
+    """
+    parser = CommandParser()
+    if scale > 1:
+        parser.synonym_map = scaled_synonym_map(scale)
+    for action in parser.synonym_map:
+        parser.register_command(action, lambda target=None: None)
+    return parser
+
+
+def benchmark_parse(corpus, scale=1, repeat=20):
+    parser = make_parser(scale)
+    inputs = [(command,) for command in corpus]
+    # Handlers and parse() print; keep the console out of the measurement
+    with contextlib.redirect_stdout(io.StringIO()):
+        cold = time_calls(parser.parse, inputs)
+        warm = time_calls(parser.parse, inputs * repeat)
+    info = parser.cache_info()
+    return {
+        "vocabulary": sum(len(synonyms) for synonyms in parser.synonym_map.values()),
+        "cold": summarize(cold),
+        "warm": summarize(warm),
+        "cache": {"hits": info.hits, "misses": info.misses},
+    }
+
+
+def benchmark_extract_target(corpus, scale=1, repeat=20):
+    parser = make_parser(scale)
+    inputs = []
+    for command in corpus:
+        normalized = parser.normalize(command)
+        action = parser.resolve(normalized)[0]
+        if action:
+            inputs.append((normalized, action))
+    cold = time_calls(parser.extract_target, inputs)
+    warm = time_calls(parser.extract_target, inputs * repeat)
+    return {"cold": summarize(cold), "warm": summarize(warm)}
+
+
+def benchmark_nlp(corpus, repeat=5):
+    """
+    Cold includes importing spaCy and loading the model on the first call.
+    """
+    nlp_processing._nlp = None
+    inputs = [(command,) for command in corpus]
+    try:
+        cold = time_calls(nlp_processing.process_command, inputs)
+    except (ImportError, OSError) as e:
+        return {"skipped": f"spaCy model unavailable: {e}"}
+    warm = time_calls(nlp_processing.process_command, inputs * repeat)
+    return {"load_seconds": nlp_processing.load_seconds, "cold": summarize(cold), "warm": summarize(warm)}
+
+
+def run(corpus=None, scales=(1, 10, 100), repeat=20, include_nlp=True):
+    """
+    Run every benchmark and return the report as a dict.
+    """
+    corpus = corpus or load_corpus()
+    report = {
+        "corpus_size": len(corpus),
+        "parse": {f"x{scale}": benchmark_parse(corpus, scale, repeat) for scale in scales},
+        "extract_target": {f"x{scale}": benchmark_extract_target(corpus, scale, repeat) for scale in scales},
+    }
+    if include_nlp:
+        report["process_command"] = benchmark_nlp(corpus, max(1, repeat // 4))
+    return report
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark command parsing and NLP processing.")
+    arg_parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100])
+    arg_parser.add_argument("--repeat", type=int, default=20)
+    arg_parser.add_argument("--no-nlp", action="store_true", help="skip the spaCy benchmark")
+    arg_parser.add_argument("--output", help="write the JSON report to this file")
+    args = arg_parser.parse_args()
+
+    report = run(scales=args.scales, repeat=args.repeat, include_nlp=not args.no_nlp)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            output.write(text)
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
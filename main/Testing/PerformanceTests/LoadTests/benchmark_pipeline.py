@@ -0,0 +1,221 @@
+"""
+End-to-end replay benchmark for the voice pipeline.
+
+Feeds recorded WAV commands through the same stages as the main loop (VAD
+endpointing, speaker verification, speech to text, keyword and NLP intent
+tiers, the task queue and the handler) and reports per-stage latency
+percentiles. Speech to text is a stand-in that returns each file's recorded
+transcript, and handlers are no-ops, so the run is headless and offline.
+
+The corpus is a directory of WAV files plus transcripts.json mapping each
+file name to its transcript. Without --corpus, a synthetic corpus is
+generated from utterances.txt.
+
+Usage: python benchmark_pipeline.py [--corpus DIR] [--repeat 3] [--stt-delay-ms 0] [--output report.json]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+import wave
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from Core.TaskManagement.task_queue import TaskQueue
+from Core.VoiceRecognition import nlp_processing
+from Core.VoiceRecognition.intent_resolver import IntentResolver
+from Core.VoiceRecognition.speaker_embedding import MATCH_THRESHOLD, similarity, speaker_embedding
+from Core.VoiceRecognition.stt_backends import RecognizerBackend
+from Core.VoiceRecognition.vad import VoiceActivityDetector, read_wav
+from benchmark_language import load_corpus as load_utterances, make_parser, summarize
+
+TRANSCRIPTS_FILENAME = "transcripts.json"
+STAGES = ("endpoint", "verification", "stt", "keyword", "nlp", "queue", "handler", "total")
+
+
+class ReplayBackend(RecognizerBackend):
+    """
+    Speech-to-text stand-in that returns the recorded transcript of the file being replayed.
+
+    delay simulates the engine's decoding time.
+    """
+
+    def __init__(self, rate=16000, delay=0.0):
+        super().__init__(rate)
+        self.transcript = ""
+        self.delay = delay
+
+    def finish(self):
+        if self.delay:
+            time.sleep(self.delay)
+        return self.transcript
+
+
+def load_corpus(directory):
+    """
+    Return [(wav path, transcript)] for the files listed in the directory's transcripts.json.
+    """
+    with open(os.path.join(directory, TRANSCRIPTS_FILENAME), encoding="utf-8") as transcripts:
+        return [(os.path.join(directory, name), text) for name, text in sorted(json.load(transcripts).items())]
+
+
+def synthesize_corpus(directory, utterances, rate=16000):
+    """
+    Write one WAV per utterance (a voiced burst per word between silences) and transcripts.json.
+    """
+    rng = np.random.default_rng(0)
+    t = np.arange(int(rate * 0.25)) / rate
+    transcripts = {}
+    for i, text in enumerate(utterances):
+        parts = [rng.integers(-20, 20, int(rate * 0.3))]
+        for word in text.split():
+            pitch = 110 + 10 * (len(word) % 5)
+            parts.append(sum(np.sin(2 * np.pi * h * pitch * t) / h for h in range(1, 8)) * 3000)
+            parts.append(rng.integers(-20, 20, int(rate * 0.05)))
+        parts.append(rng.integers(-20, 20, int(rate * 0.6)))
+        name = f"{i:03d}.wav"
+        with wave.open(os.path.join(directory, name), 'wb') as wf:
+            wf.setnchannels(1)
+            wf.setsampwidth(2)
+            wf.setframerate(rate)
+            wf.writeframes(np.concatenate(parts).astype(np.int16).tobytes())
+        transcripts[name] = text
+    with open(os.path.join(directory, TRANSCRIPTS_FILENAME), "w", encoding="utf-8") as output:
+        json.dump(transcripts, output, indent=2)
+    return load_corpus(directory)
+
+
+def nlp_tier_or_stub():
+    """
+    The spaCy tier if the model can be loaded, otherwise a tier that never matches.
+    """
+    try:
+        nlp_processing.get_nlp()
+        return nlp_processing.process_command, True
+    except (ImportError, OSError):
+        return (lambda command: (None, None)), False
+
+
+def endpoint(samples, rate, chunk):
+    """
+    Stream samples through a fresh VAD like the microphone would.
+
+    Returns (segment, seconds spent on the chunk that ended the utterance).
+    """
+    vad = VoiceActivityDetector(rate)
+    for offset in range(0, len(samples), chunk):
+        start = time.perf_counter()
+        segments = vad.feed(samples[offset:offset + chunk])
+        if segments:
+            return segments[0], time.perf_counter() - start
+    start = time.perf_counter()
+    segment = vad.flush()
+    return segment, time.perf_counter() - start
+
+
+def replay(corpus, repeat=1, stt_delay=0.0, chunk=1024, profile=None):
+    """
+    Replay every (wav path, transcript) through the pipeline and return the report as a dict.
+
+    profile is the enrolled speaker embedding; by default the first utterance is enrolled.
+    """
+    parser = make_parser()
+    nlp_tier, nlp_available = nlp_tier_or_stub()
+    resolver = IntentResolver(parser, nlp_tier=nlp_tier)
+    task_queue = TaskQueue()
+    backend = ReplayBackend(delay=stt_delay)
+    timings = {stage: [] for stage in STAGES}
+    counts = {"segments_found": 0, "verified": 0, "recognized": 0}
+
+    audio = [(read_wav(path), transcript) for path, transcript in corpus]
+    # Handlers, the queue and the parser print; keep the console out of the measurement
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeat):
+            for (samples, rate), transcript in audio:
+                segment, endpoint_seconds = endpoint(samples, rate, chunk)
+                if segment is None:
+                    continue
+                counts["segments_found"] += 1
+                stage = {"endpoint": endpoint_seconds}
+
+                start = time.perf_counter()
+                embedding = speaker_embedding(segment, rate)
+                if profile is None:
+                    profile = embedding
+                verified = embedding is not None and similarity(profile, embedding) >= MATCH_THRESHOLD
+                stage["verification"] = time.perf_counter() - start
+                counts["verified"] += verified
+
+                start = time.perf_counter()
+                backend.transcript = transcript
+                text = backend.transcribe(segment)
+                stage["stt"] = time.perf_counter() - start
+
+                intent = resolver.resolve(text)
+                stage["keyword"] = intent.timings.get("keyword", 0.0)
+                if "nlp" in intent.timings:
+                    stage["nlp"] = intent.timings["nlp"]
+                counts["recognized"] += bool(intent)
+
+                handler_seconds = []
+
+                def task(intent=intent):
+                    handler_start = time.perf_counter()
+                    try:
+                        parser.dispatch(intent)
+                    except ValueError:
+                        pass  # Refused intents (e.g. unrecognized commands) still pass through dispatch
+                    handler_seconds.append(time.perf_counter() - handler_start)
+
+                start = time.perf_counter()
+                task_queue.add_task(task)
+                task_queue.process_task()
+                stage["handler"] = handler_seconds[0]
+                stage["queue"] = time.perf_counter() - start - stage["handler"]
+
+                stage["total"] = sum(stage.values())
+                for name, seconds in stage.items():
+                    timings[name].append(seconds)
+
+    vad = VoiceActivityDetector()
+    total_seconds = sum(timings["total"])
+    return {
+        "utterances": len(corpus),
+        "repeat": repeat,
+        **counts,
+        "nlp_available": nlp_available,
+        # Silence the VAD waits for before ending an utterance; added to every command's latency
+        "endpoint_delay_ms": vad.trailing_silence_frames * vad.frame_length * 1000 / vad.rate,
+        "stages": {name: summarize(samples) for name, samples in timings.items() if samples},
+        "share_of_total": {name: sum(samples) / total_seconds if total_seconds else 0.0
+                           for name, samples in timings.items() if samples and name != "total"},
+        "intent_hit_rates": resolver.hit_rates(),
+    }
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Replay recorded commands through the voice pipeline.")
+    arg_parser.add_argument("--corpus", help="directory of WAV files with transcripts.json (default: synthetic)")
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    arg_parser.add_argument("--stt-delay-ms", type=float, default=0.0, help="simulated speech-to-text latency")
+    arg_parser.add_argument("--output", help="write the JSON report to this file")
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        corpus = load_corpus(args.corpus) if args.corpus else synthesize_corpus(directory, load_utterances())
+        report = replay(corpus, args.repeat, args.stt_delay_ms / 1000)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            output.write(text)
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
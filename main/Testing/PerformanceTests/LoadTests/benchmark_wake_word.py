@@ -0,0 +1,117 @@
+"""
+False-accept / false-reject and CPU benchmark for the wake-word spotter.
+
+Templates are built from WAV recordings of the wake word. Every positive
+recording should contain the wake word (a miss is a false reject); every
+speech segment detected in the negative recordings is a false accept. Each
+file is streamed through the VAD and the spotter exactly as the main loop
+does, and the CPU time spent is reported against the duration of the audio.
+
+Usage: python benchmark_wake_word.py --templates DIR --positives DIR --negatives DIR [--threshold T] [--output report.json]
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from Core.VoiceRecognition.vad import VoiceActivityDetector, read_wav
+from Core.VoiceRecognition.wake_word import WakeWordSpotter
+from benchmark_language import summarize
+
+
+def wav_files(directory):
+    return sorted(glob.glob(os.path.join(directory, "*.wav")))
+
+
+def spot_file(spotter, path, chunk=1024):
+    """
+    Stream a WAV file through the VAD and the spotter.
+
+    Returns (detections, audio seconds, CPU seconds, per-segment spotting times).
+    """
+    samples, rate = read_wav(path)
+    vad = VoiceActivityDetector(rate)
+    detections = 0
+    segment_times = []
+
+    def spot(segment):
+        start = time.perf_counter()
+        detected = spotter.detect(segment) is not None
+        segment_times.append(time.perf_counter() - start)
+        return detected
+
+    start = time.process_time()
+    for offset in range(0, len(samples), chunk):
+        detections += sum(spot(segment) for segment in vad.feed(samples[offset:offset + chunk]))
+    final = vad.flush()
+    if final is not None:
+        detections += spot(final)
+    return detections, len(samples) / rate, time.process_time() - start, segment_times
+
+
+def run(templates_dir, positives_dir, negatives_dir, threshold=None):
+    """
+    Run the benchmark and return the report as a dict.
+    """
+    spotter = WakeWordSpotter.from_wavs(wav_files(templates_dir), threshold)
+    audio_seconds = cpu_seconds = 0.0
+    segment_times = []
+
+    misses = 0
+    positives = wav_files(positives_dir)
+    for path in positives:
+        detections, seconds, cpu, times = spot_file(spotter, path)
+        misses += detections == 0
+        audio_seconds, cpu_seconds = audio_seconds + seconds, cpu_seconds + cpu
+        segment_times += times
+
+    false_accepts = 0
+    negative_seconds = 0.0
+    negatives = wav_files(negatives_dir)
+    for path in negatives:
+        detections, seconds, cpu, times = spot_file(spotter, path)
+        false_accepts += detections
+        negative_seconds += seconds
+        audio_seconds, cpu_seconds = audio_seconds + seconds, cpu_seconds + cpu
+        segment_times += times
+
+    return {
+        "templates": len(spotter.templates),
+        "threshold": spotter.threshold,
+        "positives": len(positives),
+        "negatives": len(negatives),
+        "false_reject_rate": misses / len(positives) if positives else None,
+        "false_accepts": false_accepts,
+        "false_accepts_per_hour": false_accepts / (negative_seconds / 3600) if negative_seconds else None,
+        "audio_seconds": audio_seconds,
+        "cpu_seconds": cpu_seconds,
+        # Fraction of one core the always-on spotter needs (VAD included)
+        "real_time_factor": cpu_seconds / audio_seconds if audio_seconds else None,
+        "segments": summarize(segment_times) if segment_times else None,
+    }
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark wake-word false accepts, false rejects and CPU use.")
+    arg_parser.add_argument("--templates", required=True, help="directory of WAV recordings of the wake word")
+    arg_parser.add_argument("--positives", required=True, help="directory of WAV files that contain the wake word")
+    arg_parser.add_argument("--negatives", required=True, help="directory of WAV files without the wake word")
+    arg_parser.add_argument("--threshold", type=float, help="override the calibrated detection threshold")
+    arg_parser.add_argument("--output", help="write the JSON report to this file")
+    args = arg_parser.parse_args()
+
+    report = run(args.templates, args.positives, args.negatives, args.threshold)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            output.write(text)
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
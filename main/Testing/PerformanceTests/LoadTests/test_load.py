@@ -0,0 +1,64 @@
+import sys
+import os
+import tempfile
+import unittest
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
+
+import benchmark_language
+import benchmark_wake_word
+from Testing.UnitTests.VoiceRecognitionTests.audio_fixtures import OTHER_WORD, WAKE_WORD, silence, word, write_wav
+
+
+class TestLanguageBenchmarks(unittest.TestCase):
+    def test_report_structure(self):
+        corpus = benchmark_language.load_corpus()
+        report = benchmark_language.run(corpus, scales=(1, 10), repeat=1, include_nlp=False)
+        self.assertEqual(report["corpus_size"], len(corpus))
+        for benchmark in ("parse", "extract_target"):
+            for scale in ("x1", "x10"):
+                for phase in ("cold", "warm"):
+                    stats = report[benchmark][scale][phase]
+                    self.assertLessEqual(stats["p50_ms"], stats["p95_ms"])
+                    self.assertLessEqual(stats["p95_ms"], stats["p99_ms"])
+                    self.assertGreater(stats["throughput_per_s"], 0)
+        self.assertGreater(report["parse"]["x10"]["vocabulary"], report["parse"]["x1"]["vocabulary"])
+        # The warm pass repeats the corpus, so every call is a cache hit
+        self.assertEqual(report["parse"]["x1"]["cache"]["hits"], len(corpus))
+
+    def test_scaled_vocabulary_does_not_change_results(self):
+        corpus = benchmark_language.load_corpus()
+        base, scaled = benchmark_language.make_parser(1), benchmark_language.make_parser(10)
+        for command in corpus:
+            command = base.normalize(command)
+            self.assertEqual(base.resolve(command)[:2], scaled.resolve(command)[:2], command)
+
+
+
+class TestWakeWordBenchmark(unittest.TestCase):
+    def test_report_from_synthetic_recordings(self):
+        with tempfile.TemporaryDirectory() as directory:
+            folders = {name: os.path.join(directory, name) for name in ("templates", "positives", "negatives")}
+            for folder in folders.values():
+                os.makedirs(folder)
+            for i, (seed, stretch) in enumerate([(0, 1.0), (10, 0.9), (20, 1.15)]):
+                write_wav(os.path.join(folders["templates"], f"{i}.wav"), word(WAKE_WORD, seed, stretch))
+            for i in range(3):
+                recording = np.concatenate([silence(0.5), word(WAKE_WORD, 30 + i, 0.95 + 0.05 * i), silence(0.6),
+                                            word(OTHER_WORD, 40 + i), silence(0.6)])
+                write_wav(os.path.join(folders["positives"], f"{i}.wav"), recording)
+                write_wav(os.path.join(folders["negatives"], f"{i}.wav"),
+                          np.concatenate([silence(0.5), word(OTHER_WORD, 50 + i), silence(0.6)]))
+            report = benchmark_wake_word.run(folders["templates"], folders["positives"], folders["negatives"])
+        self.assertEqual(report["templates"], 3)
+        self.assertEqual(report["false_reject_rate"], 0.0)
+        self.assertEqual(report["false_accepts"], 0)
+        self.assertGreater(report["audio_seconds"], 0)
+        self.assertLess(report["real_time_factor"], 1)  # Faster than real time
+        self.assertEqual(report["segments"]["calls"], 9)
+
+
+if __name__ == "__main__":
+    unittest.main()
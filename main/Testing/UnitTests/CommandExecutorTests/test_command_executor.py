@@ -0,0 +1,66 @@
+import unittest
+import sys
+import os
+import tempfile
+import contextlib
+import io
+from unittest.mock import Mock, patch
+
+# Add the Asvatha root directory to the system path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
+
+from Core.TaskManagement.task_scheduler import Artifact, StepCancelled, TaskGraph
+from Core.VoiceRecognition.intent import Intent
+
+try:
+    import requests
+    from Core.CommandExecutor import system_commands
+    from Core.CommandExecutor.command_executor import CommandExecutor
+except ImportError:  # Desktop automation dependencies (pyautogui, pycaw, psutil) are missing
+    CommandExecutor = None
+
+
+def fake_get(url, stream=True):
+    response = Mock()
+    if url.endswith("missing.pdf"):
+        response.raise_for_status.side_effect = requests.HTTPError("404 Client Error")
+    response.iter_content.return_value = [b"%PDF-", b"resume"]
+    return response
+
+
+@unittest.skipUnless(CommandExecutor, "CommandExecutor dependencies are not installed")
+class TestDownloadThenMove(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.downloads = os.path.join(self.directory.name, "downloads")
+        self.docs = os.path.join(self.directory.name, "docs")
+        os.makedirs(self.downloads)
+        os.makedirs(self.docs)
+        self.executor = CommandExecutor()
+        self.executor.system_commands.download_dir = self.downloads
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def run_graph(self, url):
+        graph = TaskGraph()
+        graph.add("download", Intent("download", {"target": url}))
+        graph.add("move", Intent("move", {"target": (Artifact("download"), self.docs)}))
+        with patch.object(system_commands.requests, "get", fake_get), contextlib.redirect_stdout(io.StringIO()):
+            return graph.run(handler=self.executor.dispatch, timeout=5)
+
+    def test_downloaded_path_feeds_the_move(self):
+        results = self.run_graph("https://example.com/resume.pdf")
+        self.assertEqual(results["download"].result, os.path.join(self.downloads, "resume.pdf"))
+        self.assertTrue(results["move"].ok)
+        self.assertTrue(os.path.exists(os.path.join(self.docs, "resume.pdf")))
+
+    def test_failed_download_cancels_the_move(self):
+        results = self.run_graph("https://example.com/missing.pdf")
+        self.assertIsInstance(results["download"].error, requests.HTTPError)
+        self.assertIsInstance(results["move"].error, StepCancelled)
+        self.assertEqual(os.listdir(self.docs), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
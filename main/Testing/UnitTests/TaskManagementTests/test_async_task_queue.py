@@ -0,0 +1,76 @@
+import unittest
+import sys
+import os
+import asyncio
+import threading
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
+
+from Core.TaskManagement.async_task_queue import AsyncTaskQueue
+from Core.TaskManagement.task_queue import URGENT
+from Core.VoiceRecognition.intent import Intent
+
+
+class TestAsyncTaskQueue(unittest.IsolatedAsyncioTestCase):
+    async def test_result_and_timings(self):
+        async with AsyncTaskQueue() as queue:
+            outcome = await queue.submit(lambda: "Volume set to 30%")
+        self.assertTrue(outcome.ok)
+        self.assertEqual(outcome.result, "Volume set to 30%")
+        self.assertEqual(set(outcome.timings), {"queued", "run", "total"})
+        self.assertGreaterEqual(outcome.timings["total"], outcome.timings["run"])
+
+    async def test_error_is_carried_not_raised(self):
+        async with AsyncTaskQueue() as queue:
+            outcome = await queue.submit(lambda: 1 / 0)
+            rejected = await queue.submit({"action": "open"})
+        self.assertIsInstance(outcome.error, ZeroDivisionError)
+        self.assertIsNone(outcome.result)
+        self.assertIsInstance(rejected.error, ValueError)
+
+    async def test_handler_receives_intents(self):
+        async with AsyncTaskQueue(handler=lambda intent: f"ran {intent.action}") as queue:
+            outcome = await queue.submit(Intent("change_volume", {"target": 30}))
+        self.assertEqual(outcome.result, "ran change_volume")
+
+    async def test_blocking_tasks_run_concurrently(self):
+        async with AsyncTaskQueue(workers=4) as queue:
+            start = time.perf_counter()
+            outcomes = await asyncio.gather(*(queue.submit(lambda: time.sleep(0.2)) for _ in range(4)))
+            elapsed = time.perf_counter() - start
+        self.assertTrue(all(outcome.ok for outcome in outcomes))
+        self.assertLess(elapsed, 0.6)  # Serially this would take 0.8 s
+
+    async def test_coroutine_tasks_are_awaited(self):
+        async def fetch():
+            await asyncio.sleep(0)
+            return "fetched"
+
+        async with AsyncTaskQueue() as queue:
+            self.assertEqual((await queue.submit(fetch)).result, "fetched")
+
+    async def test_priority_order_and_cancel(self):
+        order = []
+        release = threading.Event()
+        async with AsyncTaskQueue(workers=1) as queue:
+            blocker = queue.submit(lambda: release.wait(5))
+            await asyncio.sleep(0.05)  # Let the only worker pick up the blocker
+            later = queue.submit(lambda: order.append("open"))
+            urgent = queue.submit(lambda: order.append("mute"), priority=URGENT)
+            skipped = queue.submit(lambda: order.append("download"))
+            skipped.cancel()
+            release.set()
+            await asyncio.gather(blocker, later, urgent)
+        self.assertEqual(order, ["mute", "open"])
+
+    async def test_submit_from_another_thread(self):
+        async with AsyncTaskQueue() as queue:
+            result = []
+            thread = threading.Thread(target=lambda: result.append(queue.submit_threadsafe(lambda: 42).result(5)))
+            thread.start()
+            await asyncio.to_thread(thread.join)
+        self.assertEqual(result[0].result, 42)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import unittest
+import sys
+import os
+import threading
+import time
+import contextlib
+import io
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
+
+from Core.TaskManagement.lane_executor import LaneExecutor
+from Core.VoiceRecognition.intent import Intent
+
+
+class TestLaneExecutor(unittest.TestCase):
+    def setUp(self):
+        self.handled = []
+        # The queues print every task they accept; keep test output readable
+        self.quiet = contextlib.redirect_stdout(io.StringIO())
+        self.quiet.__enter__()
+        self.lanes = LaneExecutor(handler=self.handled.append)
+
+    def tearDown(self):
+        self.lanes.shutdown()
+        self.quiet.__exit__(None, None, None)
+
+    def test_lane_for_action(self):
+        self.assertEqual(self.lanes.lane_for({"action": "download", "target": "url"}), "network")
+        self.assertEqual(self.lanes.lane_for(Intent("change_volume", {"target": 30})), "device")
+        self.assertEqual(self.lanes.lane_for(Intent("open", {"target": "chrome"})), "gui")
+        self.assertEqual(self.lanes.lane_for("something else"), "system")
+
+    def test_device_command_does_not_wait_for_bulk_io(self):
+        release = threading.Event()
+        volume_done = threading.Event()
+        for _ in range(self.lanes.lanes["network"] + 2):  # More downloads than network workers
+            self.lanes.submit(lambda: release.wait(5), lane="network")
+        self.lanes.submit(volume_done.set, lane="device")
+        self.assertTrue(volume_done.wait(1))
+        release.set()
+        self.assertTrue(self.lanes.wait_idle(5))
+
+    def test_gui_lane_is_serialized(self):
+        running = []
+        overlaps = []
+
+        def gui_action():
+            running.append(1)
+            overlaps.append(len(running))
+            time.sleep(0.01)
+            running.pop()
+
+        for _ in range(5):
+            self.lanes.submit(gui_action, lane="gui")
+        self.assertTrue(self.lanes.wait_idle(5))
+        self.assertEqual(max(overlaps), 1)
+
+    def test_handler_runs_intents(self):
+        intent = Intent("change_volume", {"target": 30})
+        self.lanes.submit(intent)
+        self.assertTrue(self.lanes.wait_idle(5))
+        self.assertEqual(self.handled, [intent])
+
+    def test_cancel_before_start(self):
+        release = threading.Event()
+        self.lanes.submit(lambda: release.wait(5), lane="device")
+        handle = self.lanes.submit(Intent("mute_volume"), lane="device")
+        self.assertTrue(self.lanes.cancel(handle))
+        release.set()
+        self.assertTrue(self.lanes.wait_idle(5))
+        self.assertEqual(self.handled, [])
+
+    def test_failing_task_does_not_stop_the_lane(self):
+        self.lanes.submit(lambda: 1 / 0, lane="system")
+        self.lanes.submit({"action": "restart", "target": "system"})
+        self.assertTrue(self.lanes.wait_idle(5))
+        self.assertEqual(len(self.handled), 1)
+
+    def test_superseded_settings_count_as_finished(self):
+        release = threading.Event()
+        self.lanes.submit(lambda: release.wait(5), lane="device")
+        for level in (20, 40, 30):
+            self.lanes.submit({"action": "change_volume", "target": level})
+        release.set()
+        self.assertTrue(self.lanes.wait_idle(5))
+        self.assertEqual(self.handled, [{"action": "change_volume", "target": 30}])
+        self.assertEqual(self.lanes.skipped()["coalesced"], 2)
+
+
+    def test_shutdown_runs_pending_debounced_tasks(self):
+        handled = []
+        lanes = LaneExecutor(handler=handled.append, debounce={"change_volume": 30})
+        lanes.submit({"action": "change_volume", "target": 20})
+        lanes.submit({"action": "change_volume", "target": 30})
+        lanes.shutdown()
+        self.assertEqual(handled, [{"action": "change_volume", "target": 30}])
+        self.assertTrue(lanes.wait_idle(1))
+
+
+if __name__ == "__main__":
+    unittest.main()
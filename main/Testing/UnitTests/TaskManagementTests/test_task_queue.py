@@ -1,9 +1,12 @@
 import unittest
 import sys
 import os
+import threading
+import contextlib
+import io
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
 
-from Core.TaskManagement.task_queue import TaskQueue
+from Core.TaskManagement.task_queue import BULK, URGENT, TaskQueue
 
 
 class TestTaskQueue(unittest.TestCase):
@@ -32,5 +35,145 @@ class TestTaskQueue(unittest.TestCase):
         self.queue.add_task(test_function)
         self.queue.process_task()  # Expect "Test function executed" to be printed
 
+    def test_urgent_commands_jump_ahead(self):
+        self.queue.add_task({"action": "download", "target": "https://example.com/file.zip"})
+        self.queue.add_task("open chrome")
+        self.queue.add_task("open notepad")
+        self.queue.add_task({"action": "mute_volume", "target": "speakers"})
+        order = [self.queue.pop() for _ in range(4)]
+        self.assertEqual(order[0]["action"], "mute_volume")
+        self.assertEqual(order[1:3], ["open chrome", "open notepad"])  # FIFO within a priority
+        self.assertEqual(order[3]["action"], "download")
+
+    def test_explicit_priority(self):
+        self.queue.add_task("open chrome", priority=BULK)
+        self.queue.add_task("open paint", priority=URGENT)
+        self.assertEqual(self.queue.pop(), "open paint")
+
+    def test_cancel_by_handle(self):
+        handle = self.queue.add_task("open chrome")
+        self.queue.add_task("open paint")
+        self.assertTrue(self.queue.cancel_task(handle))
+        self.assertFalse(self.queue.cancel_task(handle))
+        self.assertEqual(len(self.queue), 1)
+        self.assertEqual(self.queue.pop(), "open paint")
+        self.assertIsNone(self.queue.pop())
+
+    def test_cannot_cancel_a_task_already_taken(self):
+        handle = self.queue.add_task("open chrome")
+        self.queue.pop()
+        self.assertFalse(self.queue.cancel_task(handle))
+
+    def test_concurrent_add_cancel_process(self):
+        taken = []
+        cancelled = []
+        handles = []
+        lock = threading.Lock()
+
+        def producer(offset):
+            for i in range(500):
+                handle = self.queue.add_task(f"task {offset + i}")
+                with lock:
+                    handles.append(handle)
+
+        def canceller():
+            for _ in range(400):
+                with lock:
+                    handle = handles.pop() if handles else None
+                if handle is not None and self.queue.cancel_task(handle):
+                    cancelled.append(handle.task)
+
+        def consumer():
+            while True:
+                task = self.queue.pop(timeout=0.5)
+                if task is None:
+                    return
+                taken.append(task)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            threads = [threading.Thread(target=producer, args=(offset,)) for offset in (0, 1000, 2000)]
+            threads += [threading.Thread(target=canceller) for _ in range(2)]
+            threads += [threading.Thread(target=consumer) for _ in range(2)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        # Every task was either taken exactly once or cancelled, never both
+        self.assertEqual(len(taken), len(set(taken)))
+        self.assertFalse(set(taken) & set(cancelled))
+        self.assertEqual(len(taken) + len(cancelled), 1500)
+        self.assertEqual(len(self.queue), 0)
+
+
+class TestTaskCoalescing(unittest.TestCase):
+    def setUp(self):
+        self.skipped = []
+        self.queue = TaskQueue(on_skip=self.skipped.append)
+
+    def test_latest_setting_wins_in_place(self):
+        self.queue.add_task({"action": "change_volume", "target": 20})
+        self.queue.add_task("open chrome")
+        self.queue.add_task({"action": "change_volume", "target": 40})
+        self.queue.add_task({"action": "change_volume", "target": 30})
+        self.assertEqual(len(self.queue), 2)
+        # The final volume runs where the first volume change was queued
+        self.assertEqual(self.queue.pop(), {"action": "change_volume", "target": 30})
+        self.assertEqual(self.queue.pop(), "open chrome")
+        self.assertEqual(self.queue.skipped["coalesced"], 2)
+        self.assertEqual([handle.task["target"] for handle in self.skipped], [20, 40])
+
+    def test_setting_after_the_previous_one_ran_is_kept(self):
+        self.queue.add_task({"action": "change_brightness", "target": 20})
+        self.queue.pop()
+        self.queue.add_task({"action": "change_brightness", "target": 50})
+        self.assertEqual(self.queue.pop(), {"action": "change_brightness", "target": 50})
+        self.assertEqual(self.queue.skipped["coalesced"], 0)
+
+    def test_identical_pending_tasks_are_deduplicated(self):
+        first = self.queue.add_task({"action": "take_screenshot", "target": "screen"})
+        again = self.queue.add_task({"action": "take_screenshot", "target": "screen"})
+        self.assertIs(first, again)
+        self.assertEqual(len(self.queue), 1)
+        self.assertEqual(self.queue.skipped["deduplicated"], 1)
+        self.queue.pop()
+        self.assertIsNone(self.queue.pop())
+
+    def test_tasks_without_a_policy_are_not_coalesced(self):
+        self.queue.add_task("open chrome")
+        self.queue.add_task("open chrome")
+        self.assertEqual(len(self.queue), 2)
+
+    def test_cancelled_tasks_are_counted(self):
+        handle = self.queue.add_task("open chrome")
+        self.queue.cancel_task(handle)
+        self.assertEqual(self.queue.skipped["cancelled"], 1)
+        self.assertEqual(self.skipped, [handle])
+
+    def test_debounce_runs_only_the_final_task_of_a_burst(self):
+        queue = TaskQueue(debounce={"change_volume": 0.5})
+        for level in (20, 40, 30):
+            queue.add_task({"action": "change_volume", "target": level})
+        self.assertIsNone(queue.pop())  # Still inside the window
+        self.assertEqual(queue.pop(timeout=5), {"action": "change_volume", "target": 30})
+        self.assertIsNone(queue.pop())
+        self.assertEqual(queue.skipped["coalesced"], 2)
+
+    def test_release_delayed_ends_the_window(self):
+        queue = TaskQueue(debounce={"change_volume": 30})
+        queue.add_task({"action": "change_volume", "target": 20})
+        self.assertIsNone(queue.pop())
+        queue.release_delayed()
+        self.assertEqual(queue.pop(), {"action": "change_volume", "target": 20})
+        self.assertEqual(len(queue), 0)
+
+    def test_debounced_task_does_not_hold_back_others(self):
+        queue = TaskQueue(debounce={"change_volume": 5})
+        queue.add_task({"action": "change_volume", "target": 20})
+        queue.add_task("open chrome")
+        self.assertEqual(queue.pop(), "open chrome")
+        self.assertEqual(len(queue), 1)
+
+
 if __name__ == "__main__":
     unittest.main()
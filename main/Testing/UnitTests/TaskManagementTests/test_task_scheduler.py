@@ -0,0 +1,163 @@
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+import threading
+import time
+import contextlib
+import io
+from unittest.mock import Mock
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
+
+from Core.TaskManagement.lane_executor import LaneExecutor
+from Core.TaskManagement.task_scheduler import Artifact, StepCancelled, TaskGraph
+from Core.VoiceRecognition.command_parser import CommandParser
+from Core.VoiceRecognition.intent import Intent
+
+
+def unzip(archive):
+    folder = os.path.splitext(archive)[0] + "_unzipped"
+    shutil.unpack_archive(archive, folder)
+    return folder
+
+
+class TestTaskGraph(unittest.TestCase):
+    def setUp(self):
+        # The queues print every task they accept; keep test output readable
+        self.quiet = contextlib.redirect_stdout(io.StringIO())
+        self.quiet.__enter__()
+        self.lanes = LaneExecutor()
+
+    def tearDown(self):
+        self.lanes.shutdown()
+        self.quiet.__exit__(None, None, None)
+
+    def test_download_unzip_move(self):
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "resume")
+            os.makedirs(source)
+            with open(os.path.join(source, "resume.txt"), "w") as file:
+                file.write("Asvatha")
+            docs = os.path.join(directory, "docs")
+            os.makedirs(docs)
+
+            graph = TaskGraph()
+            graph.add("download", lambda: shutil.make_archive(source, "zip", root_dir=source), lane="network")
+            graph.add("unzip", unzip, after=["download"], lane="filesystem")
+            graph.add("move", lambda folder: shutil.move(folder, docs), after=["unzip"], lane="filesystem")
+            results = graph.run(self.lanes, timeout=5)
+
+            self.assertTrue(all(outcome.ok for outcome in results.values()))
+            self.assertTrue(os.path.exists(os.path.join(results["move"].result, "resume.txt")))
+
+    def test_independent_branches_run_in_parallel(self):
+        graph = TaskGraph()
+        for i in range(3):
+            graph.add(f"download {i}", lambda: time.sleep(0.2) or "file", lane="network")
+        graph.add("report", lambda *files: len(files), after=[f"download {i}" for i in range(3)])
+        start = time.perf_counter()
+        results = graph.run(self.lanes, timeout=5)
+        self.assertLess(time.perf_counter() - start, 0.5)  # Serially this would take 0.6 s
+        self.assertEqual(results["report"].result, 3)
+
+    def test_dependent_starts_when_its_inputs_are_ready(self):
+        release = threading.Event()
+        graph = TaskGraph()
+        graph.add("slow", lambda: release.wait(5), lane="network")
+        graph.add("fast", lambda: "path", lane="network")
+        graph.add("after fast", lambda path: release.set() or path, after=["fast"], lane="filesystem")
+        results = graph.run(self.lanes, timeout=5)
+        # "after fast" released "slow", so it ran without waiting for the unrelated branch
+        self.assertTrue(results["slow"].result)
+        self.assertEqual(results["after fast"].result, "path")
+
+    def test_failure_cancels_downstream_only(self):
+        ran = []
+        graph = TaskGraph()
+        graph.add("download", lambda: 1 / 0, lane="network")
+        graph.add("unzip", lambda archive: ran.append("unzip"), after=["download"])
+        graph.add("move", lambda folder: ran.append("move"), after=["unzip"])
+        graph.add("screenshot", lambda: ran.append("screenshot"), lane="gui")
+        results = graph.run(self.lanes, timeout=5)
+        self.assertIsInstance(results["download"].error, ZeroDivisionError)
+        self.assertIsInstance(results["unzip"].error, StepCancelled)
+        self.assertIsInstance(results["move"].error, StepCancelled)
+        self.assertEqual(ran, ["screenshot"])
+
+    def test_artifacts_fill_task_dicts(self):
+        handled = []
+        graph = TaskGraph()
+        graph.add("download", lambda: "/downloads/resume.zip", lane="network")
+        graph.add("move", {"action": "move", "target": (Artifact("download"), "/docs")})
+        self.assertEqual(graph.steps["move"][1], ("download",))  # Artifacts imply the dependency
+        graph.run(self.lanes, handler=handled.append, timeout=5)
+        self.assertEqual(handled, [{"action": "move", "target": ("/downloads/resume.zip", "/docs")}])
+
+    def test_dispatched_download_feeds_move(self):
+        with tempfile.TemporaryDirectory() as directory:
+            server = os.path.join(directory, "server")
+            docs = os.path.join(directory, "docs")
+            os.makedirs(server)
+            os.makedirs(docs)
+            with open(os.path.join(server, "resume.pdf"), "w") as file:
+                file.write("resume")
+
+            def download(url):
+                # Same contract as CommandExecutor.download_file: the saved path, or raise
+                return shutil.copy(os.path.join(server, url.split("/")[-1]), directory)
+
+            def move(paths):
+                source, destination = paths
+                return shutil.move(source, destination)
+
+            parser = CommandParser()
+            parser.register_command("download", download)
+            parser.register_command("move", move)
+
+            def run(url):
+                graph = TaskGraph()
+                graph.add("download", Intent("download", {"target": url}))
+                graph.add("move", Intent("move", {"target": (Artifact("download"), docs)}))
+                return graph.run(self.lanes, handler=parser.dispatch, timeout=5)
+
+            results = run("https://example.com/resume.pdf")
+            self.assertEqual(results["download"].result, os.path.join(directory, "resume.pdf"))
+            self.assertTrue(os.path.exists(os.path.join(docs, "resume.pdf")))
+
+            results = run("https://example.com/missing.pdf")
+            self.assertIsInstance(results["download"].error, FileNotFoundError)
+            self.assertIsInstance(results["move"].error, StepCancelled)
+
+    def test_refused_step_cancels_dependents(self):
+        download, move = Mock(), Mock()
+        parser = CommandParser()
+        parser.register_command("download", download)
+        parser.register_command("move", move)
+        graph = TaskGraph()
+        graph.add("download", Intent("download", {"target": None}, utterance="download"))
+        graph.add("move", Intent("move", {"target": (Artifact("download"), "/docs")}))
+        graph.add("unzip", Intent("unzip", {"target": "/downloads/resume.zip"}))
+        results = graph.run(self.lanes, handler=parser.dispatch, timeout=5)
+        self.assertIsInstance(results["download"].error, ValueError)
+        self.assertIsInstance(results["move"].error, StepCancelled)
+        self.assertIsInstance(results["unzip"].error, ValueError)  # No handler registered for unzip
+        download.assert_not_called()
+        move.assert_not_called()
+
+    def test_unknown_dependency(self):
+        graph = TaskGraph()
+        with self.assertRaises(ValueError):
+            graph.add("unzip", lambda archive: archive, after=["download"])
+
+    def test_timeout(self):
+        release = threading.Event()
+        graph = TaskGraph()
+        graph.add("slow", lambda: release.wait(5), lane="network")
+        with self.assertRaises(TimeoutError):
+            graph.run(self.lanes, timeout=0.05)
+        release.set()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+"""
+Synthetic audio and a scripted speech-to-text backend shared by the voice recognition tests.
+"""
+import sys
+import os
+import wave
+import numpy as np
+
+# Add the Asvatha root directory to the system path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
+
+from Core.VoiceRecognition.stt_backends import RecognizerBackend
+
+RATE = 16000
+
+# Synthetic words: (pitch, formants, seconds) per syllable
+WAKE_WORD = [(130, [700, 1200, 2600], 0.15), (130, [400, 2000, 2600], 0.2), (130, [700, 1100, 2500], 0.25)]
+OTHER_WORD = [(130, [300, 900, 2300], 0.2), (130, [600, 1700, 2400], 0.2), (130, [300, 800, 2200], 0.2)]
+
+
+def tone(seconds, amplitude=3000, frequency=220):
+    t = np.arange(int(RATE * seconds)) / RATE
+    return (amplitude * np.sin(2 * np.pi * frequency * t)).astype(np.int16)
+
+
+def silence(seconds, amplitude=20):
+    return np.random.default_rng(0).integers(-amplitude, amplitude, int(RATE * seconds)).astype(np.int16)
+
+
+def write_wav(path, samples):
+    with wave.open(path, 'wb') as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(RATE)
+        wf.writeframes(samples.tobytes())
+
+
+def voice(pitch, formants, seconds=2.0, seed=0):
+    """
+    Synthetic voiced sound: harmonics of pitch shaped by formant resonances, with random phases.
+    """
+    t = np.arange(int(RATE * seconds)) / RATE
+    rng = np.random.default_rng(seed)
+    signal = np.zeros_like(t)
+    for harmonic in range(1, int(4000 / pitch)):
+        frequency = harmonic * pitch
+        gain = sum(np.exp(-((frequency - formant) / 150) ** 2) for formant in formants)
+        signal += gain * np.sin(2 * np.pi * frequency * t + rng.uniform(0, 2 * np.pi))
+    signal *= 1 + 0.3 * np.sin(2 * np.pi * 3 * t)
+    return (3000 * signal / np.abs(signal).max()).astype(np.int16)
+
+
+def word(syllables, seed=0, stretch=1.0):
+    return np.concatenate([voice(pitch, formants, seconds * stretch, seed + i)
+                           for i, (pitch, formants, seconds) in enumerate(syllables)])
+
+
+class ScriptedBackend(RecognizerBackend):
+    """
+    Streaming stand-in that reveals one word of a fixed transcript per half second of audio.
+    """
+
+    streaming = True
+
+    def __init__(self, transcript, rate=RATE):
+        super().__init__(rate)
+        self.words = transcript.split()
+
+    def start(self):
+        self.received = 0
+
+    def accept(self, samples):
+        self.received += len(samples)
+        return " ".join(self.words[:int(self.received / (self.rate / 2))]) or None
+
+    def finish(self):
+        return " ".join(self.words)
@@ -0,0 +1,225 @@
+import sys
+import os
+import unittest
+from unittest.mock import Mock, patch
+
+# Add the Asvatha root directory to the system path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
+
+from Core.VoiceRecognition import command_parser
+from Core.VoiceRecognition.command_parser import CommandParser
+from Core.VoiceRecognition.intent import Intent
+from Core.VoiceRecognition.synonym_matcher import SynonymMatcher
+from Core.VoiceRecognition.fuzzy_index import FuzzyIndex, edit_distance
+
+
+class TestSynonymMatcher(unittest.TestCase):
+    def test_find_all_overlapping(self):
+        matcher = SynonymMatcher({"open": ["start"], "restart": ["restart"]})
+        hits = matcher.find_all("restart pc")
+        self.assertIn(("start", "open", 2, 7), hits)
+        self.assertIn(("restart", "restart", 0, 7), hits)
+
+    def test_best_match_prefers_longest_overlapping_hit(self):
+        matcher = SynonymMatcher({"copy_to_clipboard": ["copy"], "zip_files": ["copy to zip"]})
+        self.assertEqual(matcher.best_match("copy to zip now")[1], "zip_files")
+
+    def test_best_match_ignores_hits_inside_words(self):
+        matcher = SynonymMatcher({"open": ["start"], "restart": ["restart"], "download": ["download"]})
+        self.assertEqual(matcher.best_match("restart pc")[1], "restart")
+        self.assertIsNone(matcher.best_match("open downloads folder"))
+
+    def test_best_match_prefers_earliest_hit(self):
+        matcher = SynonymMatcher({"open": ["open"], "take_screenshot": ["take screenshot", "screenshot"]})
+        self.assertEqual(matcher.best_match("open screenshot folder")[1], "open")
+
+    def test_no_match(self):
+        matcher = SynonymMatcher({"open": ["open"]})
+        self.assertIsNone(matcher.best_match("hello there"))
+
+
+class TestFuzzyIndex(unittest.TestCase):
+    def test_edit_distance(self):
+        self.assertEqual(edit_distance("lunch", "launch"), 1)
+        self.assertEqual(edit_distance("kitten", "sitting"), 3)
+        self.assertEqual(edit_distance("", "abc"), 3)
+
+    def test_search_within_bound(self):
+        index = FuzzyIndex([("chrome", "chrome"), ("firefox", "firefox"), ("zoom", "zoom")])
+        results = index.search("crome", max_distance=1)
+        self.assertEqual([term for _, term, _ in results], ["chrome"])
+        self.assertEqual(index.search("crome", max_distance=0), [])
+
+    def test_top_k_is_sorted(self):
+        index = FuzzyIndex()
+        for term in ["open", "opera", "pen", "launch"]:
+            index.add(term, term)
+        results = index.search("open", max_distance=2, k=2)
+        self.assertEqual([term for _, term, _ in results], ["open", "pen"])
+
+
+class TestCommandParser(unittest.TestCase):
+    def setUp(self):
+        self.parser = CommandParser()
+
+    def test_routes_to_handler_with_target(self):
+        handler = Mock()
+        self.parser.register_command("open", handler)
+        self.parser.parse("please open chrome")
+        handler.assert_called_once_with("chrome")
+
+    def test_restart_is_not_open(self):
+        open_handler, restart_handler = Mock(), Mock()
+        self.parser.register_command("open", open_handler)
+        self.parser.register_command("restart", restart_handler)
+        self.parser.parse("restart")
+        restart_handler.assert_called_once_with()
+        open_handler.assert_not_called()
+
+    def test_new_synonyms_are_matched(self):
+        handler = Mock()
+        self.parser.register_command("open", handler)
+        self.parser.parse("fire up spotify")
+        handler.assert_not_called()
+
+        self.parser.add_synonyms("open", ["fire up"])
+        self.parser.parse("fire up spotify")
+        handler.assert_called_once_with("spotify")
+
+    def test_replacing_synonym_map_recompiles(self):
+        handler = Mock()
+        self.parser.register_command("open", handler)
+        self.parser.parse("open notepad")
+        self.parser.synonym_map = {"open": ["bring up"]}
+        self.parser.parse("bring up notepad")
+        self.assertEqual(handler.call_count, 2)
+
+    def test_misheard_action_and_target(self):
+        handler = Mock()
+        self.parser.register_command("open", handler)
+        self.parser.register_targets(["chrome", "notepad"])
+        self.parser.parse("lunch crome")
+        handler.assert_called_once_with("chrome")
+
+    def test_split_synonym(self):
+        handler = Mock()
+        self.parser.register_command("take_screenshot", handler)
+        self.parser.parse("take screen shot")
+        handler.assert_called_once_with()
+
+    def test_unrelated_command_is_not_matched(self):
+        handler = Mock()
+        self.parser.register_command("open", handler)
+        self.parser.parse("what a lovely day")
+        handler.assert_not_called()
+
+    def test_longest_synonym_is_stripped_from_the_target(self):
+        self.assertEqual(self.parser.resolve("delete file notes.txt"), ("delete_command", "notes.txt", 100))
+
+    def test_folder_names_do_not_change_the_action(self):
+        open_handler, screenshot_handler, download_handler = Mock(), Mock(), Mock()
+        self.parser.register_command("open", open_handler)
+        self.parser.register_command("take_screenshot", screenshot_handler)
+        self.parser.register_command("download", download_handler)
+        self.parser.parse("open screenshot folder")
+        self.parser.parse("open downloads folder")
+        self.assertEqual(open_handler.call_args_list, [(("screenshot folder",),), (("downloads folder",),)])
+        screenshot_handler.assert_not_called()
+        download_handler.assert_not_called()
+
+    def test_one_typo_in_a_short_word_is_not_a_command(self):
+        # "edit" is one letter from "exit", "love" from "move", "cope" from "copy"
+        for utterance in ["edit my document", "i love this song", "cope with it"]:
+            self.assertEqual(self.parser.resolve(self.parser.normalize(utterance)), (None, None, 0), utterance)
+        results = list(self.parser.parse_many(["edit my document", "i love this song", "cope with it"]))
+        self.assertEqual([r["action"] for r in results], [None, None, None])
+
+    def test_typos_never_become_destructive_actions(self):
+        for utterance in ["remote control", "restar the router", "shutdwn notes"]:
+            self.assertEqual(self.parser.resolve(utterance)[0], None, utterance)
+        self.assertEqual(self.parser.resolve("remove control"), ("delete_command", "control", 100))
+
+    def test_numbers_are_not_rewritten_into_synonyms(self):
+        self.assertEqual(self.parser.resolve("volume 30")[0], None)
+        self.assertEqual(self.parser.resolve("chang volume 40"), ("change_volume", 40, 92))
+
+    def test_repeated_commands_hit_cache(self):
+        handler = Mock()
+        self.parser.register_command("change_volume", handler)
+        self.parser.parse("change volume 30")
+        self.parser.parse("Please change volume 30")
+        info = self.parser.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+        self.assertEqual(handler.call_count, 2)
+
+    def test_cache_invalidated_on_registration(self):
+        self.assertEqual(self.parser.resolve("fire up spotify")[0], None)
+        self.parser.register_command("open", Mock(), synonyms=["fire up"])
+        self.assertEqual(self.parser.resolve("fire up spotify")[:2], ("open", "spotify"))
+        self.assertEqual(self.parser.cache_info().currsize, 1)
+
+    def test_cache_is_bounded(self):
+        parser = CommandParser(cache_size=2)
+        for level in range(5):
+            parser.resolve(f"change volume {level}")
+        self.assertEqual(parser.cache_info().currsize, 2)
+
+    def test_parse_many_does_not_dispatch(self):
+        handler = Mock()
+        self.parser.register_command("open", handler)
+        self.parser.register_targets(["chrome"])
+        results = list(self.parser.parse_many(["open chrome", "lunch crome", "hello"], batch_size=2))
+        handler.assert_not_called()
+        self.assertEqual([(r["action"], r["target"]) for r in results],
+                         [("open", "chrome"), ("open", "chrome"), (None, None)])
+        self.assertEqual(results[1]["command"], "lunch crome")
+
+    def test_parse_many_matches_resolve(self):
+        commands = ["take screen shot", "chang volume 40", "opne notepad", "remove file.txt", "nothing here",
+                    "edit my document", "set volum 20"]
+        expected = [self.parser.resolve(self.parser.normalize(command)) for command in commands]
+        for backend in (command_parser.rapidfuzz_process, None):
+            with patch.object(command_parser, "rapidfuzz_process", backend):
+                parser = CommandParser()
+                results = [(r["action"], r["target"], r["confidence"]) for r in parser.parse_many(commands)]
+                self.assertEqual(results, expected)
+
+    def test_typed_slots(self):
+        volume, resolution, move = Mock(), Mock(), Mock()
+        self.parser.register_command("change_volume", volume)
+        self.parser.register_command("change_resolution", resolution)
+        self.parser.register_command("move", move)
+        self.parser.parse("change volume to thirty")
+        self.parser.parse("set resolution 1920x1080")
+        self.parser.parse("move notes.txt to documents")
+        volume.assert_called_once_with(30)
+        resolution.assert_called_once_with((1920, 1080))
+        move.assert_called_once_with(("notes.txt", "documents"))
+
+    def test_invalid_slot_skips_handler(self):
+        handler = Mock()
+        self.parser.register_command("change_volume", handler)
+        self.assertEqual(self.parser.resolve("change volume loud")[:2], ("change_volume", None))
+        self.parser.parse("change volume loud")
+        handler.assert_not_called()
+
+    def test_dispatch_refuses_without_calling_a_handler(self):
+        handler = Mock()
+        self.parser.register_command("change_volume", handler)
+        refused = [Intent(None, utterance="what a lovely day"),
+                   Intent("open", {"target": "chrome"}),
+                   Intent("change_volume", {"target": None}, utterance="change volume loud")]
+        for intent in refused:
+            with self.assertRaises(ValueError):
+                self.parser.dispatch(intent)
+        handler.assert_not_called()
+
+    def test_custom_slot_extractor(self):
+        handler = Mock()
+        self.parser.register_command("open", handler, slot=str.upper)
+        self.parser.parse("open chrome")
+        handler.assert_called_once_with("CHROME")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import sys
+import os
+import unittest
+from unittest.mock import Mock, patch
+
+# Add the Asvatha root directory to the system path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
+
+from Core.VoiceRecognition.command_parser import CommandParser
+from Core.VoiceRecognition.intent_resolver import IntentResolver
+
+
+class TestIntentResolver(unittest.TestCase):
+    def setUp(self):
+        self.nlp_tier = Mock(return_value=(None, None))
+        self.resolver = IntentResolver(CommandParser(), nlp_tier=self.nlp_tier)
+
+    def assertIntent(self, intent, action, target, tier):
+        self.assertEqual((intent.action, intent.target, intent.tier), (action, target, tier))
+
+    def test_confident_keyword_match_skips_nlp(self):
+        intent = self.resolver.resolve("open chrome")
+        self.assertIntent(intent, "open", "chrome", "keyword")
+        self.assertEqual(intent.confidence, 100)
+        self.assertEqual(list(intent.timings), ["keyword"])
+        self.nlp_tier.assert_not_called()
+
+    def test_low_confidence_falls_back_to_nlp(self):
+        self.nlp_tier.return_value = ("launch", "chrome")
+        intent = self.resolver.resolve("lunch chrome")
+        self.assertIntent(intent, "open", "chrome", "nlp")
+        self.assertEqual(sorted(intent.timings), ["keyword", "nlp"])
+        self.nlp_tier.assert_called_once_with("lunch chrome")
+
+    def test_nlp_intent_does_not_inherit_keyword_guess(self):
+        # The keyword tier guessed open/chrome at 83; spaCy's different action must not take that target or score
+        self.nlp_tier.return_value = ("close", None)
+        intent = self.resolver.resolve("lunch chrome")
+        self.assertIntent(intent, "close", None, "nlp")
+        self.assertEqual(intent.confidence, 100)
+
+    def test_low_confidence_keyword_dropped_when_nlp_fails(self):
+        handler = Mock()
+        self.resolver.parser.register_command("open", handler)
+        intent = self.resolver.resolve("lunch chrome")
+        self.assertIntent(intent, None, None, None)
+        self.assertEqual(intent.confidence, 83)  # The keyword guess, kept for diagnostics only
+        with self.assertRaises(ValueError):
+            self.resolver.parser.dispatch(intent)
+        handler.assert_not_called()
+
+    def test_unrecognized(self):
+        intent = self.resolver.resolve("sing me a song")
+        self.assertFalse(intent)
+        self.assertIsNone(intent.tier)
+
+    def test_exit(self):
+        self.assertEqual(self.resolver.resolve("Exit").action, "exit")
+        self.nlp_tier.assert_not_called()
+
+    def test_dispatch_uses_resolved_intent(self):
+        handler = Mock(return_value="opened")
+        self.resolver.parser.register_command("open", handler)
+        intent = self.resolver.resolve("open chrome")
+        with patch.object(self.resolver.parser, "resolve") as resolve:
+            self.assertEqual(self.resolver.parser.dispatch(intent), "opened")
+            resolve.assert_not_called()
+        handler.assert_called_once_with("chrome")
+
+    def test_hit_rates(self):
+        self.resolver.resolve("open chrome")
+        self.resolver.resolve("take screenshot")
+        self.resolver.resolve("lunch chrome")
+        self.resolver.resolve("sing me a song")
+        rates = self.resolver.hit_rates()
+        self.assertEqual(rates["keyword"], 0.5)
+        self.assertEqual(rates["nlp"], 0.0)
+        self.assertEqual(rates["nlp_avoided"], 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
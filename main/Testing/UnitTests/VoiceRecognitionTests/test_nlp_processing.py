@@ -0,0 +1,65 @@
+import sys
+import os
+import importlib
+import unittest
+from unittest.mock import MagicMock, patch
+
+# Add the Asvatha root directory to the system path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
+
+from Core.VoiceRecognition import nlp_processing
+
+try:
+    import spacy
+except ImportError:
+    spacy = None
+
+
+class TestLazyModelLoading(unittest.TestCase):
+    def setUp(self):
+        nlp_processing._nlp = None
+        self.spacy = MagicMock()
+
+    def tearDown(self):
+        nlp_processing._nlp = None
+
+    def test_import_does_not_load_model(self):
+        # Re-run the module's import-time code with a spaCy stand-in that records any load
+        with patch.dict(sys.modules, {"spacy": self.spacy}):
+            importlib.reload(nlp_processing)
+        self.spacy.load.assert_not_called()
+        self.assertIsNone(nlp_processing._nlp)
+
+    def test_model_loaded_once_without_parser(self):
+        with patch.dict(sys.modules, {"spacy": self.spacy}):
+            first = nlp_processing.get_nlp()
+            second = nlp_processing.get_nlp()
+        self.assertIs(first, second)
+        self.spacy.load.assert_called_once_with("en_core_web_sm", exclude=["parser", "senter"])
+        self.assertIsNotNone(nlp_processing.load_seconds)
+
+    def test_background_warm_up(self):
+        with patch.dict(sys.modules, {"spacy": self.spacy}):
+            nlp_processing.warm_up(background=True).join()
+        self.assertIs(nlp_processing._nlp, self.spacy.load.return_value)
+
+
+@unittest.skipUnless(spacy, "spaCy is not installed")
+class TestBatchProcessing(unittest.TestCase):
+    def setUp(self):
+        # A blank pipeline is enough to check batching; it needs no downloaded model
+        nlp_processing._nlp = spacy.blank("en")
+
+    def tearDown(self):
+        nlp_processing._nlp = None
+
+    def test_batches_match_single_calls_in_order(self):
+        commands = ["shut down chrome", "exit", "turn off the pc", "hello"] * 10
+        expected = [nlp_processing.process_command(command) for command in commands]
+        results = nlp_processing.process_commands(iter(commands), batch_size=3)
+        self.assertEqual(list(results), expected)
+        self.assertEqual(expected[:2], [("close", None), ("exit", None)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import sys
+import os
+import tempfile
+import unittest
+import numpy as np
+
+# Add the Asvatha root directory to the system path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
+
+from Core.VoiceRecognition.profile_store import VoiceProfileStore
+from Core.VoiceRecognition.speaker_embedding import EMBEDDING_SIZE
+
+
+def random_embeddings(count, seed=0):
+    vectors = np.random.default_rng(seed).normal(size=(count, EMBEDDING_SIZE)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+class TestVoiceProfileStore(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.embeddings = random_embeddings(40)
+
+    def test_identify_among_many_users(self):
+        store = VoiceProfileStore(self.directory.name, initial_capacity=4)  # Grows several times
+        for i, embedding in enumerate(self.embeddings):
+            store.enroll(f"user{i}", embedding)
+        self.assertEqual(len(store), 40)
+        self.assertEqual(store.identify(self.embeddings[17])[0], "user17")
+        self.assertEqual(store.identify(-self.embeddings[17])[0], None)
+
+    def test_persists_across_instances(self):
+        store = VoiceProfileStore(self.directory.name)
+        store.enroll("alice", self.embeddings[0])
+        store.enroll("bob", self.embeddings[1])
+        reopened = VoiceProfileStore(self.directory.name)
+        self.assertEqual(sorted(reopened.users()), ["alice", "bob"])
+        self.assertEqual(reopened.identify(self.embeddings[1])[0], "bob")
+        np.testing.assert_allclose(reopened.get("alice"), self.embeddings[0])
+
+    def test_remove_reuses_the_row(self):
+        store = VoiceProfileStore(self.directory.name)
+        store.enroll("alice", self.embeddings[0])
+        store.enroll("bob", self.embeddings[1])
+        self.assertTrue(store.remove("alice"))
+        self.assertFalse(store.remove("alice"))
+        self.assertIsNone(store.identify(self.embeddings[0])[0])
+        store.enroll("carol", self.embeddings[2])
+        self.assertEqual(store.rows["carol"], 0)  # Alice's old row
+        self.assertEqual(store.used, 2)
+
+    def test_reenroll_replaces_embedding(self):
+        store = VoiceProfileStore(self.directory.name)
+        store.enroll("alice", self.embeddings[0])
+        store.enroll("alice", self.embeddings[1])
+        self.assertEqual(len(store), 1)
+        self.assertEqual(store.identify(self.embeddings[1])[0], "alice")
+
+
+if __name__ == "__main__":
+    unittest.main()
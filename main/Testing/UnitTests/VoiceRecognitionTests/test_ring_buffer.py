@@ -0,0 +1,51 @@
+import sys
+import os
+import threading
+import unittest
+import numpy as np
+
+# Add the Asvatha root directory to the system path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
+
+from Core.VoiceRecognition.ring_buffer import AudioRingBuffer
+
+
+class TestAudioRingBuffer(unittest.TestCase):
+    def setUp(self):
+        self.ring = AudioRingBuffer(8)
+
+    def test_contiguous_read_is_a_view(self):
+        reader = self.ring.reader()
+        self.ring.write(np.arange(5, dtype=np.int16))
+        samples = reader.read(3)
+        self.assertTrue(np.shares_memory(samples, self.ring.buffer))
+        np.testing.assert_array_equal(samples, [0, 1, 2])
+        np.testing.assert_array_equal(reader.read(2), [3, 4])
+
+    def test_wrapped_read(self):
+        self.ring.write(np.arange(6, dtype=np.int16))
+        reader = self.ring.reader()
+        self.ring.write(np.arange(6, 10, dtype=np.int16))
+        self.assertEqual(len(self.ring.views(6, 4)), 2)
+        np.testing.assert_array_equal(reader.read(4), [6, 7, 8, 9])
+
+    def test_independent_readers(self):
+        first, second = self.ring.reader(), self.ring.reader()
+        self.ring.write(np.arange(4, dtype=np.int16))
+        np.testing.assert_array_equal(first.read(4), second.read(4))
+
+    def test_overrun_skips_to_oldest(self):
+        reader = self.ring.reader()
+        self.ring.write(np.arange(12, dtype=np.int16))
+        np.testing.assert_array_equal(reader.read(4), [4, 5, 6, 7])
+
+    def test_read_waits_for_writer(self):
+        reader = self.ring.reader()
+        writer = threading.Timer(0.05, self.ring.write, args=(np.ones(4, dtype=np.int16),))
+        writer.start()
+        np.testing.assert_array_equal(reader.read(4, timeout=2), [1, 1, 1, 1])
+        self.assertIsNone(reader.read(1, timeout=0.01))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+import sys
+import os
+import unittest
+
+# Add the Asvatha root directory to the system path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
+
+from Core.VoiceRecognition import slot_extractors
+
+
+class TestSlotExtractors(unittest.TestCase):
+    def test_spoken_numbers(self):
+        self.assertEqual(slot_extractors.spoken_number("thirty"), 30)
+        self.assertEqual(slot_extractors.spoken_number("to thirty-five please"), 35)
+        self.assertEqual(slot_extractors.spoken_number("a hundred"), 100)
+        self.assertIsNone(slot_extractors.spoken_number("loud"))
+
+    def test_percent(self):
+        self.assertEqual(slot_extractors.percent("to 30%"), 30)
+        self.assertEqual(slot_extractors.percent("seventy percent"), 70)
+        self.assertIsNone(slot_extractors.percent("150"))
+        self.assertIsNone(slot_extractors.percent("loud"))
+
+    def test_resolution(self):
+        self.assertEqual(slot_extractors.resolution("1920x1080"), (1920, 1080))
+        self.assertEqual(slot_extractors.resolution("to 1280 by 720"), (1280, 720))
+        self.assertIsNone(slot_extractors.resolution("hd"))
+
+    def test_url_path_and_pair(self):
+        self.assertEqual(slot_extractors.url("file https://example.com/a.pdf"), "https://example.com/a.pdf")
+        self.assertEqual(slot_extractors.path(' "c:\\temp\\a.txt" '), "c:\\temp\\a.txt")
+        self.assertEqual(slot_extractors.pair("report.pdf to documents"), ("report.pdf", "documents"))
+        self.assertIsNone(slot_extractors.pair("report.pdf"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import sys
+import os
+import io
+import unittest
+import numpy as np
+
+# Add the Asvatha root directory to the system path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
+
+from Core.VoiceRecognition.speaker_embedding import (EMBEDDING_SIZE, N_MFCC, IncrementalEmbedding, StreamingVerifier,
+                                                     mfcc, similarity, speaker_embedding)
+from Testing.UnitTests.VoiceRecognitionTests.audio_fixtures import RATE, voice
+
+
+class TestSpeakerEmbedding(unittest.TestCase):
+    def test_mfcc_shape(self):
+        self.assertEqual(mfcc(voice(120, [700, 1200]), RATE).shape, (198, N_MFCC))
+        self.assertEqual(len(mfcc(np.zeros(100, dtype=np.int16))), 0)
+
+    def test_embedding_is_small_and_normalized(self):
+        embedding = speaker_embedding(voice(120, [700, 1200, 2600]))
+        self.assertEqual(embedding.shape, (EMBEDDING_SIZE,))
+        self.assertAlmostEqual(float(np.linalg.norm(embedding)), 1.0, places=5)
+        profile = io.BytesIO()
+        np.save(profile, embedding)
+        self.assertLess(len(profile.getvalue()), 4096)
+
+    def test_same_voice_scores_higher_than_a_different_voice(self):
+        enrolled = speaker_embedding(voice(120, [700, 1200, 2600]))
+        # Different phases and a misaligned start do not matter, unlike a waveform comparison
+        same = speaker_embedding(voice(120, [700, 1200, 2600], seconds=1.5, seed=1)[3000:])
+        other = speaker_embedding(voice(220, [400, 2000, 2900]))
+        self.assertGreater(similarity(enrolled, same), 0.95)
+        self.assertLess(similarity(enrolled, other), 0.85)
+
+    def test_too_short(self):
+        self.assertIsNone(speaker_embedding(voice(120, [700], seconds=0.05)))
+
+
+
+class TestStreamingVerification(unittest.TestCase):
+    def setUp(self):
+        self.enrolled = speaker_embedding(voice(120, [700, 1200, 2600]))
+
+    def identify(self, embedding):
+        score = similarity(self.enrolled, embedding)
+        return ("alice" if score >= 0.85 else None), score
+
+    def stream(self, verifier, samples, chunk=1024):
+        for start in range(0, len(samples), chunk):
+            if verifier.feed(samples[start:start + chunk]) is not None:
+                break
+        return verifier.finish()
+
+    def test_incremental_matches_batch(self):
+        samples = voice(150, [500, 1500], seconds=1.3, seed=3)
+        for chunk in (7, 160, 1024, 5000):
+            features = IncrementalEmbedding()
+            for start in range(0, len(samples), chunk):
+                features.add(samples[start:start + chunk])
+            np.testing.assert_allclose(features.embedding(), speaker_embedding(samples), atol=1e-5)
+
+    def test_accepts_enrolled_speaker_early(self):
+        verifier = StreamingVerifier(self.identify, min_seconds=0.8, max_seconds=5)
+        self.assertTrue(self.stream(verifier, voice(120, [700, 1200, 2600], seconds=5, seed=1)))
+        self.assertEqual(verifier.user_id, "alice")
+        self.assertLess(verifier.seconds, 1.0)
+
+    def test_rejects_other_speaker_early(self):
+        verifier = StreamingVerifier(self.identify, min_seconds=0.8, max_seconds=5)
+        self.assertFalse(self.stream(verifier, voice(220, [400, 2000, 2900], seconds=5)))
+        self.assertLess(verifier.seconds, 1.0)
+
+    def test_undecided_until_max_duration(self):
+        # With an unreachable margin only the maximum duration can end verification
+        verifier = StreamingVerifier(self.identify, margin=10, min_seconds=0.5, max_seconds=2)
+        self.assertTrue(self.stream(verifier, voice(120, [700, 1200, 2600], seconds=5, seed=1)))
+        self.assertAlmostEqual(verifier.seconds, 2.0, delta=0.1)
+
+    def test_timeout_does_not_accept_an_unidentified_speaker(self):
+        # A high score without a matching user (e.g. the store found no one) must not pass
+        verifier = StreamingVerifier(lambda embedding: (None, 0.95), margin=10, min_seconds=0.5, max_seconds=2)
+        self.assertFalse(self.stream(verifier, voice(120, [700, 1200, 2600], seconds=5, seed=1)))
+        self.assertAlmostEqual(verifier.seconds, 2.0, delta=0.1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import sys
+import os
+import tempfile
+import unittest
+import numpy as np
+
+# Add the Asvatha root directory to the system path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
+
+from Core.VoiceRecognition.command_parser import CommandParser
+from Core.VoiceRecognition.intent_resolver import IntentResolver
+from Core.VoiceRecognition.ring_buffer import AudioRingBuffer
+from Core.VoiceRecognition.stt_backends import get_backend, recognize_utterance, transcribe_wav
+from Core.VoiceRecognition.vad import VoiceActivityDetector
+from Testing.UnitTests.VoiceRecognitionTests.audio_fixtures import RATE, ScriptedBackend, silence, tone, write_wav
+
+
+class TestSpeechToTextBackends(unittest.TestCase):
+    def test_transcribe_wav_reports_partials(self):
+        partials = []
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "open_chrome.wav")
+            write_wav(path, np.concatenate([tone(1.0), silence(0.5)]))
+            text = transcribe_wav(path, ScriptedBackend("open chrome please"), on_partial=partials.append)
+        self.assertEqual(text, "open chrome please")
+        self.assertEqual(partials[-1], "open chrome please")
+        self.assertIn("open", partials)
+
+    def test_recognize_utterance_streams_from_onset(self):
+        ring = AudioRingBuffer(RATE * 5)
+        reader = ring.reader()
+        ring.write(np.concatenate([silence(1.0), tone(1.2), silence(0.6)]))
+        backend = ScriptedBackend("open chrome")
+        partials = []
+        text = recognize_utterance(reader, VoiceActivityDetector(RATE), backend, on_partial=partials.append)
+        self.assertEqual(text, "open chrome")
+        self.assertEqual(partials, ["open", "open chrome"])  # Each new hypothesis reported once
+        # Only the utterance (plus padding and trailing silence) reached the backend, not the leading silence
+        self.assertLess(backend.received, RATE * 2)
+
+    def test_recognize_utterance_timeout(self):
+        ring = AudioRingBuffer(RATE * 5)
+        reader = ring.reader()
+        ring.write(silence(2.0))
+        self.assertIsNone(recognize_utterance(reader, VoiceActivityDetector(RATE), ScriptedBackend("x"),
+                                              timeout=1))
+
+    def test_partials_prefetch_the_intent(self):
+        resolver = IntentResolver(CommandParser(), nlp_tier=lambda command: (None, None))
+        for partial in ["open", "open chrome"]:
+            resolver.prefetch(partial)
+        resolver.resolve("open chrome")
+        self.assertEqual(resolver.parser.cache_info().hits, 1)
+        self.assertEqual(resolver.counters["keyword"]["calls"], 1)
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            get_backend("carrier-pigeon")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import sys
+import os
+import tempfile
+import unittest
+import numpy as np
+
+# Add the Asvatha root directory to the system path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
+
+from Core.VoiceRecognition.ring_buffer import AudioRingBuffer
+from Core.VoiceRecognition.vad import (NoiseFloorTracker, VoiceActivityDetector, capture_utterance,
+                                       frame_features, read_wav, segments_from_wav, trim_silence)
+from Testing.UnitTests.VoiceRecognitionTests.audio_fixtures import RATE, silence, tone, write_wav
+
+
+class TestVoiceActivityDetector(unittest.TestCase):
+    def test_segments_from_wav(self):
+        samples = np.concatenate([silence(0.5), tone(1.0), silence(1.0), tone(0.6), silence(0.2)])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "two_commands.wav")
+            write_wav(path, samples)
+            self.assertEqual(len(read_wav(path)[0]), len(samples))
+            segments = segments_from_wav(path)
+        self.assertEqual(len(segments), 2)
+        # Each utterance keeps at most the padding of silence on either side
+        self.assertAlmostEqual(len(segments[0]) / RATE, 1.3, delta=0.1)
+        self.assertAlmostEqual(len(segments[1]) / RATE, 0.8, delta=0.15)
+
+    def test_emits_as_soon_as_trailing_silence_is_seen(self):
+        vad = VoiceActivityDetector(RATE, trailing_silence_ms=300)
+        self.assertEqual(vad.feed(tone(1.0)), [])
+        self.assertTrue(vad.in_speech)
+        self.assertEqual(len(vad.feed(silence(0.35))), 1)
+
+    def test_short_clicks_are_ignored(self):
+        vad = VoiceActivityDetector(RATE)
+        self.assertEqual(vad.feed(np.concatenate([tone(0.03), silence(1.0)])), [])
+        self.assertIsNone(vad.flush())
+
+    def test_trim_silence(self):
+        trimmed = trim_silence(np.concatenate([silence(2.0), tone(0.5), silence(2.0)]), RATE)
+        self.assertAlmostEqual(len(trimmed) / RATE, 0.8, delta=0.1)
+        self.assertEqual(len(trim_silence(silence(1.0), RATE)), 0)
+
+    def test_capture_utterance_from_reader(self):
+        ring = AudioRingBuffer(RATE * 5)
+        reader = ring.reader()
+        ring.write(np.concatenate([silence(0.3), tone(0.5), silence(0.6)]))
+        segment = capture_utterance(reader, VoiceActivityDetector(RATE))
+        self.assertAlmostEqual(len(segment) / RATE, 0.8, delta=0.1)
+
+    def test_capture_utterance_timeout(self):
+        ring = AudioRingBuffer(RATE * 5)
+        reader = ring.reader()
+        ring.write(silence(1.5))
+        self.assertIsNone(capture_utterance(reader, VoiceActivityDetector(RATE), timeout=1))
+
+
+
+class TestNoiseFloorTracker(unittest.TestCase):
+    def test_calibrate_once(self):
+        tracker = NoiseFloorTracker(margin=3.0, min_threshold=10)
+        threshold = tracker.calibrate(silence(1.0, amplitude=100), 480)
+        self.assertAlmostEqual(threshold, tracker.floor * 3.0)
+        self.assertAlmostEqual(tracker.floor, 100 / np.sqrt(3), delta=5)  # RMS of uniform noise
+
+    def test_small_fluctuations_keep_the_threshold(self):
+        tracker = NoiseFloorTracker(min_threshold=10)
+        threshold = tracker.calibrate(silence(1.0, amplitude=100), 480)
+        energy = frame_features(silence(3.0, amplitude=120), 480)[0]
+        self.assertEqual(tracker.update(energy, np.zeros(len(energy), dtype=bool)), threshold)
+        self.assertEqual(tracker.recalibrations, 0)
+        self.assertGreater(tracker.floor, tracker.reference)  # Still tracked, just not applied
+
+    def test_vad_follows_louder_room(self):
+        tracker = NoiseFloorTracker()
+        vad = VoiceActivityDetector(RATE, noise_tracker=tracker)
+        tracker.calibrate(silence(1.0, amplitude=50), vad.frame_length)
+        self.assertEqual(vad.feed(silence(4.0, amplitude=250)), [])
+        self.assertEqual(tracker.recalibrations, 1)
+        self.assertGreater(vad.energy_threshold, 300)
+        # Speech is still heard over the new floor
+        self.assertEqual(len(vad.feed(np.concatenate([tone(0.6), silence(0.6, amplitude=250)]))), 1)
+
+    def test_recovers_when_noise_rises_above_threshold(self):
+        tracker = NoiseFloorTracker(stale_frames=100)
+        tracker.calibrate(silence(1.0, amplitude=50), 480)
+        loud = frame_features(silence(4.0, amplitude=1000), 480)[0]
+        tracker.update(loud, np.ones(len(loud), dtype=bool))  # Every frame looks like speech
+        self.assertEqual(tracker.recalibrations, 1)
+        self.assertGreater(tracker.threshold, loud.mean())
+
+
+if __name__ == "__main__":
+    unittest.main()
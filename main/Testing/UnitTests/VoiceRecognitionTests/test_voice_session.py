@@ -0,0 +1,73 @@
+import sys
+import os
+import unittest
+import numpy as np
+
+# Add the Asvatha root directory to the system path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
+
+from Core.VoiceRecognition.ring_buffer import AudioRingBuffer
+from Core.VoiceRecognition.stt_backends import recognize_utterance
+from Core.VoiceRecognition.vad import VoiceActivityDetector
+from Core.VoiceRecognition.voice_session import VoiceSession
+from Testing.UnitTests.VoiceRecognitionTests.audio_fixtures import RATE, ScriptedBackend, silence, tone
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestVoiceSession(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.calls = []
+        self.accept = True
+
+        def verifier(samples):
+            self.calls.append(len(samples))
+            return self.accept, 0.9 if self.accept else 0.1
+
+        self.session = VoiceSession(ttl=60, verifier=verifier, clock=self.clock)
+
+    def test_verified_session_skips_reverification(self):
+        self.assertTrue(self.session.verify(tone(1.0)).result())
+        self.clock.now = 30
+        self.assertTrue(self.session.verify(tone(1.0)).result())
+        self.assertEqual(len(self.calls), 1)
+
+    def test_session_expires_after_ttl(self):
+        self.session.verify(tone(1.0)).result()
+        self.clock.now = 61
+        self.assertFalse(self.session.active)
+        self.session.verify(tone(1.0)).result()
+        self.assertEqual(len(self.calls), 2)
+
+    def test_rejected_speaker_does_not_open_a_session(self):
+        self.accept = False
+        self.assertFalse(self.session.verify(tone(1.0)).result())
+        self.assertFalse(self.session.active)
+
+    def test_end(self):
+        self.session.verify(tone(1.0)).result()
+        self.session.end()
+        self.assertFalse(self.session.active)
+
+    def test_verifies_the_command_segment(self):
+        ring = AudioRingBuffer(RATE * 5)
+        reader = ring.reader()
+        ring.write(np.concatenate([silence(1.0), tone(1.0), silence(0.6)]))
+        futures = []
+        text = recognize_utterance(reader, VoiceActivityDetector(RATE), ScriptedBackend("open chrome"),
+                                   on_segment=lambda segment: futures.append(self.session.verify(segment)))
+        self.assertEqual(text, "open chrome")
+        self.assertTrue(futures[0].result())
+        # The verifier saw the trimmed utterance, not a separate recording
+        self.assertAlmostEqual(self.calls[0] / RATE, 1.3, delta=0.15)
+
+
+if __name__ == "__main__":
+    unittest.main()
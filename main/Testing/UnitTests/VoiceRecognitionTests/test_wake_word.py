@@ -0,0 +1,70 @@
+import sys
+import os
+import tempfile
+import unittest
+import numpy as np
+
+# Add the Asvatha root directory to the system path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
+
+from Core.VoiceRecognition.wake_word import WakeWordSpotter, subsequence_dtw, wake_word_features
+from Testing.UnitTests.VoiceRecognitionTests.audio_fixtures import OTHER_WORD, RATE, WAKE_WORD, word, write_wav
+
+
+def trained_spotter():
+    spotter = WakeWordSpotter()
+    for seed, stretch in [(0, 1.0), (10, 0.9), (20, 1.15)]:
+        spotter.add_example(word(WAKE_WORD, seed, stretch))
+    spotter.threshold = spotter.calibrated_threshold()
+    return spotter
+
+
+class TestWakeWordSpotter(unittest.TestCase):
+    def setUp(self):
+        self.spotter = trained_spotter()
+
+    def test_dtw_of_identical_sequences_is_zero(self):
+        features = wake_word_features(word(WAKE_WORD))
+        self.assertAlmostEqual(subsequence_dtw(features, features)[0], 0.0, places=4)
+        self.assertEqual(subsequence_dtw(features, features)[1], len(features) - 1)
+
+    def test_detects_wake_word_at_a_different_speed(self):
+        self.assertIsNotNone(self.spotter.detect(word(WAKE_WORD, seed=99, stretch=1.05)))
+
+    def test_ignores_other_words(self):
+        self.assertIsNone(self.spotter.detect(word(OTHER_WORD, seed=7)))
+
+    def test_reports_where_the_command_starts(self):
+        wake_word = word(WAKE_WORD, seed=99)
+        end = self.spotter.detect(np.concatenate([wake_word, word(OTHER_WORD, seed=5)]))
+        self.assertAlmostEqual(end / RATE, len(wake_word) / RATE, delta=0.06)
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "wake_word.npz")
+            self.spotter.save(path)
+            loaded = WakeWordSpotter.load(path)
+        self.assertEqual(len(loaded.templates), 3)
+        self.assertAlmostEqual(loaded.threshold, self.spotter.threshold)
+        self.assertFalse(WakeWordSpotter.load(os.path.join(directory, "missing.npz")))
+
+    def test_one_example_cannot_be_calibrated(self):
+        spotter = WakeWordSpotter()
+        spotter.add_example(word(WAKE_WORD))
+        with self.assertRaisesRegex(ValueError, "at least two"):
+            spotter.calibrated_threshold()
+
+    def test_spotter_without_threshold_is_not_saved(self):
+        with tempfile.TemporaryDirectory() as directory:
+            recording = os.path.join(directory, "wake_word.wav")
+            write_wav(recording, word(WAKE_WORD))
+            spotter = WakeWordSpotter.from_wavs([recording])
+            self.assertIsNone(spotter.threshold)
+            path = os.path.join(directory, "wake_word.npz")
+            with self.assertRaisesRegex(ValueError, "threshold not set"):
+                spotter.save(path)
+            self.assertFalse(os.path.exists(path))
+
+
+if __name__ == "__main__":
+    unittest.main()